@@ -1,9 +1,7 @@
 import enum
-import time
-import sys
-import traceback
-from PyQt5.QtCore import QSize, Qt, QTimer, pyqtSignal, QRunnable, pyqtSlot, QObject, QThreadPool
-from PyQt5.QtGui import QPalette, QColor, QIcon, QKeySequence
+import logging
+from PyQt5.QtCore import QSize, Qt, QTimer
+from PyQt5.QtGui import QPalette, QColor, QKeySequence
 from PyQt5.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -36,9 +34,20 @@ from PyQt5.QtWidgets import (
     QDialog,
     QDialogButtonBox,
     QMessageBox,
-    QTextEdit,
-    QScrollArea,
 )
+from task_engine import TaskEngine, Worker
+from progress_coalescer import ProgressCoalescer
+from telemetry_panel import TelemetryPanel  # imports pyqtgraph only when the telemetry tab is first shown
+from lazy_widgets import LazyWidget, lazy_menu
+import icon_cache
+from frame_scheduler import FrameScheduler
+from signal_adapters import Debounce, throttle
+from task_metrics import TaskMetricsPanel
+from log_console import LogConsole
+from log_pipeline import add_handler, remove_handler
+from result_cache import ResultCache
+
+log = logging.getLogger(__name__)
 
 
 class Power(enum.Enum):
@@ -106,77 +115,13 @@ class CustomDialog(QDialog):
         self.done(button)
 
 
-class WorkerSignals(QObject):
-    """
-    Defines the signals available from a running worker thread.
-
-    Supported signals are:
-
-    finished
-        No data
-
-    error
-        tuple (exctype, value, traceback.format_exc() )
-
-    result
-        object data returned from processing, anything
-
-    progress
-        int indicating % progress
-
-    """
-    finished = pyqtSignal()
-    error = pyqtSignal(tuple)
-    result = pyqtSignal(object)
-    progress = pyqtSignal(int)
-
-
-class Worker(QRunnable):
-    """
-    Worker thread
-
-    Inherits from QRunnable to handler worker thread setup, signals and wrap-up.
-
-    :param callback: The function callback to run on this worker thread. Supplied args and
-                     kwargs will be passed through to the runner.
-    :type callback: function
-    :param args: Arguments to pass to the callback function
-    :param kwargs: Keywords to pass to the callback function
-    """
-    def __init__(self, fn, *args, **kwargs):
-        super(Worker, self).__init__()
-
-        # Store constructor arguments (re-used for processing)
-        self.fn = fn
-        self.args = args
-        self.kwargs = kwargs
-        self.signals = WorkerSignals()
-
-        # Add the callback to our kwargs
-        self.kwargs['progress_callback'] = self.signals.progress
-
-    @pyqtSlot()
-    def run(self):
-        """
-        Initialise the runner function with passed args, kwargs.
-        """
-
-        # Retrieve args/kwargs here; and fire processing using them
-        try:
-            result = self.fn(*self.args, **self.kwargs)
-        except:
-            traceback.print_exc()
-            exctype, value = sys.exc_info()[:2]
-            self.signals.error.emit((exctype, value, traceback.format_exc()))
-        else:
-            self.signals.result.emit(result)  # Return the result of the processing
-        finally:
-            self.signals.finished.emit()  # Done
-
-
 # Subclass QMainWindow to customize your application's main window
 class MainWindow(QMainWindow):
-    def __init__(self, *args, **kwargs):
+    """
+    :param lazy: build hidden tabs, the log console and the File menu on first use (the console right after
+                 the first paint) instead of before the window is shown
+    """
+    def __init__(self, *args, lazy: bool = True, **kwargs):
         super(MainWindow, self).__init__(*args, **kwargs)
         # self.show()
 
@@ -186,8 +131,9 @@ class MainWindow(QMainWindow):
         main_layout = QVBoxLayout()
         btn_layout = QHBoxLayout()
         slider_layout = QHBoxLayout()
-        text_layout = QHBoxLayout()
-        text_layout_ex = QVBoxLayout()
+
+        # All widget updates go through one 30 fps tick instead of one repaint per timer/slider/worker event
+        self.frames = FrameScheduler(fps=30, parent=self)
 
         self.counter = 0.0
         self.timer = None
@@ -198,10 +144,14 @@ class MainWindow(QMainWindow):
         self.label = QLabel("Start")
         main_layout.addWidget(self.label)
 
-        self.threadpool = QThreadPool()
-        print("Multithreading with maximum %d threads" % self.threadpool.maxThreadCount())
+        self.engine = TaskEngine()
+        self.results = ResultCache(max_entries=64, ttl=300)  # clicking "demo" again answers from here
+        log.info("Multithreading with maximum %d threads", self.engine.max_threads)
+        self.progress = ProgressCoalescer(hz=30, parent=self)
+        self.progress.updated.connect(self.progress_batch)
 
         self.btn_dict = {}
+        self.report_buttons = Debounce(self.print_btn_dict, 300, parent=self)  # one report per burst of clicks
         btn = []
         """
         QAbstractButton provides four signals:
@@ -217,26 +167,13 @@ class MainWindow(QMainWindow):
             btn_layout.addWidget(btn[i])
         main_layout.addLayout(btn_layout)
 
-        textbox1 = QTextEdit()
-        textbox1.setMinimumHeight(100)
-        textbox2 = QTextEdit()
-        for i in range(22):
-            textbox1.append("-----------QTextEdit-----------{}".format(i))
-            textbox2.append("-----------QTextEdit2-----------{}".format(i))
-        text_layout_ex.addWidget(textbox1)
-        for i in range(11):
-            text_layout_ex.addWidget(QLabel("This is QLabel #{}".format(i)))
-        text_layout.addLayout(text_layout_ex)
-        text_layout.addWidget(textbox2)
-        text_widget = QWidget()
-        text_widget.setLayout(text_layout)
-        scroll = QScrollArea()
-        scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setWidgetResizable(True)
-        scroll.setMaximumHeight(200)
-        scroll.setWidget(text_widget)  # Do not use .setLayout(text_layout)
-        main_layout.addWidget(scroll)  # This way there will be 2 V-scrollbar
+        # The application log, in a model/view console (bounded ring buffer, bulk inserts, off-thread filter)
+        self.console = None
+        self.console_handler = None
+        text_widget = LazyWidget(self.build_console, defer=True)
+        text_widget.setMinimumHeight(100)
+        text_widget.setMaximumHeight(200)
+        main_layout.addWidget(text_widget)
 
         sli = []
         """
@@ -251,7 +188,9 @@ class MainWindow(QMainWindow):
             sli[i].setMinimum(0)
             sli[i].setMaximum(100)
             sli[i].setTickPosition(QSlider.NoTicks)
-            sli[i].valueChanged.connect(lambda s, num=i: self.slider_click(signal=s, sli_num=num))
+            # Every tick is recorded, but the (expensive) handler runs at most once per 100 ms while dragging
+            sli[i].valueChanged.connect(lambda s, num=i: self.telemetry.append("slider_{}".format(num), s))
+            throttle(sli[i].valueChanged, lambda s, num=i: self.slider_click(signal=s, sli_num=num), 100, parent=self)
             slider_layout.addWidget(sli[i])
         main_layout.addLayout(slider_layout)
 
@@ -259,8 +198,16 @@ class MainWindow(QMainWindow):
         tabs.setTabPosition(QTabWidget.North)
         tabs.setMovable(True)
         tabs.setMinimumHeight(100)
+        pages = [text_widget]
         for n, color in enumerate(["red", "green", "blue", "yellow"]):
-            tabs.addTab(Color(color), color)
+            pages.append(LazyWidget(lambda c=color: Color(c)))
+            tabs.addTab(pages[-1], color)
+        self.telemetry = TelemetryPanel(capacity=1_000_000, max_fps=20)
+        for name in ["counter"] + ["slider_{}".format(i) for i in range(len(sli))] + ["worker_progress"]:
+            self.telemetry.add_series(name)
+        tabs.addTab(self.telemetry, "telemetry")
+        pages.append(LazyWidget(lambda: TaskMetricsPanel([self.engine])))
+        tabs.addTab(pages[-1], "tasks")
         tabs.setCurrentIndex(1)
         main_layout.addWidget(tabs)
 
@@ -274,7 +221,7 @@ class MainWindow(QMainWindow):
         self.addToolBar(toolbar)
 
         # Some icons by Yusuke Kamiyamane. Licensed under a Creative Commons Attribution 3.0 License.
-        button_action = QAction(QIcon("abacus.png"), "&Your Button", self)
+        button_action = QAction(icon_cache.icon("abacus.png"), "&Your Button", self)
         button_action.setStatusTip("This is your button")
         button_action.triggered.connect(lambda s: self.tool_bar_click(signal=s))  # .triggered = .toggled
         button_action.setCheckable(True)
@@ -284,7 +231,7 @@ class MainWindow(QMainWindow):
         button_action.setShortcut(QKeySequence("Ctrl+p"))
         toolbar.addAction(button_action)
 
-        button_action2 = QAction(QIcon("acorn.png"), "Your &Button2", self)
+        button_action2 = QAction(icon_cache.icon("acorn.png"), "Your &Button2", self)
         button_action2.setStatusTip("This is your button2")
         button_action2.toggled.connect(self.tool_bar_click)
         button_action2.setCheckable(True)
@@ -292,7 +239,7 @@ class MainWindow(QMainWindow):
 
         toolbar.addSeparator()
 
-        button_action3 = QAction(QIcon("alarm-clock.png"), "Increase &Count", self)
+        button_action3 = QAction(icon_cache.icon("alarm-clock.png"), "Increase &Count", self)
         button_action3.setStatusTip("This is your button3")
         button_action3.triggered.connect(self.update_count)
         button_action3.setCheckable(False)
@@ -315,46 +262,77 @@ class MainWindow(QMainWindow):
 
         self.setStatusBar(QStatusBar(self))
 
+        def populate_file_menu(file_menu):
+            file_menu.addAction(button_action)
+            file_menu.addSeparator()
+            file_submenu = file_menu.addMenu("&Submenu")
+            file_submenu.addAction(button_action2)
+            file_menu.addSeparator()
+
         menu = self.menuBar()
         file_menu = menu.addMenu("&File")
-        file_menu.addAction(button_action)
-        file_menu.addSeparator()
-        file_submenu = file_menu.addMenu("&Submenu")
-        file_submenu.addAction(button_action2)
-        file_menu.addSeparator()
+        if lazy:
+            lazy_menu(file_menu, populate_file_menu)
+        else:
+            populate_file_menu(file_menu)
+            for page in pages:
+                page.ensure_built()
+            self.telemetry.ensure_plot()
+
+    def build_console(self) -> LogConsole:
+        self.console = LogConsole(capacity=1_000_000)
+        for i in range(22):
+            self.console.append("-----------LogConsole-----------{}".format(i))
+        self.console_handler = self.console.handler()
+        add_handler(self.console_handler)
+        return self.console
 
     def progress_fn(self, n):
-        print("%d%% done" % n)
+        log.info("%d%% done", n)
+
+    def progress_batch(self, batch: dict):
+        for n in batch.values():
+            self.telemetry.append("worker_progress", n)
+            self.progress_fn(n)
 
-    def execute_this_fn(self, progress_callback):
+    def execute_this_fn(self, progress_callback, cancel_token):
         for n in range(0, 5):
-            time.sleep(1)
+            cancel_token.sleep(1)
             progress_callback.emit(int(n * 100 / 4))
 
         return "Done."
 
     def print_output(self, s):
-        print("Result:", s)
+        log.info("Result: %s", s)
 
     def thread_complete(self):
-        print("THREAD COMPLETE!")
+        log.info("THREAD COMPLETE!")
 
     def oh_no(self):
         # Pass the function to execute
-        worker = Worker(self.execute_this_fn)  # Any other args, kwargs are passed to the run function
+        # Any other args, kwargs are passed to the run function
+        worker = Worker(self.execute_this_fn, progress_callback=self.progress.sink(), cache=self.results)
         worker.signals.result.connect(self.print_output)
         worker.signals.finished.connect(self.thread_complete)
-        worker.signals.progress.connect(self.progress_fn)
 
         # Execute
-        self.threadpool.start(worker)
+        self.engine.start(worker)
+
+    def closeEvent(self, event):
+        if self.console_handler is not None:
+            remove_handler(self.console_handler)  # the writer thread must not feed a deleted console
+            self.console_handler = None
+        self.timer.stop()
+        self.engine.shutdown()
+        super().closeEvent(event)
 
     def update_count(self):
         self.counter += 0.1
-        self.label.setText("Counter: {0:.1f}".format(self.counter))
+        self.frames.set_text(self.label, "Counter: {0:.1f}".format(self.counter))
+        self.telemetry.append("counter", self.counter)
 
     def tool_bar_click(self, signal):
-        print("tool_bar_click(): Checked signal =", type(signal), signal)
+        log.info("tool_bar_click(): Checked signal = %s %s", type(signal), signal)
     
     def button_click(self, signal: bool = None, btn_num: int = None, btn_name: str = None):
         power = Power.UNKNOWN
@@ -363,17 +341,20 @@ class MainWindow(QMainWindow):
         else:
             power = Power.OFF
         self.btn_dict["Power_" + str(btn_name)] = power
-        print("button_click(): Checked signal = {}, btn_num = {}, btn_name = '{}'".format(signal, btn_num, btn_name))
-        print("self.btn_dict =", type(self.btn_dict), self.btn_dict)
+        log.info("button_click(): Checked signal = %s, btn_num = %s, btn_name = '%s'", signal, btn_num, btn_name)
+        self.report_buttons()
         if btn_name == "demo":
             self.oh_no()
 
+    def print_btn_dict(self):
+        log.info("self.btn_dict = %s %s", type(self.btn_dict), self.btn_dict)
+
     def slider_click(self, signal: int = None, sli_num: int = None):
         """
         QSlider.valueChanged() & QSlider.sliderMoved() emit signal with QSlider.value()
         QSlider.sliderReleased() & QSlider.sliderPressed() emit signal without any data
         """
-        print("slider_click(): Checked signal = {}, sli_num = {}".format(signal, sli_num))
+        log.info("slider_click(): Checked signal = %s, sli_num = %s", signal, sli_num)
 
     def q_message_box_clicked(self, s):
         print("QMessageBox Checked:", s, end='; ')
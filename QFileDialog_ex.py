@@ -1,6 +1,32 @@
+import bisect
+import os
+import re
 import sys
 import traceback
-from PyQt5.QtWidgets import QApplication, QMainWindow, QTextEdit, QAction, QFileDialog
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QTextCursor, QTextCharFormat, QColor
+from PyQt5.QtWidgets import (
+    QApplication,
+    QMainWindow,
+    QPlainTextEdit,
+    QAction,
+    QFileDialog,
+    QInputDialog,
+    QProgressBar,
+    QPushButton,
+    QStackedWidget,
+    QStatusBar,
+    QTextEdit,
+)
+from task_engine import shared_engine, Worker
+from file_io import ChunkWindow, read_text_chunks, write_document_atomic
+from large_file_view import LargeFileView, build_line_index
+from file_tail import FileTailer
+from text_search import FindBar, compile_query, search_text, search_file, match_at, replace_all_text
+
+LARGE_FILE_THRESHOLD = 256 << 20  # "Read" opens bigger files in the read-only mmap viewer
+MAX_FOLLOW_LINES = 100000  # lines kept in the editor while following a file; older ones are dropped
+SEARCH_DEBOUNCE_MS = 250  # typing in the find bar restarts the search this long after the last key
 
 
 class MainWindow(QMainWindow):
@@ -10,8 +36,54 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Text Editor")
         self.setGeometry(100, 100, 800, 600)
 
-        self.text_edit = QTextEdit(self)
-        self.setCentralWidget(self.text_edit)
+        # QPlainTextEdit: plain-text layout is much cheaper than QTextEdit's rich text for large files
+        self.text_edit = QPlainTextEdit(self)
+        self.large_view = LargeFileView(self)
+        self.stack = QStackedWidget(self)
+        self.stack.addWidget(self.text_edit)
+        self.stack.addWidget(self.large_view)
+        self.setCentralWidget(self.stack)
+
+        self.engine = shared_engine()
+        self.load_handle = None
+        self.load_window = None
+        self.load_generation = 0  # signals still queued from a cancelled load carry an older generation
+        self.save_handle = None
+        self.save_snapshot = None
+        self.current_file = None
+        self.loaded_bytes = 0
+        self.tailer = None
+        self.search_handle = None
+        self.search_generation = 0
+        self.search_pattern = None
+        self.matches = []  # sorted (start, end): document positions, or byte offsets in the large-file view
+        self.match_index = -1
+
+        self.setStatusBar(QStatusBar(self))
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.hide()
+        self.statusBar().addPermanentWidget(self.progress_bar)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.cancel_load)
+        self.cancel_button.hide()
+        self.statusBar().addPermanentWidget(self.cancel_button)
+
+        self.find_bar = FindBar(self)
+        self.find_bar.hide()
+        self.addToolBar(Qt.BottomToolBarArea, self.find_bar)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.start_search)
+        self.find_bar.queryChanged.connect(self.search_timer.start)
+        self.find_bar.findNext.connect(lambda: self.find_match(forward=True))
+        self.find_bar.findPrevious.connect(lambda: self.find_match(forward=False))
+        self.find_bar.replaceOne.connect(self.replace_one)
+        self.find_bar.replaceAll.connect(self.replace_all)
+        self.text_edit.document().contentsChanged.connect(self.document_changed)
+        self.text_edit.verticalScrollBar().valueChanged.connect(self.highlight_visible_matches)
 
         self.create_menu()
 
@@ -29,6 +101,23 @@ class MainWindow(QMainWindow):
         read_action.setShortcut("Ctrl+O")
         read_action.triggered.connect(self.read_file)
         file_menu.addAction(read_action)
+        large_action = QAction("Open large file (read-only)", self)
+        large_action.triggered.connect(lambda: self.read_file(large=True))
+        file_menu.addAction(large_action)
+        file_menu.addSeparator()
+        goto_action = QAction("Go to line...", self)
+        goto_action.setShortcut("Ctrl+G")
+        goto_action.triggered.connect(self.goto_line)
+        file_menu.addAction(goto_action)
+        self.follow_action = QAction("Follow file (tail -f)", self)
+        self.follow_action.setCheckable(True)
+        self.follow_action.toggled.connect(self.follow_file)
+        file_menu.addAction(self.follow_action)
+        file_menu.addSeparator()
+        find_action = QAction("Find / Replace", self)
+        find_action.setShortcut("Ctrl+F")
+        find_action.triggered.connect(self.show_find_bar)
+        file_menu.addAction(find_action)
 
     def save_file(self):
         file_dialog = QFileDialog(self)
@@ -37,18 +126,353 @@ class MainWindow(QMainWindow):
 
         if file_dialog.exec_() == QFileDialog.Accepted:
             file_name = file_dialog.selectedFiles()[0]
-            with open(file_name, "w", encoding="utf-8-sig", errors='replace') as f:
-                f.write(self.text_edit.toPlainText())
+            self.save_to(file_name)
 
-    def read_file(self):
+    def save_to(self, file_name):
+        """
+        Save in the background: snapshot the document (`clone()`, a C++ copy made on the GUI thread, so typing
+        can go on), then a Worker writes it block by block to a temp file and atomically renames it into place.
+        """
+        if self.stack.currentWidget() is self.large_view:
+            self.statusBar().showMessage("The large-file view is read-only")
+            return
+        if self.load_handle is not None or self.save_handle is not None:
+            self.statusBar().showMessage("Busy, try again when the current load/save is done")
+            return
+        self.save_snapshot = self.text_edit.document().clone()
+        worker = Worker(write_document_atomic, file_name, self.save_snapshot)
+        worker.signals.progress.connect(lambda p: self.statusBar().showMessage(
+            "Saving {}... {}%".format(file_name, int(p[0] * 100 / max(1, p[1])))))
+        worker.signals.result.connect(lambda n: self.statusBar().showMessage("Saved {} ({} characters)".format(file_name, n)))
+        worker.signals.error.connect(lambda e: self.statusBar().showMessage("Save failed: {}".format(e[1])))
+        worker.signals.finished.connect(self.save_finished)
+        self.save_handle = self.engine.start(worker)
+
+    def save_finished(self):
+        self.save_handle = None
+        self.save_snapshot = None  # deleted here, on the thread it was created on
+
+    def read_file(self, large: bool = False):
         file_dialog = QFileDialog(self)
         file_dialog.setAcceptMode(QFileDialog.AcceptOpen)
         # file_dialog.setDefaultSuffix("txt")
 
         if file_dialog.exec_() == QFileDialog.Accepted:
             file_name = file_dialog.selectedFiles()[0]
-            with open(file_name, "r", encoding="utf-8-sig", errors='replace') as f:
-                self.text_edit.setText(f.read())
+            if large or os.path.getsize(file_name) > LARGE_FILE_THRESHOLD:
+                self.open_large_file(file_name)
+            else:
+                self.load_file(file_name)
+
+    def load_file(self, file_name):
+        """
+        Stream `file_name` into the editor: a worker reads and decodes 1 MiB chunks, the GUI thread appends
+        each chunk at the end of the document as it arrives.
+        """
+        self.cancel_load()
+        self.follow_action.setChecked(False)
+        self.large_view.close_file()
+        self.stack.setCurrentWidget(self.text_edit)
+        self.find_bar.set_read_only(False)
+        self.cancel_search()
+        self.text_edit.clear()
+        self.text_edit.setMaximumBlockCount(0)
+        self.current_file = None
+        self.text_edit.setReadOnly(True)
+        self.text_edit.document().setUndoRedoEnabled(False)  # an undo stack for a 500 MB insert is pure waste
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.cancel_button.show()
+        self.statusBar().showMessage("Loading {}...".format(file_name))
+
+        self.load_generation += 1
+        gen = self.load_generation
+        self.load_window = ChunkWindow(4)
+        worker = Worker(read_text_chunks, file_name, window=self.load_window)
+        worker.signals.progress.connect(lambda chunk: self.append_chunk(chunk, gen))
+        worker.signals.result.connect(lambda n: self.loaded(file_name, n, gen))
+        worker.signals.error.connect(lambda e: self.statusBar().showMessage("Error: {}".format(e[1])))
+        worker.signals.finished.connect(lambda: self.load_finished(gen))
+        self.load_handle = self.engine.start(worker)
+
+    def loaded(self, file_name, n_bytes: int, gen: int):
+        if gen != self.load_generation:
+            return
+        self.current_file = file_name
+        self.loaded_bytes = n_bytes
+        self.statusBar().showMessage("Loaded {} ({} bytes)".format(file_name, n_bytes))
+
+    def follow_file(self, checked: bool):
+        """ Follow mode: append whatever other processes write to the loaded file, reading only the delta. """
+        if self.tailer is not None:
+            self.tailer.stop()
+            self.tailer.deleteLater()
+            self.tailer = None
+        if not checked:
+            return
+        if self.current_file is None or self.stack.currentWidget() is not self.text_edit:
+            self.statusBar().showMessage("Follow mode needs a file loaded in the editor")
+            self.follow_action.setChecked(False)
+            return
+        self.text_edit.setMaximumBlockCount(MAX_FOLLOW_LINES)  # Qt drops the oldest blocks itself
+        self.tailer = FileTailer(self.current_file, offset=self.loaded_bytes, parent=self)
+        self.tailer.appended.connect(self.append_followed)
+        self.tailer.truncated.connect(lambda: self.statusBar().showMessage("File truncated, following from the start"))
+        self.tailer.start()
+        self.statusBar().showMessage("Following {}".format(self.current_file))
+
+    def append_followed(self, text):
+        bar = self.text_edit.verticalScrollBar()
+        at_bottom = bar.value() == bar.maximum()
+        cursor = QTextCursor(self.text_edit.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+        self.loaded_bytes = self.tailer.offset
+        if at_bottom:  # keep scrolling with the log, unless the user scrolled up to read something
+            bar.setValue(bar.maximum())
+
+    def open_large_file(self, file_name):
+        """
+        Show `file_name` in the mmap-backed viewer; the line index is built in the background and the view can
+        be scrolled (over the part indexed so far) right away.
+        """
+        self.cancel_load()
+        self.follow_action.setChecked(False)
+        self.cancel_search()
+        self.text_edit.clear()
+        self.current_file = None
+        self.large_view.open(file_name)
+        self.find_bar.set_read_only(True)
+        self.stack.setCurrentWidget(self.large_view)
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.cancel_button.show()
+        self.statusBar().showMessage("Indexing {}...".format(file_name))
+
+        self.load_generation += 1
+        gen = self.load_generation
+        worker = Worker(build_line_index, file_name, self.large_view.index)
+        worker.signals.progress.connect(lambda p: self.index_progress(p, gen))
+        worker.signals.result.connect(lambda n: self.statusBar().showMessage("{} (read-only, {} lines)".format(file_name, n)))
+        worker.signals.error.connect(lambda e: self.statusBar().showMessage("Error: {}".format(e[1])))
+        worker.signals.finished.connect(lambda: self.load_finished(gen))
+        worker.signals.finished.connect(lambda: gen == self.load_generation and self.large_view.index_updated())
+        self.load_handle = self.engine.start(worker)
+
+    def index_progress(self, progress, gen: int):
+        if gen != self.load_generation:
+            return
+        lines, done, total = progress
+        self.progress_bar.setValue(int(done * 1000 / total) if total else 1000)
+        self.large_view.index_updated()
+
+    def goto_line(self):
+        if self.stack.currentWidget() is self.large_view:
+            count = max(1, self.large_view.line_count())
+        else:
+            count = self.text_edit.document().blockCount()
+        line, ok = QInputDialog.getInt(self, "Go to line", "Line (1 - {}):".format(count), 1, 1, count)
+        if not ok:
+            return
+        if self.stack.currentWidget() is self.large_view:
+            self.large_view.goto_line(line - 1)
+        else:
+            cursor = QTextCursor(self.text_edit.document().findBlockByNumber(line - 1))
+            self.text_edit.setTextCursor(cursor)
+            self.text_edit.centerCursor()
+
+    def append_chunk(self, chunk, gen: int):
+        if gen != self.load_generation:
+            return
+        text, done, total = chunk
+        cursor = QTextCursor(self.text_edit.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+        self.progress_bar.setValue(int(done * 1000 / total) if total else 1000)
+        self.load_window.release()
+
+    def cancel_load(self):
+        if self.load_handle is not None:
+            self.load_handle.cancel()
+            self.load_finished(self.load_generation)
+            self.load_generation += 1
+            self.statusBar().showMessage("Loading cancelled")
+
+    def load_finished(self, gen: int):
+        if gen != self.load_generation:
+            return
+        if self.find_bar.isVisible() and self.find_bar.query():
+            self.search_timer.start()
+        self.load_handle = None
+        self.text_edit.setReadOnly(False)
+        self.text_edit.document().setUndoRedoEnabled(True)
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+
+    def show_find_bar(self):
+        self.find_bar.set_read_only(self.stack.currentWidget() is self.large_view)
+        self.find_bar.show()
+        self.find_bar.pattern_edit.setFocus()
+        self.find_bar.pattern_edit.selectAll()
+        self.search_timer.start()
+
+    def document_changed(self):
+        # Match positions are stale after any edit; search again once the edits settle
+        if self.matches:
+            self.matches = []
+            self.text_edit.setExtraSelections([])
+        if self.find_bar.isVisible() and self.find_bar.query():
+            self.search_timer.start()
+
+    def cancel_search(self):
+        if self.search_handle is not None:
+            self.search_handle.cancel()
+            self.search_handle = None
+        self.search_generation += 1
+
+    def start_search(self):
+        """
+        (Re)start find-all on a worker; the previous search is cancelled. Matches stream in through
+        `search_progress()`; only the visible ones are highlighted.
+        """
+        self.cancel_search()
+        self.matches = []
+        self.match_index = -1
+        self.text_edit.setExtraSelections([])
+        self.large_view.set_matches([])
+        query = self.find_bar.query()
+        if not query:
+            self.find_bar.count_label.setText("")
+            return
+        large = self.stack.currentWidget() is self.large_view
+        try:
+            self.search_pattern = compile_query(query, regex=self.find_bar.regex_box.isChecked(),
+                                                case_sensitive=self.find_bar.case_box.isChecked())
+            pattern = compile_query(query, regex=self.find_bar.regex_box.isChecked(),
+                                    case_sensitive=self.find_bar.case_box.isChecked(), as_bytes=large)
+        except re.error as e:
+            self.find_bar.count_label.setText("Invalid pattern: {}".format(e))
+            return
+        if large:
+            if self.large_view.path is None:
+                return
+            worker = Worker(search_file, self.large_view.path, pattern)
+        else:
+            worker = Worker(search_text, self.text_edit.toPlainText(), pattern)
+        gen = self.search_generation
+        worker.signals.progress.connect(lambda p: self.search_progress(p, gen))
+        worker.signals.error.connect(lambda e: self.find_bar.count_label.setText("Search failed: {}".format(e[1])))
+        self.search_handle = self.engine.start(worker)
+
+    def search_progress(self, progress, gen: int):
+        if gen != self.search_generation:
+            return
+        batch, done, total = progress
+        self.matches.extend(batch)
+        percent = int(done * 100 / total) if total else 100
+        self.find_bar.count_label.setText("{} matches{}".format(
+            len(self.matches), "" if percent >= 100 else " ({}%)".format(percent)))
+        if batch:
+            self.highlight_visible_matches()
+
+    def visible_range(self) -> tuple:
+        viewport = self.text_edit.viewport()
+        start = self.text_edit.cursorForPosition(viewport.rect().topLeft()).position()
+        end = self.text_edit.cursorForPosition(viewport.rect().bottomRight()).position()
+        return start, end
+
+    def highlight_visible_matches(self, *_):
+        if self.stack.currentWidget() is self.large_view:
+            self.large_view.set_matches(self.matches)  # the view paints only its visible lines anyway
+            return
+        if not self.matches:
+            return
+        start, end = self.visible_range()
+        doc = self.text_edit.document()
+        fmt = QTextCharFormat()
+        fmt.setBackground(QColor(255, 230, 0))
+        selections = []
+        i = bisect.bisect_left(self.matches, (start, start))
+        while i < len(self.matches) and self.matches[i][0] <= end:
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = QTextCursor(doc)
+            selection.cursor.setPosition(self.matches[i][0])
+            selection.cursor.setPosition(self.matches[i][1], QTextCursor.KeepAnchor)
+            selection.format = fmt
+            selections.append(selection)
+            i += 1
+        self.text_edit.setExtraSelections(selections)
+
+    def find_match(self, forward: bool = True):
+        if not self.matches:
+            return
+        if self.stack.currentWidget() is self.large_view:
+            self.match_index = (self.match_index + (1 if forward else -1)) % len(self.matches)
+            line = self.large_view.line_of_offset(self.matches[self.match_index][0])
+            self.large_view.goto_line(max(0, line - 3))
+        else:
+            cursor = self.text_edit.textCursor()
+            if forward:
+                i = bisect.bisect_left(self.matches, (cursor.selectionEnd(), cursor.selectionEnd()))
+                i = 0 if i >= len(self.matches) else i
+            else:
+                i = bisect.bisect_left(self.matches, (cursor.selectionStart(), cursor.selectionStart())) - 1
+            self.match_index = i % len(self.matches)
+            start, end = self.matches[self.match_index]
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            self.text_edit.setTextCursor(cursor)
+        self.find_bar.count_label.setText("{} / {} matches".format(self.match_index + 1, len(self.matches)))
+
+    def replace_one(self):
+        """ Replace the selected match and move on to the next one. """
+        cursor = self.text_edit.textCursor()
+        current = self.matches[self.match_index] if 0 <= self.match_index < len(self.matches) else None
+        if current != (cursor.selectionStart(), cursor.selectionEnd()):
+            self.find_match(forward=True)
+            return
+        replacement = self.find_bar.replace_edit.text()
+        if self.find_bar.regex_box.isChecked():
+            # match in the document, not the bare selection, so ^, $ and lookarounds see their context
+            m = match_at(self.text_edit.toPlainText(), self.search_pattern, *current)
+            if m is None:  # the match list is out of date
+                self.find_match(forward=True)
+                return
+            replacement = m.expand(replacement)
+        cursor.insertText(replacement)  # document_changed() restarts the search
+
+    def replace_all(self):
+        if self.search_pattern is None or not self.find_bar.query():
+            return
+        doc = self.text_edit.document()
+        revision = doc.revision()
+        worker = Worker(replace_all_text, self.text_edit.toPlainText(), self.search_pattern,
+                        self.find_bar.replace_edit.text(), self.find_bar.regex_box.isChecked())
+        worker.signals.result.connect(lambda r: self.apply_replace_all(r, revision))
+        worker.signals.error.connect(lambda e: self.find_bar.count_label.setText("Replace failed: {}".format(e[1])))
+        self.engine.start(worker)
+
+    def apply_replace_all(self, result, revision: int):
+        new_text, count = result
+        if self.text_edit.document().revision() != revision:
+            self.find_bar.count_label.setText("Document changed during replace, try again")
+            return
+        if count:
+            cursor = QTextCursor(self.text_edit.document())
+            cursor.beginEditBlock()  # one undo step
+            cursor.select(QTextCursor.Document)
+            cursor.insertText(new_text)
+            cursor.endEditBlock()
+        self.find_bar.count_label.setText("Replaced {} matches".format(count))
+
+    def closeEvent(self, event):
+        self.follow_action.setChecked(False)
+        self.cancel_search()
+        self.cancel_load()
+        self.large_view.close_file()
+        if self.save_handle is not None:
+            self.save_handle.wait()  # an unfinished save would be lost; it is never left half-written though
+        super().closeEvent(event)
 
 
 if __name__ == "__main__":
@@ -62,4 +486,7 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
+    if "--watchdog" in sys.argv:  # report event-loop stalls (with the blocking stack) to stalls.jsonl
+        from stall_watchdog import install_watchdog
+        watchdog = install_watchdog(window, dump_path="stalls.jsonl")
     sys.exit(app.exec_())
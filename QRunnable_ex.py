@@ -1,143 +1,157 @@
+import logging
 import sys
 import time
 import traceback
-from PyQt5.QtCore import pyqtSignal, QRunnable, QThreadPool, QSize, QObject, pyqtSlot, QMutex
+from PyQt5.QtCore import QSize
 from PyQt5.QtWidgets import (
-    QLabel,
     QVBoxLayout,
     QWidget,
     QApplication,
     QMainWindow,
     QPushButton,
+    QStatusBar,
 )
+from task_engine import TaskEngine, Worker, Backpressure, QueueFull
+from task_graph import TaskGraph
+from task_scheduler import TaskScheduler
+from progress_coalescer import ProgressCoalescer
+from frame_scheduler import FrameScheduler
+from task_metrics import TaskMetricsPanel
+from log_console import LogConsole
+from log_pipeline import setup_logging
 
+log = logging.getLogger(__name__)
 
-class WorkerSignals(QObject):
-    """
-    Defines the signals available from a running worker thread.
 
-    Supported signals are:
+# -- pipeline stages (TaskGraph demo); each gets the results of its dependencies as leading arguments --
 
-    finished
-        No data
+def fetch_chunk(num: int, cancel_token):
+    cancel_token.sleep(0.5 + 0.3 * num)  # pretend I/O
+    return list(range(num * 1000, (num + 1) * 1000))
 
-    error
-        tuple (exctype, value, traceback.format_exc() )
 
-    result
-        object data returned from processing, anything
+def chunk_sum(values: list, cancel_token):
+    cancel_token.check()
+    return sum(values)
 
-    progress
-        int indicating % progress
 
-    """
-    progress = pyqtSignal(str)
-    result = pyqtSignal(object)
-    finished = pyqtSignal()
-    error = pyqtSignal(tuple)
-
-
-class Worker(QRunnable):
-    def __init__(self, func, *args, **kwargs):
-        super().__init__()
-        self.func = func
-        self.lock = getattr(kwargs, 'mutex', None)
-        self.args = args
-        self.kwargs = kwargs
-        self.signals = WorkerSignals()
-        self.kwargs['progress_callback'] = self.signals.progress
-
-    @pyqtSlot()
-    def run(self):
-        if isinstance(self.lock, QMutex):  # if self.lock is not None:
-            if self.lock.tryLock():
-                self._running()
-                self.lock.unlock()
-            else:
-                print("{}; {}.lock.tryLock() = False; skip...".format(__file__, self))
-        else:
-            self._running()
-
-    def _running(self):
-        try:
-            result = self.func(*self.args, **self.kwargs)
-        except Exception as e:
-            print("{}; {}.Worker(QRunnable).run(); {} {}".format(time.ctime(), self, type(e), e))
-            traceback.print_exc()
-            exctype, value = sys.exc_info()[:2]
-            self.signals.error.emit((exctype, value, traceback.format_exc()))
-        else:
-            self.signals.result.emit(result)  # Return the result of the processing
-        finally:
-            self.signals.finished.emit()  # Done
+def combine(*totals):
+    return sum(totals)
 
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, metrics_path: str = None):
+        """
+        :param metrics_path: optional file the task metrics are written to (Prometheus text format), every second
+        """
         super().__init__()
         self.setWindowTitle("QRunnable demo")
         self.setMinimumSize(QSize(600, 300))
 
         _main_layout = QVBoxLayout()
 
-        self.mutex = QMutex()  # only 1 (long-term) test can run at a time
-        self.threadpool = QThreadPool()
+        # Only 1 long-term test can run at a time ("long-test" resource); the others wait in the scheduler, not on
+        # a pool thread, and interactive work (the pipeline) gets 4 thread starts for every long one.
+        # A click while the previous batch still waits replaces it instead of piling up behind it.
+        self.scheduler = TaskScheduler(resources={"long-test": 1}, weights={"interactive": 4, "long": 1})
+        self.engine = TaskEngine(max_queued=32, backpressure=Backpressure.COALESCE, scheduler=self.scheduler)
+        self.progress = ProgressCoalescer(hz=30, parent=self)  # at most 30 progress batches per second in total
+        self.frames = FrameScheduler(fps=30, parent=self)  # ... and every status change lands in one repaint tick
+        self.progress.updated.connect(self.update_labels)
 
         _concurrent = 3
         self.button = QPushButton("Start Worker(QRunnable)")
         self.button.clicked.connect(lambda s: self.start_thread(signal=s, con=_concurrent))
         _main_layout.addWidget(self.button)
-
-        self.worker = []
-        self.label = []
-        self.result = []
-        for i in range(_concurrent):
-            self.label.append(QLabel("Label_{} Waiting for updates...".format(i)))
-            _main_layout.addWidget(self.label[-1])
-            self.result.append(QLabel("Result_{} Waiting for updates...".format(i)))
-            _main_layout.addWidget(self.result[-1])
-            _main_layout.addWidget(QLabel("---------------------------------------"))
+        self.cancel_button = QPushButton("Cancel all Workers")
+        self.cancel_button.clicked.connect(self.cancel_threads)
+        _main_layout.addWidget(self.cancel_button)
+        self.pipeline_button = QPushButton("Start pipeline (TaskGraph)")
+        self.pipeline_button.clicked.connect(lambda: self.start_pipeline(con=_concurrent))
+        _main_layout.addWidget(self.pipeline_button)
+        self.pipeline = None
+
+        # One console for all tasks instead of a QLabel pair per task: progress and results stream into it
+        self.console = LogConsole(capacity=100_000)
+        self.console.append("Waiting for updates...")
+        _main_layout.addWidget(self.console)
+        self.metrics = TaskMetricsPanel([self.engine], export_path=metrics_path)
+        _main_layout.addWidget(self.metrics)
 
         dummy_widget = QWidget()
         dummy_widget.setLayout(_main_layout)
         self.setCentralWidget(dummy_widget)
+        self.setStatusBar(QStatusBar(self))
 
     def long_running_task(self, num, cycle: int = 9, **kwargs):
-        print("{}; long_running_task(num = {} {}, cycle={})".format(time.ctime(), type(num), num, cycle))
+        log.info("long_running_task(num = %s %s, cycle=%s)", type(num), num, cycle)
         # Perform some time-consuming operation
+        token = kwargs.get('cancel_token')
         for i in range(cycle):
             if 'progress_callback' in kwargs:
                 kwargs['progress_callback'].emit("Iteration {}".format(i))
-                # FIXME: AttributeError: 'WorkerSignals' does not have a signal with the signature progress(QString)
             else:
-                print("long_running_task(num = {} {}, cycle={}); Iteration {}".format(type(num), num, cycle, i))
-            time.sleep(num + 0.5)
+                log.debug("long_running_task(num = %s %s, cycle=%s); Iteration %s", type(num), num, cycle, i)
+            if token is not None:
+                token.sleep(num + 0.5)  # returns early (TaskCancelled) when cancelled
+            else:
+                time.sleep(num + 0.5)
 
     def start_thread(self, signal, con: int):
-        print("{}; start_thread(signal = {} {}, num={})".format(time.ctime(), type(signal), signal, con))
-        if self.mutex.tryLock():  # FIXME: This does not work; QThreadPool will finish executing immediately.
-            for i in range(con):
-                self.worker.append(Worker(self.long_running_task, i, 11))
-                self.worker[-1].signals.progress.connect(lambda s, num=i: self.update_label(signal=s, num=num))
-                self.worker[-1].signals.result.connect(lambda s, num=i: self.handle_result(signal=s, num=num))
-                self.worker[-1].signals.finished.connect(
-                    lambda num=i: print("{}; num = {}; Task finished.".format(time.ctime(), num)))
-                self.threadpool.start(self.worker[-1])
-            self.mutex.unlock()
-        else:
-            print("{}; {}.lock.tryLock() = False; skip...".format(__file__, self))
-
-    def update_label(self, signal, num: int):
+        log.info("start_thread(signal = %s %s, num=%s)", type(signal), signal, con)
+        for i in range(con):
+            worker = Worker(self.long_running_task, i, 11, progress_callback=self.progress.sink(i),
+                            coalesce_key=("long_running_task", i), resources=("long-test",), task_class="long")
+            worker.signals.result.connect(lambda s, num=i: self.handle_result(signal=s, num=num))
+            worker.signals.cancelled.connect(lambda num=i: self.handle_result(signal="Cancelled", num=num))
+            worker.signals.finished.connect(
+                lambda num=i: log.info("num = %s; Task finished.", num))
+            try:
+                self.engine.start(worker)  # the engine forgets the task (and recycles its signals) when done
+            except QueueFull as e:
+                log.warning("start_thread(); queue full, task %s not started: %s", i, e)
+
+    def start_pipeline(self, con: int):
+        """ fetch_i -> chunk_sum_i (one branch per chunk, in parallel) -> combine; no GUI hop between stages """
+        if self.pipeline is not None and not self.pipeline.done():
+            log.info("start_pipeline(); still running, skip...")
+            return
+        graph = TaskGraph(self.engine, parent=self)
+        for i in range(con):
+            graph.add("fetch_{}".format(i), fetch_chunk, i, task_class="interactive")
+            graph.add("sum_{}".format(i), chunk_sum, deps=["fetch_{}".format(i)], task_class="interactive")
+        graph.add("combine", combine, deps=["sum_{}".format(i) for i in range(con)], task_class="interactive")
+        graph.nodeFinished.connect(
+            lambda name, result: self.console.append("{}; pipeline: {} done".format(time.ctime(), name)))
+        graph.error.connect(lambda errors: self.console.append(
+            "{}; pipeline failed: {}".format(time.ctime(), ", ".join(sorted(errors)))))
+        graph.finished.connect(lambda results: self.console.append("{}; pipeline finished, combine = {}".format(
+            time.ctime(), results.get("combine", "-"))))
+        self.pipeline = graph
+        graph.start()
+
+    def cancel_threads(self):
+        log.info("cancel_threads(); %d tasks cancelled", self.engine.cancel_all())
+
+    def closeEvent(self, event):
+        # Stop the running tasks before the window (and the labels their signals point at) goes away
+        self.engine.shutdown()
+        super().closeEvent(event)
+
+    def update_labels(self, batch: dict):
+        now = time.ctime()  # formatted once per batch, not once per progress report
+        for num, signal in batch.items():
+            self.update_label(signal=signal, num=num, now=now)
+        self.frames.post("status", self.statusBar().showMessage,
+                         "{} | {}".format(self.progress.stats(), self.scheduler.stats()))
+
+    def update_label(self, signal, num: int, now: str = None):
         # print("{}; update_label(signal = {} {}, num={})".format(time.ctime(), type(signal), signal, num))
-        self.label[num].setText("{}; update_label(signal = {} {}, num={})".format(time.ctime(), type(signal), signal, num))
+        self.console.append("{}; update_label(signal = {} {}, num={})".format(now or time.ctime(), type(signal), signal, num))
 
     def handle_result(self, signal, num: int):
         # print("{}; handle_result(signal = {} {}, num={})".format(time.ctime(), type(signal), signal, num))
-        self.result[num].setText("{}; handle_result(signal = {} {}, num={})".format(time.ctime(), type(signal), signal, num))
-
-    def _cleanup(self):
-        # FIXME: RuntimeError: wrapped C/C++ object of type WorkerSignals has been deleted
-        print("{}._cleanup() Successful.".format(self))
+        self.console.append("{}; handle_result(signal = {} {}, num={})".format(time.ctime(), type(signal), signal, num))
 
 
 if __name__ == "__main__":
@@ -147,8 +161,9 @@ if __name__ == "__main__":
         QApplication.quit()  # or QtWidgets.QApplication.exit(0)
 
     sys.excepthook = excepthook
+    setup_logging("INFO", log_file="QRunnable_ex.log")
 
     app = QApplication(sys.argv)
-    window = MainWindow()
+    window = MainWindow(metrics_path="taskengine.prom" if "--metrics" in sys.argv else None)
     window.show()
     app.exec()
@@ -1,6 +1,7 @@
+import logging
 import sys
 import traceback
-from PyQt5.QtCore import QSize, QThread, pyqtSignal
+from PyQt5.QtCore import QSize
 from PyQt5.QtWidgets import (
     QLabel,
     QPushButton,
@@ -8,16 +9,25 @@ from PyQt5.QtWidgets import (
     QWidget,
     QApplication,
     QMainWindow,
+    QHBoxLayout,
 )
+from job_thread import JobThread
+from log_pipeline import setup_logging
 
+log = logging.getLogger(__name__)
 
-class WorkerThread(QThread):
-    update_label_signal = pyqtSignal(str)
 
-    def run(self):
-        for i in range(10):
-            self.update_label_signal.emit("Iteration {}".format(i))
-            self.sleep(1)
+def count_job(cycles: int, progress_callback, cancel_token):
+    """ The former WorkerThread.run() body, now one job among many on the same thread. """
+    for i in range(cycles):
+        cancel_token.check()
+        progress_callback.emit("Iteration {}".format(i))
+        cancel_token.sleep(1)
+    return "Done"
+
+
+def quick_job(n: int):
+    return n * n
 
 
 class MainWindow(QMainWindow):
@@ -36,17 +46,55 @@ class MainWindow(QMainWindow):
         self.button.clicked.connect(self.start_thread)
 
         _main_layout.addWidget(self.button)
-
-        self.worker = WorkerThread()
-        self.worker.update_label_signal.connect(self.update_label)
+        self.quick_button = QPushButton("Queue 1000 quick jobs")
+        self.quick_button.clicked.connect(self.queue_quick_jobs)
+        _main_layout.addWidget(self.quick_button)
+
+        _btn_layout = QHBoxLayout()
+        for name, slot in (("Pause", self.pause_thread), ("Resume", self.resume_thread), ("Stop", self.stop_thread)):
+            btn = QPushButton(name)
+            btn.clicked.connect(slot)
+            _btn_layout.addWidget(btn)
+        _main_layout.addLayout(_btn_layout)
+
+        # One thread for the window's lifetime: every click queues a job on it instead of (re)starting a thread
+        self.worker = JobThread("QThread_ex-jobs")
+        self.worker.progress.connect(lambda job_id, text: self.update_label("Job {}: {}".format(job_id, text)))
+        self.worker.resultsReady.connect(self.handle_results)
+        self.worker.cancelled.connect(lambda job_id: self.update_label("Job {}: Stopped".format(job_id)))
 
         dummy_widget = QWidget()
         dummy_widget.setLayout(_main_layout)
         self.setCentralWidget(dummy_widget)
 
     def start_thread(self):
-        print("start_thread()")
-        self.worker.start()
+        job_id = self.worker.submit(count_job, 10)
+        log.info("start_thread(); job %s queued, %s pending", job_id, self.worker.pending())
+
+    def queue_quick_jobs(self):
+        for n in range(1000):
+            self.worker.submit(quick_job, n)
+
+    def handle_results(self, results: list):
+        # one call per batch of finished jobs, not one per job
+        job_id, result = results[-1]
+        log.info("handle_results(); %d jobs done, last: job %s = %s", len(results), job_id, result)
+        self.update_label("Job {}: {} ({} results in this batch)".format(job_id, result, len(results)))
+
+    def pause_thread(self):
+        self.worker.pause()
+        self.label.setText(self.label.text() + " (paused)")
+
+    def resume_thread(self):
+        self.worker.resume()
+
+    def stop_thread(self):
+        log.info("stop_thread(); %d queued jobs dropped", self.worker.cancel())
+
+    def closeEvent(self, event):
+        # QThread: Destroyed while thread is still running -> stop it and wait for the loop to return
+        self.worker.shutdown()
+        super().closeEvent(event)
 
     def update_label(self, text):
         self.label.setText(text)
@@ -59,6 +107,7 @@ if __name__ == '__main__':
         QApplication.quit()  # or QtWidgets.QApplication.exit(0)
 
     sys.excepthook = excepthook
+    setup_logging("INFO")
 
     app = QApplication(sys.argv)
     window = MainWindow()
@@ -2,14 +2,18 @@
 PyQt5 doesn't directly expose the QtConcurrent namespace. However, you can achieve similar functionality using Python's built-in threading mechanisms or the concurrent.futures module.
 
 Explanation:
-Worker class:
-This class encapsulates the execution of the task in a separate thread. It uses concurrent.futures.ThreadPoolExecutor to manage the thread pool.
+Worker class (task_engine.Worker):
+This class encapsulates the execution of the task in a separate thread. TaskEngine owns the QThreadPool that runs it.
 Signals:
 The finished signal is emitted when the task is completed, and the result signal is emitted with the result of the task.
-run method:
-This method starts the task in a separate thread.
-on_complete method:
-This method is called when the task is finished. It handles the result and emits signals.
+TaskEngine.submit / TaskEngine.start:
+These methods queue the task on the pool and return a TaskHandle (status, result, error, cancel).
+shared_engine():
+The application-wide TaskEngine (QThreadPool.globalInstance()); created once, never torn down per task.
+mapped / filtered / mapped_reduced (task_concurrent):
+Bulk operations; items are chunked so one pool task handles many items, and results stream back in batches.
+Worker(..., backend=engine.process_pool()):
+CPU-bound tasks run in worker processes (no GIL contention with the GUI); the signals stay the same.
 
 Key Differences from QtConcurrent:
 No direct mapping: PyQt5 doesn't provide a direct equivalent to QtConcurrent.
@@ -18,101 +22,121 @@ Flexibility: You have more control over the execution of tasks and can easily in
 """
 
 
+import logging
 import sys
 import time
 import traceback
-import concurrent.futures
-from PyQt5.QtCore import QObject, pyqtSignal, QRunnable, QThreadPool, QSize
-from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QPushButton, QWidget
+from PyQt5.QtCore import QSize
+from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QPushButton, QWidget, QLabel
+from task_engine import shared_engine, Worker
+from task_metrics import TaskMetricsPanel
+from task_concurrent import mapped_reduced
+from result_cache import ResultCache
+from log_pipeline import setup_logging
+
+log = logging.getLogger(__name__)
 
 
 def long_running_task(arg1, arg2):
-    print("{}; long_running_task(arg1={}, arg2={})".format(time.ctime(), arg1, arg2))
+    log.info("long_running_task(arg1=%s, arg2=%s)", arg1, arg2)
     # Perform some time-consuming operation
     for i in range(3):
-        print("time.sleep({})".format(i))
+        log.debug("time.sleep(%s)", i)
         time.sleep(.5)
     return arg1 + arg2
 
 
 def handle_result(result):
-    print("Result:", result)
+    log.info("Result: %s", result)
 
 
-class WorkerSignals(QObject):
-    progress = pyqtSignal(str)
-    result = pyqtSignal(object)
-    finished = pyqtSignal()
-    error = pyqtSignal(tuple)
+def square(x):
+    return x * x
 
 
-class Worker(QRunnable):
-    def __init__(self, func, *args, **kwargs):
-        super().__init__()
-        self.func = func
-        self.args = args
-        self.kwargs = kwargs
-        self.signals = WorkerSignals()
-
-    def run(self):
-        # try:
-        #     result = self.func(*self.args, **self.kwargs)
-        #     print("result = {} {}".format(type(result), result))
-        # except Exception as e:
-        #     print("{}; {}.Worker(QRunnable).run(); {} {}".format(time.ctime(), self, type(e), e))
-        #     traceback.print_exc()
-        #     exctype, value = sys.exc_info()[:2]
-        #     self.signals.error.emit((exctype, value, traceback.format_exc()))
-        # else:
-        #     self.signals.result.emit(result)  # Return the result of the processing
-        #     print("emitted result.")
-        # finally:
-        #     self.signals.finished.emit()  # Done
-        #     print("emitted finished.")
-
-        # FIXME: if start worker NOT in QMainWindow: RuntimeError: can't register atexit after shutdown
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(self.func, *self.args, **self.kwargs)
-            future.add_done_callback(self.on_complete)
-
-    def on_complete(self, future):
-        try:
-            result = future.result()
-            print("result = {} {}".format(type(result), result))
-            self.signals.result.emit(result)
-            print("emitted result.")
-        except Exception as e:
-            print("Error in worker thread: {} {}".format(type(e), e))
-        finally:
-            self.signals.finished.emit()
-            print("emitted finished.")
+def add(total, value):
+    return total + value
+
+
+def cpu_bound_task(n, progress_callback):
+    # Pure-Python number crunching; holds the GIL the whole time, so it belongs in a process
+    total = 0
+    step = max(1, n // 10)
+    for i in range(n):
+        total += i * i % 7
+        if i % step == 0:
+            progress_callback.emit(int(i * 100 / n))
+    return total
 
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, metrics_path: str = None, cache_path: str = None):
+        """
+        :param metrics_path: optional file the task metrics are written to (Prometheus text format), every second
+        :param cache_path: optional SQLite file that keeps the task results across restarts; memory only without
+        """
         super().__init__()
         self.setWindowTitle("QtConcurrent demo")
         self.setMinimumSize(QSize(600, 300))
 
         _main_layout = QVBoxLayout()
 
-        self.threadpool = QThreadPool()
+        self.engine = shared_engine()
+        # Identical calls run once (also when submitted while the first one is still running); with `cache_path`
+        # their results survive restarts
+        self.results = ResultCache(max_entries=256, ttl=24 * 3600, disk_path=cache_path)
 
         self.button = QPushButton("Start Worker(QRunnable)")
         self.button.clicked.connect(lambda s: self.start_thread(signal=s))
         _main_layout.addWidget(self.button)
 
+        self.map_button = QPushButton("mapped_reduced(square, add, range(100000))")
+        self.map_button.clicked.connect(self.start_map_reduce)
+        _main_layout.addWidget(self.map_button)
+        self.map_label = QLabel("Waiting for updates...")
+        _main_layout.addWidget(self.map_label)
+        self.job = None
+
+        self.process_button = QPushButton("Start Worker(process pool)")
+        self.process_button.clicked.connect(self.start_process_task)
+        _main_layout.addWidget(self.process_button)
+        self.process_label = QLabel("Waiting for updates...")
+        _main_layout.addWidget(self.process_label)
+        self.metrics = TaskMetricsPanel([self.engine], export_path=metrics_path)
+        _main_layout.addWidget(self.metrics)
+
         dummy_widget = QWidget()
         dummy_widget.setLayout(_main_layout)
         self.setCentralWidget(dummy_widget)
 
     def start_thread(self, signal):
-        print("{}; start_thread(signal = {} {})".format(time.ctime(), type(signal), signal))
+        log.info("start_thread(signal = %s %s)", type(signal), signal)
         # FIXME: start worker in QMainWindow WILL execute `handle_result()` and `print`
-        worker = Worker(long_running_task, 2, 3)
-        worker.signals.finished.connect(lambda: print("Task finished"))
+        worker = Worker(long_running_task, 2, 3, cache=self.results)
+        worker.signals.finished.connect(lambda: log.info("Task finished"))
         worker.signals.result.connect(handle_result)
-        self.threadpool.start(worker)
+        self.engine.start(worker)
+
+    def start_map_reduce(self):
+        if self.job is not None:
+            self.job.cancel()
+        self.job = mapped_reduced(square, add, range(100000), initial=0)
+        self.job.progress.connect(lambda done, total: self.map_label.setText("{} / {} items".format(done, total)))
+        self.job.finished.connect(lambda result: self.map_label.setText("sum of squares = {}".format(result)))
+        self.job.start()
+
+    def closeEvent(self, event):
+        # The shared engine itself is shut down on QApplication.aboutToQuit; only drop our own bulk job here
+        if self.job is not None:
+            self.job.cancel()
+        super().closeEvent(event)
+
+    def start_process_task(self):
+        worker = Worker(cpu_bound_task, 5000000, backend=self.engine.process_pool(), cache=self.results)
+        worker.signals.progress.connect(lambda n: self.process_label.setText("{}% done".format(n)))
+        worker.signals.result.connect(lambda result: self.process_label.setText("Result: {}".format(result)))
+        worker.signals.error.connect(lambda e: self.process_label.setText("Error: {}".format(e[1])))
+        self.engine.start(worker)
 
 
 if __name__ == "__main__":
@@ -124,14 +148,16 @@ if __name__ == "__main__":
     sys.excepthook = excepthook
 
     # FIXME: start worker here will NOT execute `handle_result()` or `print`
-    # threadpool = QThreadPool()
+    # engine = shared_engine()
     # worker = Worker(long_running_task, 2, 3)
     # worker.signals.finished.connect(lambda: print("Task finished"))
     # worker.signals.result.connect(handle_result)
-    # threadpool.start(worker)
+    # engine.start(worker)
 
+    setup_logging("INFO", log_file="QtConcurrent_ex.log")
     app = QApplication(sys.argv)
-    window = MainWindow()
+    window = MainWindow(metrics_path="taskengine.prom" if "--metrics" in sys.argv else None,
+                        cache_path="results_cache.sqlite" if "--disk-cache" in sys.argv else None)
     window.show()
     app.exec()
 
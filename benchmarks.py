@@ -0,0 +1,250 @@
+"""
+Headless benchmark suite.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks.py --output bench.json
+    python benchmarks.py --save-baseline bench_baseline.json     # on a known-good build
+    python benchmarks.py --baseline bench_baseline.json          # exit code 1 on a regression
+
+Measures Worker submit-to-start latency on the QThreadPool, cross-thread signal throughput (WorkerSignals.progress
+and .result), the jitter of the PyQt_ex `update_count` QTimer, file read / atomic save throughput and main window
+construction time. Every result is {"value", "unit", "better": "lower" | "higher", ...}; with `--baseline` a
+result more than `--tolerance` (default 25%) worse than the baseline is reported as a regression.
+Baselines are machine-specific: record one per machine / CI runner.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QEventLoop, QT_VERSION_STR, PYQT_VERSION_STR
+from PyQt5.QtGui import QTextDocument
+from PyQt5.QtWidgets import QApplication
+from task_engine import TaskEngine, Worker, CancelToken
+from file_io import read_text_chunks, write_document_atomic
+
+MiB = 1 << 20
+
+
+def percentile(values: list, p: float) -> float:
+    values = sorted(values)
+    if not values:
+        return 0.0
+    k = min(len(values) - 1, max(0, int(round(p / 100 * (len(values) - 1)))))
+    return values[k]
+
+
+def result(value: float, unit: str, better: str = "lower", **extra) -> dict:
+    out = {"value": round(value, 3), "unit": unit, "better": better}
+    out.update({k: round(v, 3) if isinstance(v, float) else v for k, v in extra.items()})
+    return out
+
+
+def wait_until(predicate, timeout_s: float = 60.0):
+    """ Run the event loop until `predicate()` is true. """
+    loop = QEventLoop()
+    deadline = time.perf_counter() + timeout_s
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("benchmark did not finish within {} s".format(timeout_s))
+        loop.processEvents(QEventLoop.AllEvents, 10)
+
+
+def _started_after(t_submit: float) -> float:
+    return time.perf_counter() - t_submit
+
+
+def bench_submit_latency(engine: TaskEngine, tasks: int) -> dict:
+    """ Time from Worker construction + start() to the task running on a pool thread. """
+    handles = []
+    for _ in range(tasks):
+        handles.append(engine.start(Worker(_started_after, time.perf_counter())))
+        if len(handles) % engine.max_threads == 0:
+            engine.wait_for_done()  # measure dispatch, not queueing behind our own tasks
+    engine.wait_for_done()
+    latencies = [h.result * 1e6 for h in handles]
+    return result(percentile(latencies, 50), "us", p95=percentile(latencies, 95), p99=percentile(latencies, 99),
+                  tasks=tasks)
+
+
+def _emit_progress(count: int, progress_callback):
+    for i in range(count):
+        progress_callback.emit(i)
+    return count
+
+
+def bench_progress_throughput(engine: TaskEngine, signals: int) -> dict:
+    """ WorkerSignals.progress emitted from a pool thread, delivered to a GUI-thread slot. """
+    received = [0]
+
+    def on_progress(_):
+        received[0] += 1
+
+    worker = Worker(_emit_progress, signals)
+    worker.signals.progress.connect(on_progress)
+    t0 = time.perf_counter()
+    engine.start(worker)
+    wait_until(lambda: received[0] >= signals)
+    elapsed = time.perf_counter() - t0
+    return result(signals / elapsed, "signals/s", "higher", signals=signals)
+
+
+def _return_value(i: int):
+    return i
+
+
+def bench_result_throughput(engine: TaskEngine, tasks: int) -> dict:
+    """ One WorkerSignals.result per task, delivered to a GUI-thread slot. """
+    received = [0]
+
+    def on_result(_):
+        received[0] += 1
+
+    t0 = time.perf_counter()
+    for i in range(tasks):
+        worker = Worker(_return_value, i)
+        worker.signals.result.connect(on_result)
+        engine.start(worker)
+    wait_until(lambda: received[0] >= tasks)
+    elapsed = time.perf_counter() - t0
+    return result(tasks / elapsed, "results/s", "higher", tasks=tasks)
+
+
+def bench_timer_jitter(ticks: int) -> dict:
+    """ Deviation of the PyQt_ex.MainWindow `update_count` timer from its interval, event loop otherwise idle. """
+    from PyQt_ex import MainWindow
+    window = MainWindow()
+    window.show()
+    stamps = []
+    window.timer.timeout.connect(lambda: stamps.append(time.perf_counter()))
+    wait_until(lambda: len(stamps) > ticks)
+    interval_ms = window.timer.interval()
+    window.close()
+    window.deleteLater()
+    deviations = [abs((b - a) * 1000 - interval_ms) for a, b in zip(stamps, stamps[1:])]
+    return result(percentile(deviations, 95), "ms", p50=percentile(deviations, 50), max=max(deviations),
+                  interval_ms=interval_ms, ticks=ticks)
+
+
+class _CountingSink:
+    def __init__(self):
+        self.chars = 0
+
+    def emit(self, value):
+        self.chars += len(value[0])
+
+
+def bench_file_io(directory: str, size_mib: int) -> tuple:
+    """ :return: (read result, save result) for a text file of `size_mib` MiB """
+    line = "0123456789 abcdefghijklmnopqrstuvwxyz ABCDEFGHIJKLMNOPQRSTUVWXYZ {}\n"
+    path = os.path.join(directory, "bench_{}MiB.txt".format(size_mib))
+    lines = [line.format(i) for i in range(size_mib * MiB // len(line.format(0)))]
+    text = "".join(lines)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+    size = os.path.getsize(path)
+
+    t0 = time.perf_counter()
+    read_text_chunks(path, _CountingSink(), CancelToken())
+    read_s = time.perf_counter() - t0
+
+    document = QTextDocument()
+    document.setPlainText(text)
+    t0 = time.perf_counter()
+    write_document_atomic(path, document)
+    save_s = time.perf_counter() - t0
+    os.remove(path)
+    return (result(size / MiB / read_s, "MiB/s", "higher", bytes=size),
+            result(size / MiB / save_s, "MiB/s", "higher", bytes=size))
+
+
+def bench_window_construction(repeat: int, lazy: bool) -> dict:
+    from PyQt_ex import MainWindow
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        window = MainWindow(lazy=lazy)
+        times.append((time.perf_counter() - t0) * 1000)
+        window.timer.stop()
+        window.engine.shutdown()
+        window.deleteLater()
+        QApplication.processEvents()
+    return result(statistics.median(times), "ms", min=min(times), repeat=repeat)
+
+
+def run(quick: bool = False) -> dict:
+    engine = TaskEngine()
+    sizes = [1, 8] if quick else [1, 16, 64]
+    results = {
+        "submit_latency": bench_submit_latency(engine, 500 if quick else 5000),
+        "progress_throughput": bench_progress_throughput(engine, 20000 if quick else 200000),
+        "result_throughput": bench_result_throughput(engine, 1000 if quick else 10000),
+        "timer_jitter": bench_timer_jitter(10 if quick else 50),
+        "window_construction_lazy": bench_window_construction(3 if quick else 10, lazy=True),
+        "window_construction_eager": bench_window_construction(3 if quick else 10, lazy=False),
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            read, save = bench_file_io(directory, size)
+            results["read_{}MiB".format(size)] = read
+            results["save_{}MiB".format(size)] = save
+    engine.shutdown()
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """ :return: [(name, baseline value, value, change), ...] for the results worse than `tolerance` """
+    regressions = []
+    for name, base in baseline.items():
+        current = results.get(name)
+        if current is None or not base["value"]:
+            continue
+        change = (current["value"] - base["value"]) / base["value"]
+        worse = change > tolerance if base["better"] == "lower" else change < -tolerance
+        if worse:
+            regressions.append((name, base["value"], current["value"], change))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against this JSON file (written by --save-baseline)")
+    parser.add_argument("--save-baseline", help="write the results as the new baseline to this file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown (0.25 = 25%%)")
+    parser.add_argument("--quick", action="store_true", help="smaller workloads, for a smoke run")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    report = {
+        "meta": {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+                 "qt": QT_VERSION_STR, "pyqt": PYQT_VERSION_STR, "platform": platform.platform(),
+                 "qpa": os.environ.get("QT_QPA_PLATFORM"), "quick": args.quick},
+        "results": run(args.quick),
+    }
+    for name, r in report["results"].items():
+        print("{:<28} {:>14.3f} {:<10} ({} is better)".format(name, r["value"], r["unit"], r["better"]))
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(report["results"], baseline, args.tolerance)
+        for name, base, value, change in regressions:
+            print("REGRESSION {}: {} -> {} ({:+.0%})".format(name, base, value, change))
+        print("{} regression(s) against {}".format(len(regressions), args.baseline))
+        status = 1 if regressions else 0
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
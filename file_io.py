@@ -0,0 +1,117 @@
+"""
+Background file I/O helpers for the QFileDialog_ex editor.
+
+These are plain task functions for `task_engine.Worker`: they run on a pool thread, report through
+`progress_callback` and stop at the next chunk when their `cancel_token` is cancelled.
+"""
+import codecs
+import io
+import os
+import shutil
+import tempfile
+import threading
+
+CHUNK_SIZE = 1 << 20  # 1 MiB per read / per GUI append
+
+
+class ChunkWindow:
+    """
+    Flow control between a producer thread and the GUI: at most `size` chunks may be in flight (emitted but not
+    yet consumed). The producer calls `acquire(token)` before emitting, the GUI calls `release()` after
+    consuming, so a fast disk can't queue up the whole file as pending signals.
+    """
+    def __init__(self, size: int = 4):
+        self._sem = threading.Semaphore(size)
+
+    def acquire(self, cancel_token=None):
+        while not self._sem.acquire(timeout=0.1):
+            if cancel_token is not None:
+                cancel_token.check()
+
+    def release(self):
+        self._sem.release()
+
+
+def read_text_chunks(path, progress_callback, cancel_token, window: ChunkWindow = None,
+                     chunk_size: int = CHUNK_SIZE, encoding: str = "utf-8-sig", errors: str = "replace"):
+    """
+    Decode `path` chunk by chunk and emit `(text, bytes_done, bytes_total)` through `progress_callback`.
+
+    Decoding is incremental (multi-byte characters and "\\r\\n" split across chunks are handled) and newlines
+    are translated like text-mode `open()` does.
+
+    :return: number of bytes read
+    """
+    total = os.path.getsize(path)
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder(encoding)(errors=errors), translate=True)
+    done = 0
+    with open(path, "rb") as f:
+        while True:
+            cancel_token.check()
+            data = f.read(chunk_size)
+            done += len(data)
+            text = decoder.decode(data, final=not data)
+            if text:
+                if window is not None:
+                    window.acquire(cancel_token)
+                progress_callback.emit((text, done, total))
+            if not data:
+                return done
+
+
+def write_document_atomic(path, document, progress_callback=None, cancel_token=None, chunk_chars: int = CHUNK_SIZE,
+                          encoding: str = "utf-8-sig", errors: str = "replace"):
+    """
+    Worker task: write the plain text of a QTextDocument to `path` without ever leaving a half-written file.
+
+    The text goes block by block into a temp file in the same directory (so the final rename can't cross file
+    systems), which is fsync-ed and then `os.replace()`-d over `path`. A crash or cancel mid-save leaves the old
+    file untouched. `document` must not be edited while this runs: pass a `QTextDocument.clone()` snapshot.
+    Emits (blocks_done, blocks_total) after every written chunk.
+
+    :return: number of characters written
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix="." + name + ".", suffix=".tmp")
+    total_blocks = document.blockCount()
+    written = 0
+    try:
+        with open(fd, "w", encoding=encoding, errors=errors) as f:
+            parts, size, done = [], 0, 0
+            block = document.begin()
+            while block.isValid():
+                text = block.text()
+                block = block.next()
+                if block.isValid():
+                    text += "\n"
+                parts.append(text)
+                size += len(text)
+                done += 1
+                if size >= chunk_chars:
+                    if cancel_token is not None:
+                        cancel_token.check()
+                    f.write("".join(parts))
+                    written += size
+                    parts, size = [], 0
+                    if progress_callback is not None:
+                        progress_callback.emit((done, total_blocks))
+            f.write("".join(parts))
+            written += size
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)  # keep the permissions of the file being replaced
+        else:  # mkstemp() creates 0600; give a new file the mode open() would have
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    if progress_callback is not None:
+        progress_callback.emit((total_blocks, total_blocks))
+    return written
@@ -0,0 +1,98 @@
+"""
+`tail -f` for the QFileDialog_ex editor.
+
+`FileTailer` remembers the byte offset it has read up to and, whenever the file grows, reads ONLY the new bytes.
+Change notifications come from QFileSystemWatcher; a slow polling timer backs it up for file systems where the
+watcher is unreliable (network shares) and for files that get replaced by log rotation. New text is collected
+and handed out as one `appended(str)` batch per `batch_ms`, so a log written line by line at a high rate costs
+one document insert per batch, not one per line.
+"""
+import codecs
+import io
+import os
+from PyQt5.QtCore import QObject, QTimer, QFileSystemWatcher, pyqtSignal
+
+MAX_READ_PER_TICK = 4 << 20  # bytes; a huge burst is spread over several batches instead of freezing the GUI
+
+
+class FileTailer(QObject):
+    """
+    Supported signals are:
+
+    appended
+        str, text appended to the file since the previous batch (newlines translated like text-mode open())
+
+    truncated
+        No data; the file shrank (truncated or rotated), reading restarts from offset 0
+
+    :param path: file to follow
+    :param offset: byte offset to start from, usually the number of bytes already loaded
+    :param poll_ms: fallback polling interval
+    :param batch_ms: minimum interval between `appended` batches
+    """
+    appended = pyqtSignal(str)
+    truncated = pyqtSignal()
+
+    def __init__(self, path, offset: int = 0, poll_ms: int = 1000, batch_ms: int = 100,
+                 encoding: str = "utf-8-sig", errors: str = "replace", parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.offset = offset
+        self.bytes_read = 0
+        self._encoding = encoding
+        self._errors = errors
+        self._decoder = self._new_decoder()
+
+        self._watcher = QFileSystemWatcher([path], self)
+        self._watcher.fileChanged.connect(self._changed)
+        self._poll = QTimer(self)
+        self._poll.setInterval(poll_ms)
+        self._poll.timeout.connect(self._changed)
+        self._batch = QTimer(self)
+        self._batch.setSingleShot(True)
+        self._batch.setInterval(batch_ms)
+        self._batch.timeout.connect(self.read_new)
+
+    def _new_decoder(self):
+        return io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(self._encoding)(errors=self._errors), translate=True)
+
+    def start(self):
+        self._poll.start()
+        self._changed()
+
+    def stop(self):
+        self._poll.stop()
+        self._batch.stop()
+        if self._watcher.files():
+            self._watcher.removePaths(self._watcher.files())
+
+    def _changed(self, *_):
+        if self.path not in self._watcher.files() and os.path.exists(self.path):
+            self._watcher.addPath(self.path)  # the watcher drops files that were renamed / replaced
+        if not self._batch.isActive():
+            self._batch.start()  # coalesce a burst of notifications into one read
+
+    def read_new(self) -> int:
+        """ Read the bytes appended since the last call (at most MAX_READ_PER_TICK). Returns bytes read. """
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return 0
+        if size < self.offset:
+            self.offset = 0
+            self._decoder = self._new_decoder()
+            self.truncated.emit()
+        if size == self.offset:
+            return 0
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read(min(size - self.offset, MAX_READ_PER_TICK))
+        self.offset += len(data)
+        self.bytes_read += len(data)
+        text = self._decoder.decode(data)
+        if text:
+            self.appended.emit(text)
+        if self.offset < size:
+            self._batch.start()  # more to come; next slice after batch_ms
+        return len(data)
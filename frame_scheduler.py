@@ -0,0 +1,69 @@
+"""
+One repaint tick for the whole window.
+
+Instead of every timer, slider and worker signal touching widgets directly, producers `post()` the update they
+want under a key ("the counter label", "slider 2", ...). Posting again under the same key before the next tick
+replaces the earlier update (latest wins). A single QTimer in the GUI thread then applies everything pending in
+one go, so the number of widget updates - and with them repaints - per second is bounded by `fps`, no matter
+how many producers are active.
+
+    frames = FrameScheduler(fps=30, parent=window)
+    frames.set_text(window.label, "Counter: 1.0")        # shorthand for a keyed setText
+    frames.post(("slider", 2), window.apply_slider, 42)    # any callable + args
+"""
+from PyQt5.QtCore import QObject
+from signal_adapters import Coalescer
+
+
+def _repost(pending: dict, key, update: tuple):
+    pending.pop(key, None)  # re-insert at the end: keep "last posted, last applied" ordering
+    pending[key] = update
+
+
+class FrameScheduler(QObject):
+    """
+    Counters: `posted` (post() calls), `applied` (updates actually run), `ticks` (ticks that applied something).
+
+    :param fps: maximum ticks per second
+    :param batch_widget: optional top-level widget to wrap each tick in setUpdatesEnabled(False/True). That
+                         turns all changes of a tick into a single repaint, but re-enabling repaints the whole
+                         widget, so it only pays off when a tick touches many widgets
+    """
+    def __init__(self, fps: float = 30, batch_widget=None, parent=None):
+        super().__init__(parent)
+        self.batch_widget = batch_widget
+        self.applied = 0
+        self.ticks = 0
+        # pending: key -> (fn, args); dicts keep insertion order, so updates run in posting order
+        self._coalescer = Coalescer(self._apply, dict, max(1, int(1000 / fps)), self)
+
+    @property
+    def posted(self) -> int:
+        return self._coalescer.posted
+
+    def post(self, key, fn, *args):
+        """ Thread-safe; schedule `fn(*args)` for the next tick, replacing anything pending under `key`. """
+        self._coalescer.post(_repost, key, (fn, args))
+
+    def set_text(self, widget, text: str):
+        self.post((id(widget), "setText"), widget.setText, text)
+
+    def tick(self):
+        """ Apply all pending updates (GUI thread). Stops the timer when there was nothing to do. """
+        self._coalescer.flush()
+
+    def _apply(self, pending: dict):
+        batch = self.batch_widget
+        if batch is not None:
+            batch.setUpdatesEnabled(False)
+        try:
+            for fn, args in pending.values():
+                fn(*args)
+        finally:
+            if batch is not None:
+                batch.setUpdatesEnabled(True)
+        self.applied += len(pending)
+        self.ticks += 1
+
+    def stats(self) -> str:
+        return "frames: posted {}, applied {} in {} ticks".format(self.posted, self.applied, self.ticks)
@@ -0,0 +1,70 @@
+"""
+Icons and pixmaps from the compiled resource bundle, decoded once and shared.
+
+The PNGs are compiled into `resources_rc.py` (regenerate with `pyrcc5 resources.qrc -o resources_rc.py` after
+changing an image) and registered with Qt under ":/icons/", so loading them reads memory, not the disk, and
+works whatever the current directory is. Decoded pixmaps live in QPixmapCache, keyed by name and size and
+bounded by `PIXMAP_CACHE_KB`; every window and toolbar asking for the same icon gets the same QIcon.
+
+    action = QAction(icon_cache.icon("abacus.png"), "&Your Button", self)
+
+GUI thread only (QPixmap), and only after the QApplication exists.
+"""
+import os
+from PyQt5.QtCore import Qt, QFile
+from PyQt5.QtGui import QIcon, QPixmap, QPixmapCache
+
+try:
+    import resources_rc  # noqa: F401 - importing registers the ":/icons/" resources
+except ImportError:  # not compiled yet: fall back to the PNGs next to this file
+    resources_rc = None
+
+RESOURCE_PREFIX = ":/icons/"
+ICON_DIR = os.path.dirname(os.path.abspath(__file__))
+PIXMAP_CACHE_KB = 8 * 1024
+
+_icons = {}  # name -> QIcon
+QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), PIXMAP_CACHE_KB))
+
+
+def resource_path(name: str) -> str:
+    """ ":/icons/<name>" if it is in the bundle, else the file next to this module. """
+    path = RESOURCE_PREFIX + name
+    if QFile.exists(path):
+        return path
+    return os.path.join(ICON_DIR, name)
+
+
+def pixmap(name: str, width: int = 0, height: int = 0) -> QPixmap:
+    """
+    Decoded pixmap of resource `name`, scaled (keeping the aspect ratio) to fit width x height if given.
+    Returns a null QPixmap for an unknown name.
+    """
+    key = "icon_cache:{}@{}x{}".format(name, width, height)
+    cached = QPixmapCache.find(key)
+    if cached is not None and not cached.isNull():
+        return cached
+    if width or height:
+        pm = pixmap(name)
+        if not pm.isNull():
+            pm = pm.scaled(width or pm.width(), height or pm.height(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    else:
+        pm = QPixmap(resource_path(name))
+    if not pm.isNull():
+        QPixmapCache.insert(key, pm)
+    return pm
+
+
+def icon(name: str) -> QIcon:
+    """ Shared QIcon for resource `name`; Qt scales it per use from the cached pixmap. """
+    ico = _icons.get(name)
+    if ico is None:
+        ico = QIcon(pixmap(name))
+        _icons[name] = ico
+    return ico
+
+
+def clear():
+    """ Drop all cached icons and pixmaps (e.g. after a theme change). """
+    _icons.clear()
+    QPixmapCache.clear()
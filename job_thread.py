@@ -0,0 +1,282 @@
+"""
+Long-lived job thread (QObject.moveToThread pattern) for work that must stay on one thread.
+
+A device handle or a DB connection usually has to be opened, used and closed by the same thread, so it can't go
+through the QThreadPool. `JobThread` owns one QThread for its whole lifetime; a loop object moved into it waits
+on a QWaitCondition while there is nothing to do and is woken by `submit()`:
+
+    jobs = JobThread("db", setup=lambda: sqlite3.connect("app.db"), teardown=lambda conn: conn.close())
+    jobs.resultsReady.connect(on_results)          # [(job_id, result), ...]
+    job_id = jobs.submit(query, "SELECT ...")      # query(sql, context=conn) if it accepts `context`
+    ...
+    jobs.shutdown()                                 # e.g. in closeEvent
+
+Every wake-up takes up to `batch_size` queued jobs under one lock acquisition and reports their results as ONE
+`resultsReady` signal (flushed early if the batch runs longer than `max_latency` seconds), so a stream of small
+jobs costs neither a thread start nor a cross-thread signal per job.
+
+Jobs get `cancel_token` and `progress_callback` keywords like a `Worker` does, if they accept them; `cancel()`
+stops the running job at its next `check()` and drops the queued ones, and the thread carries on with later jobs.
+"""
+import itertools
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from PyQt5.QtCore import (QCoreApplication, QObject, QThread, QMutex, QMutexLocker, QWaitCondition, pyqtSignal,
+                          pyqtSlot)
+from task_engine import CancelToken, TaskCancelled, accepts_kwarg
+
+log = logging.getLogger(__name__)
+
+
+class _JobProgress:
+    """ `progress_callback` of one job: forwards to `JobThread.progress` with the job id. """
+    __slots__ = ("_signal", "job_id")
+
+    def __init__(self, signal, job_id: int):
+        self._signal = signal
+        self.job_id = job_id
+
+    def emit(self, value):
+        self._signal.emit(self.job_id, value)
+
+
+class _JobLoop(QObject):
+    """ Lives in the job thread; `run()` is the thread's whole life. """
+    def __init__(self, owner):
+        super().__init__()
+        self.owner = owner
+
+    @pyqtSlot()
+    def run(self):
+        owner = self.owner
+        threading.current_thread().name = owner.name  # for log records
+        context = None
+        try:
+            if owner.setup is not None:
+                context = owner.setup()
+        except Exception:
+            log.exception("%s: setup failed, the thread stops", owner.name)
+            owner._fail_all(sys.exc_info())
+            return
+        try:
+            while True:
+                batch, token = owner._next_batch()
+                if batch is None:
+                    return  # shut down
+                self._run_batch(batch, token, context)
+        finally:
+            if owner.teardown is not None:
+                try:
+                    owner.teardown(context)
+                except Exception:
+                    log.exception("%s: teardown failed", owner.name)
+
+    def _run_batch(self, batch: list, token: CancelToken, context):
+        owner = self.owner
+        results = []
+        wants = {}  # fn -> injected keywords, inspect.signature() once per function and batch
+        flush_at = time.monotonic() + owner.max_latency
+        for job_id, fn, args, kwargs in batch:
+            if token.is_cancelled():
+                owner.cancelled.emit(job_id)
+                continue
+            try:
+                names = wants[fn]
+            except (KeyError, TypeError):  # TypeError: unhashable callable
+                names = [n for n in ("cancel_token", "progress_callback", "context") if accepts_kwarg(fn, n)]
+                try:
+                    wants[fn] = names
+                except TypeError:
+                    pass
+            if "cancel_token" in names:
+                kwargs["cancel_token"] = token
+            if "progress_callback" in names:
+                kwargs["progress_callback"] = _JobProgress(owner.progress, job_id)
+            if "context" in names and owner.setup is not None:
+                kwargs["context"] = context
+            try:
+                token.check()  # blocks while paused
+                results.append((job_id, fn(*args, **kwargs)))
+            except TaskCancelled:
+                owner.cancelled.emit(job_id)
+            except Exception:
+                log.exception("%s: job %s failed", owner.name, job_id)
+                exctype, value = sys.exc_info()[:2]
+                owner.error.emit(job_id, (exctype, value, traceback.format_exc()))
+            if results and time.monotonic() >= flush_at:  # don't sit on finished results behind a slow job
+                owner.resultsReady.emit(results)
+                results = []
+                flush_at = time.monotonic() + owner.max_latency
+        if results:
+            owner.resultsReady.emit(results)
+        owner._batch_done()
+
+
+class JobThread(QObject):
+    """
+    Supported signals are (emitted from the job thread, so GUI slots get queued calls):
+
+    resultsReady
+        list of (job_id, result) tuples, once per batch (or every `max_latency` seconds within a long batch)
+
+    progress
+        int job_id, object whatever the job passed to `progress_callback.emit()`
+
+    error
+        int job_id, tuple (exctype, value, traceback.format_exc() )
+
+    cancelled
+        int job_id of a job stopped or dropped by `cancel()`
+
+    idle
+        No data; the queue is empty and the thread went to sleep
+
+    :param name: thread name (shows up in logs and debuggers)
+    :param batch_size: jobs taken from the queue per wake-up
+    :param max_latency: seconds a finished result may wait for the rest of its batch
+    :param setup: optional callable run once in the job thread; its return value is passed as `context=` to
+                  jobs that accept it (e.g. a DB connection)
+    :param teardown: optional callable(context) run in the job thread when it shuts down
+    """
+    resultsReady = pyqtSignal(list)
+    progress = pyqtSignal(int, object)
+    error = pyqtSignal(int, tuple)
+    cancelled = pyqtSignal(int)
+    idle = pyqtSignal()
+
+    def __init__(self, name: str = "JobThread", batch_size: int = 64, max_latency: float = 0.05, setup=None,
+                 teardown=None, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.batch_size = max(1, batch_size)
+        self.max_latency = max_latency
+        self.setup = setup
+        self.teardown = teardown
+        self._mutex = QMutex()
+        self._wake = QWaitCondition()
+        self._drained = QWaitCondition()
+        self._queue = deque()  # (job_id, fn, args, kwargs)
+        self._ids = itertools.count(1)
+        self._token = CancelToken()
+        self._busy = 0  # jobs taken by the loop and not finished yet
+        self._stopping = False
+
+        self._thread = QThread()
+        self._thread.setObjectName(name)
+        self._loop = _JobLoop(self)
+        self._loop.moveToThread(self._thread)
+        self._thread.started.connect(self._loop.run)
+        self._thread.start()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def submit(self, fn, *args, **kwargs) -> int:
+        """ Queue `fn(*args, **kwargs)` for the job thread (thread-safe). :return: job id """
+        job_id = next(self._ids)
+        with QMutexLocker(self._mutex):
+            if self._stopping:
+                raise RuntimeError("{}: shut down".format(self.name))
+            self._queue.append((job_id, fn, args, kwargs))
+            self._wake.wakeOne()
+        return job_id
+
+    def pending(self) -> int:
+        """ Jobs queued or running. """
+        with QMutexLocker(self._mutex):
+            return len(self._queue) + self._busy
+
+    def cancel(self) -> int:
+        """ Stop the running job at its next `check()` and drop the queued ones. :return: jobs dropped """
+        with QMutexLocker(self._mutex):
+            dropped = [job[0] for job in self._queue]
+            self._queue.clear()
+            self._token.cancel()
+            self._token = CancelToken()  # for the jobs submitted from now on
+        for job_id in dropped:
+            self.cancelled.emit(job_id)
+        return len(dropped)
+
+    def pause(self):
+        """ Hold the running job at its next `check()`, and the thread before its next job. """
+        with QMutexLocker(self._mutex):
+            self._token.pause()
+
+    def resume(self):
+        with QMutexLocker(self._mutex):
+            self._token.resume()
+
+    def wait_idle(self, timeout_ms: int = -1) -> bool:
+        """ Block until every submitted job is done. Never call this from the GUI thread while jobs emit to it. """
+        deadline = None if timeout_ms < 0 else time.monotonic() + timeout_ms / 1000
+        with QMutexLocker(self._mutex):
+            while self._queue or self._busy:
+                if deadline is None:
+                    self._drained.wait(self._mutex)
+                else:
+                    remaining = int((deadline - time.monotonic()) * 1000)
+                    if remaining <= 0 or not self._drained.wait(self._mutex, remaining):
+                        return False
+            return True
+
+    def shutdown(self, cancel: bool = True, wait_ms: int = 3000) -> bool:
+        """
+        Stop the thread (e.g. from `closeEvent`): with `cancel`, queued jobs are dropped and the running one is
+        cancelled; otherwise the queue is worked off first. :return: True if the thread ended within `wait_ms`
+        """
+        if not self._thread.isRunning():
+            return True
+        if cancel:
+            self.cancel()
+        with QMutexLocker(self._mutex):
+            self._stopping = True
+            self._wake.wakeAll()
+        self._thread.quit()  # the loop returns, then the thread's (not yet started) event loop exits at once
+        return self._thread.wait(wait_ms)
+
+    # -- called by the loop in the job thread --
+
+    def _next_batch(self):
+        """ Sleep until there is work; :return: (jobs, token) or (None, None) when shutting down """
+        announced = False
+        self._mutex.lock()
+        try:
+            while not self._queue:
+                if self._stopping:
+                    return None, None
+                if not announced:  # emit outside the lock: a directly connected slot may submit()
+                    self._mutex.unlock()
+                    try:
+                        self.idle.emit()
+                    finally:
+                        self._mutex.lock()
+                    announced = True
+                    continue
+                self._wake.wait(self._mutex)
+            count = min(self.batch_size, len(self._queue))
+            batch = [self._queue.popleft() for _ in range(count)]
+            self._busy = count
+            return batch, self._token
+        finally:
+            self._mutex.unlock()
+
+    def _batch_done(self):
+        with QMutexLocker(self._mutex):
+            self._busy = 0
+            if not self._queue:
+                self._drained.wakeAll()
+
+    def _fail_all(self, exc_info):
+        """ setup() failed: report every queued job as failed and refuse new ones. """
+        error = (exc_info[0], exc_info[1], "".join(traceback.format_exception(*exc_info)))
+        with QMutexLocker(self._mutex):
+            self._stopping = True
+            failed = [job[0] for job in self._queue]
+            self._queue.clear()
+            self._drained.wakeAll()
+        for job_id in failed:
+            self.error.emit(job_id, error)
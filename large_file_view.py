@@ -0,0 +1,248 @@
+"""
+Read-only, memory-mapped viewer for files too large for a QPlainTextEdit.
+
+The file is `mmap`-ed, never read into memory. A background Worker builds a SPARSE line index (the byte offset of
+every `LINE_INDEX_STRIDE`-th line), so the index costs 8 bytes per 64 lines; to show line n the view seeks to the
+nearest indexed line and scans at most 63 newlines forward in the map. `LargeFileView` only decodes and paints
+the lines that are visible, so memory stays flat and jump-to-line is instant, whatever the file size.
+"""
+import bisect
+import mmap
+import os
+import threading
+from array import array
+import numpy as np
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtGui import QPainter, QFontDatabase, QColor
+from PyQt5.QtWidgets import QAbstractScrollArea
+
+LINE_INDEX_STRIDE = 64
+INDEX_CHUNK_SIZE = 16 << 20  # bytes scanned per step by the index builder
+
+
+class LineIndex:
+    """
+    Sparse line-offset index, filled by `build_line_index()` on a worker and read by the GUI at the same time.
+
+    :ivar offsets: array('q'); offsets[k] is the byte offset of line k * stride
+    :ivar line_count: number of complete lines found so far (+1 for a trailing line without newline once done)
+    """
+    def __init__(self, stride: int = LINE_INDEX_STRIDE):
+        self.stride = stride
+        self.offsets = array('q', [0])
+        self.line_count = 0
+        self.complete = False
+        self._lock = threading.Lock()
+
+    def locate(self, line: int) -> tuple:
+        """ :return: (byte offset of the nearest indexed line at or before `line`, lines left to skip) """
+        k = line // self.stride
+        with self._lock:
+            k = min(k, len(self.offsets) - 1)
+            return self.offsets[k], line - k * self.stride
+
+    def nearest_before(self, offset: int) -> tuple:
+        """ :return: (line number, byte offset) of the last indexed line starting at or before `offset` """
+        with self._lock:
+            k = max(0, bisect.bisect_right(self.offsets, offset) - 1)
+            return k * self.stride, self.offsets[k]
+
+
+def build_line_index(path, index: LineIndex, progress_callback=None, cancel_token=None,
+                     chunk_size: int = INDEX_CHUNK_SIZE):
+    """
+    Worker task: scan `path` for newlines and fill `index` incrementally.
+    Emits (lines_so_far, bytes_done, bytes_total) after every chunk.
+
+    :return: total number of lines
+    """
+    total = os.path.getsize(path)
+    lines = 0
+    pos = 0
+    last_byte = b"\n"
+    with open(path, "rb") as f:
+        while True:
+            if cancel_token is not None:
+                cancel_token.check()
+            data = f.read(chunk_size)
+            if not data:
+                break
+            nl = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == 0x0A).astype(np.int64) + pos
+            # keep only offsets that land on a stride boundary: line numbers (lines + i + 1) % stride == 0
+            stride = index.stride
+            line_numbers_start = lines + 1
+            first = (-line_numbers_start) % stride
+            starts = nl[first::stride] + 1
+            with index._lock:
+                index.offsets.extend(int(x) for x in starts)
+                index.line_count = lines + len(nl)
+            lines += len(nl)
+            pos += len(data)
+            last_byte = data[-1:]
+            if progress_callback is not None:
+                progress_callback.emit((lines, pos, total))
+    if last_byte != b"\n":  # trailing line without newline
+        lines += 1
+    with index._lock:
+        # an index entry pointing at EOF (file ending in "\n" exactly on a stride boundary) is not a line
+        if len(index.offsets) > 1 and index.offsets[-1] >= total:
+            index.offsets.pop()
+        index.line_count = lines
+        index.complete = True
+    return lines
+
+
+class LargeFileView(QAbstractScrollArea):
+    """
+    Virtualized read-only view over an mmap-ed file; call `open(path)` and feed `index` from a Worker running
+    `build_line_index(path, view.index)`. Call `index_updated()` whenever the index grew.
+    """
+    lineChanged = pyqtSignal(int)  # first visible line (0-based)
+
+    def __init__(self, parent=None, encoding: str = "utf-8"):
+        super().__init__(parent)
+        self.encoding = encoding
+        self.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.viewport().setAutoFillBackground(True)
+        self.verticalScrollBar().valueChanged.connect(self._scrolled)
+        self.horizontalScrollBar().valueChanged.connect(lambda _: self.viewport().update())
+        self.path = None
+        self._file = None
+        self._map = None
+        self._max_width = 0
+        self._matches = []  # sorted (byte_start, byte_end) of search matches, see set_matches()
+        self.index = LineIndex()
+
+    def open(self, path):
+        self.close_file()
+        self.path = path
+        self._file = open(path, "rb")
+        if os.fstat(self._file.fileno()).st_size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.index = LineIndex()
+        self._max_width = 0
+        self._matches = []
+        self.verticalScrollBar().setValue(0)
+        self.index_updated()
+
+    def close_file(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.path = None
+
+    def line_count(self) -> int:
+        return self.index.line_count
+
+    def index_updated(self):
+        self._update_scrollbars()
+        self.viewport().update()
+
+    def goto_line(self, line: int):
+        """ Scroll so that `line` (0-based) is the first visible line. """
+        self.verticalScrollBar().setValue(line)
+
+    def line_of_offset(self, offset: int) -> int:
+        """ Line number (0-based) containing byte `offset`. """
+        line, pos = self.index.nearest_before(offset)
+        return line + (self._map[pos:offset].count(b"\n") if self._map is not None else 0)  # < stride lines
+
+    def set_matches(self, matches: list):
+        """ Search matches to highlight, sorted (byte_start, byte_end); only the visible ones are painted. """
+        self._matches = matches
+        self.viewport().update()
+
+    def first_visible_line(self) -> int:
+        return self.verticalScrollBar().value()
+
+    def visible_line_count(self) -> int:
+        return max(1, self.viewport().height() // self.fontMetrics().lineSpacing())
+
+    def lines(self, first: int, count: int) -> list:
+        """ Decode `count` lines starting at line `first`, straight from the map. """
+        return [self._decode(raw) for _, raw in self._raw_lines(first, count)]
+
+    def _decode(self, raw: bytes) -> str:
+        return raw.decode(self.encoding, errors="replace").expandtabs(4)
+
+    def _raw_lines(self, first: int, count: int) -> list:
+        """ :return: [(byte offset, raw bytes without line ending), ...] """
+        mm = self._map
+        if mm is None:
+            return []
+        pos, skip = self.index.locate(first)
+        size = len(mm)
+        for _ in range(skip):
+            nl = mm.find(b"\n", pos)
+            if nl < 0:
+                return []
+            pos = nl + 1
+        out = []
+        while len(out) < count and pos < size:
+            nl = mm.find(b"\n", pos)
+            end = size if nl < 0 else nl
+            raw = mm[pos:end]
+            if raw.endswith(b"\r"):
+                raw = raw[:-1]
+            out.append((pos, raw))
+            pos = end + 1
+        return out
+
+    def _update_scrollbars(self):
+        visible = self.visible_line_count()
+        vbar = self.verticalScrollBar()
+        vbar.setRange(0, max(0, self.index.line_count - visible + 1))
+        vbar.setPageStep(visible)
+        hbar = self.horizontalScrollBar()
+        hbar.setRange(0, max(0, self._max_width - self.viewport().width()))
+        hbar.setPageStep(self.viewport().width())
+
+    def _scrolled(self, value):
+        self.viewport().update()
+        self.lineChanged.emit(value)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scrollbars()
+
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        fm = self.fontMetrics()
+        line_height = fm.lineSpacing()
+        x = 4 - self.horizontalScrollBar().value()
+        y = fm.ascent()
+        widest = self._max_width
+        matches = self._matches
+        highlight = QColor(255, 230, 0)
+        for start, raw in self._raw_lines(self.first_visible_line(), self.visible_line_count() + 1):
+            text = self._decode(raw)
+            # highlight the matches on this line (bisect: only matches in the visible byte range are touched)
+            i = bisect.bisect_left(matches, (start, start))
+            while i < len(matches) and matches[i][0] <= start + len(raw):
+                m_start, m_end = matches[i]
+                left = fm.horizontalAdvance(self._decode(raw[:m_start - start]))
+                width = fm.horizontalAdvance(self._decode(raw[m_start - start:m_end - start]))
+                painter.fillRect(x + left, y - fm.ascent(), max(2, width), line_height, highlight)
+                i += 1
+            painter.drawText(x, y, text)
+            widest = max(widest, fm.horizontalAdvance(text) + 8)
+            y += line_height
+        painter.end()
+        if widest != self._max_width:  # the horizontal range grows with the widest line seen so far
+            self._max_width = widest
+            self._update_scrollbars()
+
+    def keyPressEvent(self, event):
+        vbar = self.verticalScrollBar()
+        actions = {
+            Qt.Key_Down: vbar.SliderSingleStepAdd, Qt.Key_Up: vbar.SliderSingleStepSub,
+            Qt.Key_PageDown: vbar.SliderPageStepAdd, Qt.Key_PageUp: vbar.SliderPageStepSub,
+            Qt.Key_Home: vbar.SliderToMinimum, Qt.Key_End: vbar.SliderToMaximum,
+        }
+        if event.key() in actions:
+            vbar.triggerAction(actions[event.key()])
+        else:
+            super().keyPressEvent(event)
@@ -0,0 +1,61 @@
+"""
+Build widgets on first use instead of at window construction.
+
+`LazyWidget` is an empty placeholder that calls its factory the first time it is shown; put one in a tab or a
+scroll area and the content of a tab nobody opens is never built. With `defer=True` the build waits until the
+event loop is running, so content that IS visible at startup is built right after the window's first paint
+rather than before it. `lazy_menu()` does the same for a menu: it is populated when it is first opened.
+"""
+from PyQt5.QtCore import QTimer, pyqtSignal
+from PyQt5.QtWidgets import QWidget, QVBoxLayout
+
+
+class LazyWidget(QWidget):
+    """
+    Supported signals are:
+
+    built
+        object, the widget returned by the factory
+
+    :param factory: callable returning the real widget, called once
+    :param defer: build on the next event-loop turn after the first show, not during it
+    """
+    built = pyqtSignal(object)
+
+    def __init__(self, factory, defer: bool = False, parent=None):
+        super().__init__(parent)
+        self.factory = factory
+        self.defer = defer
+        self.widget = None
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+
+    def is_built(self) -> bool:
+        return self.widget is not None
+
+    def ensure_built(self):
+        """ Build the content now if it is not built yet; returns it. """
+        if self.widget is None:
+            self.widget = self.factory()
+            self.factory = None  # drop whatever the factory closure holds on to
+            self.layout().addWidget(self.widget)
+            self.built.emit(self.widget)
+        return self.widget
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.widget is None:
+            if self.defer:
+                QTimer.singleShot(0, self.ensure_built)
+            else:
+                self.ensure_built()
+
+
+def lazy_menu(menu, populate):
+    """ Call `populate(menu)` right before `menu` is shown for the first time. """
+    def first_show():
+        menu.aboutToShow.disconnect(first_show)
+        populate(menu)
+    menu.aboutToShow.connect(first_show)
+    return menu
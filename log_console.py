@@ -0,0 +1,295 @@
+"""
+Log / console widget for millions of lines.
+
+Lines live in a `LineBuffer`, a fixed-capacity ring (the oldest lines are dropped, so memory is bounded) that
+numbers every line with an increasing sequence number. `LogModel` exposes it as a QAbstractListModel: appends
+arrive in batches and become ONE beginInsertRows/endInsertRows (plus one beginRemoveRows for the lines that fell
+out of the ring), and the view uses uniform item sizes, so a batch costs the same whatever the line count and
+only the visible rows are ever laid out or painted.
+
+Filtering the whole buffer runs on a TaskEngine worker over a snapshot; lines that arrive meanwhile are matched as
+they come in, and the filtered view (a list of sequence numbers) is swapped in when the worker is done.
+
+    console = LogConsole(capacity=1_000_000)
+    console.append("text")                         # thread-safe, flushed to the view every `flush_ms`
+    add_handler(console.handler())                 # log_pipeline: show the application log in it
+"""
+import bisect
+import logging
+import re
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, pyqtSignal
+from PyQt5.QtGui import QColor, QFontDatabase
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QLabel, QListView
+from task_engine import Worker, shared_engine
+from signal_adapters import Coalescer, debounce
+
+_LEVEL_COLORS = {logging.WARNING // 10: QColor(170, 110, 0), logging.ERROR // 10: QColor(200, 0, 0),
+                 logging.CRITICAL // 10: QColor(200, 0, 0), logging.DEBUG // 10: QColor(128, 128, 128)}
+
+
+class LineBuffer:
+    """
+    Ring of the last `capacity` lines, with a level byte per line. Line `seq` (0, 1, 2, ... since creation) is
+    available while `first_seq <= seq < next_seq`. Not thread-safe: owned by the GUI thread.
+    """
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._lines = [None] * capacity
+        self._levels = bytearray(capacity)
+        self.first_seq = 0
+        self.next_seq = 0
+
+    def __len__(self):
+        return self.next_seq - self.first_seq
+
+    def line(self, seq: int) -> str:
+        return self._lines[seq % self.capacity]
+
+    def level(self, seq: int) -> int:
+        return self._levels[seq % self.capacity]
+
+    def drop(self, count: int):
+        """ Forget the `count` oldest lines. """
+        for seq in range(self.first_seq, self.first_seq + count):
+            self._lines[seq % self.capacity] = None
+        self.first_seq += count
+
+    def extend(self, lines: list, levels: list):
+        """ Append; the caller must `drop()` first so that the lines fit. """
+        cap = self.capacity
+        for text, level in zip(lines, levels):
+            i = self.next_seq % cap
+            self._lines[i] = text
+            self._levels[i] = level
+            self.next_seq += 1
+        self.first_seq = max(self.first_seq, self.next_seq - cap)
+
+    def snapshot(self) -> list:
+        """ All lines, oldest first (a copy; the ring keeps changing). """
+        start, end = self.first_seq % self.capacity, self.next_seq % self.capacity
+        if len(self) == self.capacity:
+            return self._lines[start:] + self._lines[:start]
+        if start <= end:
+            return self._lines[start:end]
+        return self._lines[start:] + self._lines[:end]
+
+
+def filter_lines(lines: list, first_seq: int, pattern, cancel_token) -> list:
+    """ Worker task: sequence numbers of the lines matching `pattern` """
+    out = []
+    search = pattern.search
+    for offset in range(0, len(lines), 65536):
+        cancel_token.check()
+        out.extend(first_seq + offset + i for i, text in enumerate(lines[offset:offset + 65536]) if search(text))
+    return out
+
+
+class LogModel(QAbstractListModel):
+    """
+    Supported signals are:
+
+    filterFinished
+        No data; the filtered view is up to date
+    """
+    filterFinished = pyqtSignal()
+
+    def __init__(self, capacity: int = 1_000_000, engine=None, parent=None):
+        super().__init__(parent)
+        self.buffer = LineBuffer(capacity)
+        self.engine = engine if engine is not None else shared_engine()
+        self.pattern = None  # compiled regex of the active filter, None = show everything
+        self._rows = None  # filtered view: sorted sequence numbers, None without a filter
+        self._filtering = None  # TaskHandle of the running filter worker
+        self._late = []  # seqs matching the new pattern that arrived while its worker ran
+        self._generation = 0
+
+    # -- Qt model interface --
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.buffer) if self._rows is None else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        seq = self._seq(index.row())
+        if role == Qt.DisplayRole:
+            return self.buffer.line(seq)
+        if role == Qt.ForegroundRole:
+            return _LEVEL_COLORS.get(self.buffer.level(seq))
+        return None
+
+    def _seq(self, row: int) -> int:
+        return self.buffer.first_seq + row if self._rows is None else self._rows[row]
+
+    # -- appending --
+
+    def append_lines(self, lines: list, levels: list):
+        """ Bulk append (GUI thread). """
+        buf = self.buffer
+        if not lines:
+            return
+        if len(lines) >= buf.capacity:
+            lines, levels = lines[-buf.capacity:], levels[-buf.capacity:]
+        overflow = max(0, len(buf) + len(lines) - buf.capacity)
+        first_new = buf.next_seq
+        if self._rows is None:
+            if len(lines) == buf.capacity:
+                self.beginResetModel()
+                buf.drop(len(buf))
+                buf.extend(lines, levels)
+                self.endResetModel()
+                return
+            if overflow:
+                self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+                buf.drop(overflow)
+                self.endRemoveRows()
+            n = len(buf)
+            self.beginInsertRows(QModelIndex(), n, n + len(lines) - 1)
+            buf.extend(lines, levels)
+            self.endInsertRows()
+            return
+
+        buf.drop(overflow)
+        buf.extend(lines, levels)
+        search = self.pattern.search
+        matches = [first_new + i for i, text in enumerate(lines) if search(text)]
+        if self._filtering is not None:  # the worker's result will replace the view anyway
+            self._late.extend(matches)
+            return
+        gone = bisect.bisect_left(self._rows, buf.first_seq)
+        if gone:
+            self.beginRemoveRows(QModelIndex(), 0, gone - 1)
+            del self._rows[:gone]
+            self.endRemoveRows()
+        if matches:
+            n = len(self._rows)
+            self.beginInsertRows(QModelIndex(), n, n + len(matches) - 1)
+            self._rows.extend(matches)
+            self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.buffer.drop(len(self.buffer))
+        if self._rows is not None:
+            self._rows = []
+        self.endResetModel()
+
+    # -- filtering --
+
+    def set_filter(self, text: str, regex: bool = False, case_sensitive: bool = False):
+        """ Show only lines containing `text` (a regex with `regex=True`); empty text shows everything. """
+        self._generation += 1
+        if self._filtering is not None:
+            self._filtering.cancel()
+            self._filtering = None
+        if not text:
+            self.pattern = None
+            self.beginResetModel()
+            self._rows = None
+            self.endResetModel()
+            self.filterFinished.emit()
+            return
+        self.pattern = re.compile(text if regex else re.escape(text), 0 if case_sensitive else re.IGNORECASE)
+        if self._rows is None:
+            self.beginResetModel()
+            self._rows = []  # empty until the worker is done
+            self.endResetModel()
+        self._late = []
+        generation = self._generation
+        worker = Worker(filter_lines, self.buffer.snapshot(), self.buffer.first_seq, self.pattern)
+        worker.signals.result.connect(lambda rows, g=generation: self._filter_done(g, rows))
+        self._filtering = self.engine.start(worker)
+
+    def _filter_done(self, generation: int, rows: list):
+        if generation != self._generation:
+            return  # a newer filter was set meanwhile
+        self._filtering = None
+        first = self.buffer.first_seq
+        rows = rows[bisect.bisect_left(rows, first):] + [s for s in self._late if s >= first]
+        self._late = []
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+        self.filterFinished.emit()
+
+
+class ConsoleHandler(logging.Handler):
+    """ logging.Handler feeding a LogConsole; format() runs in the emitting (or log_pipeline's writer) thread. """
+    def __init__(self, console, level=logging.NOTSET):
+        super().__init__(level)
+        self.console = console
+
+    def emit(self, record):
+        try:
+            self.console.append(self.format(record), record.levelno)
+        except Exception:
+            self.handleError(record)
+
+
+class LogConsole(QWidget):
+    """
+    :param capacity: lines kept; older ones are dropped
+    :param flush_ms: pending lines are handed to the model at most this often
+    :param engine: TaskEngine for filtering; default `shared_engine()`
+    """
+    def __init__(self, capacity: int = 1_000_000, flush_ms: int = 50, engine=None, parent=None):
+        super().__init__(parent)
+        self.model = LogModel(capacity, engine, self)
+        self.view = QListView()
+        self.view.setModel(self.model)
+        self.view.setUniformItemSizes(True)  # row height from the first row: no per-row layout
+        self.view.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.view.setEditTriggers(QListView.NoEditTriggers)
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Filter")
+        self.filter_edit.setClearButtonEnabled(True)
+        debounce(self.filter_edit.textChanged, self.model.set_filter, 250, parent=self)
+        self.count_label = QLabel()
+        top = QHBoxLayout()
+        top.addWidget(self.filter_edit)
+        top.addWidget(self.count_label)
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(top)
+        layout.addWidget(self.view)
+        self.setLayout(layout)
+
+        self._coalescer = Coalescer(self._deliver, list, flush_ms, self)  # pending: [(lines, level), ...]
+        self.model.filterFinished.connect(self._filter_finished)
+
+    def append(self, text: str, level: int = logging.INFO):
+        """ Thread-safe; `text` may hold several lines. """
+        self._coalescer.post(list.append, (text.splitlines() or [""], level // 10))
+
+    def handler(self, level=logging.NOTSET) -> ConsoleHandler:
+        handler = ConsoleHandler(self, level)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(name)s: %(message)s"))
+        return handler
+
+    def flush(self):
+        """ Timer slot: move the pending lines into the model, one bulk insert. """
+        self._coalescer.flush()
+
+    def _deliver(self, batch: list):
+        lines, levels = [], []
+        for chunk, level in batch:
+            lines.extend(chunk)
+            levels.extend([level] * len(chunk))
+        bar = self.view.verticalScrollBar()
+        follow = bar.value() >= bar.maximum()  # only auto-scroll when already at the bottom
+        self.model.append_lines(lines, levels)
+        if follow:
+            self.view.scrollToBottom()
+        self._update_count()
+
+    def _filter_finished(self):
+        self._update_count()
+        self.view.scrollToBottom()
+
+    def _update_count(self):
+        total = len(self.model.buffer)
+        shown = self.model.rowCount()
+        self.count_label.setText("{} lines".format(total) if shown == total and self.model.pattern is None
+                                 else "{} of {} lines".format(shown, total))
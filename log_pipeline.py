@@ -0,0 +1,143 @@
+"""
+Non-blocking logging for the demos.
+
+Handlers and workers log through the standard `logging` module, but the only handler they ever reach is a
+`QueueHandler` that puts the LogRecord on a `queue.SimpleQueue` (a C-level queue, no Python lock). A background
+`QueueListener` thread does all the expensive work: %-formatting the message (deferred, so a DEBUG call that is
+filtered out by its level costs one comparison, and an accepted one costs one queue put), formatting the line and
+writing it to the console and to a size-rotated log file. Slow stdout never blocks the GUI or a pool thread.
+Only messages whose arguments are all immutable (str, numbers, None, ...) are %-formatted late; anything else,
+e.g. a list or a dict that the caller keeps changing, is rendered in the calling thread, as it is at the call.
+
+    log = logging.getLogger(__name__)
+    log.info("slider_click(): signal = %s, sli_num = %s", signal, sli_num)   # arguments, not str.format()!
+
+    setup_logging("INFO", log_file="demo.log", levels={"task_engine": "DEBUG"})   # once, in __main__
+
+Per-module levels also come from the environment: PYQT_DEMO_LOG_LEVELS="task_engine=DEBUG,PyQt_ex=WARNING".
+The file gets one JSON object per line (time, level, logger, thread, message and any `extra={...}` fields), the
+console the usual human-readable line.
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+CONSOLE_FORMAT = "%(asctime)s %(levelname)-7s %(threadName)s %(name)s: %(message)s"
+LEVELS_ENV = "PYQT_DEMO_LOG_LEVELS"
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+_IMMUTABLE_ARGS = (str, int, float, bytes, type(None))  # safe to %-format later in the listener thread
+
+_listener = None
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that enqueues the record unformatted. The stock `prepare()` formats the message in the emitting
+    thread (to make the record picklable); in-process that work can wait for the listener thread, except the
+    %-formatting of mutable arguments: by then they may have changed, so those messages are rendered right away.
+    """
+    def prepare(self, record):
+        args = record.args
+        if args and not all(isinstance(a, _IMMUTABLE_ARGS) for a in (args.values() if isinstance(args, dict)
+                                                                     else args)):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """ One JSON object per record; `extra={...}` fields are included as top-level keys. """
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record), "level": record.levelname, "logger": record.name,
+            "thread": record.threadName, "message": record.getMessage(),
+        }
+        entry.update({k: v for k, v in vars(record).items() if k not in _RECORD_ATTRS})
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def parse_levels(spec: str) -> dict:
+    """ "a=DEBUG,b.c=WARNING" -> {"a": "DEBUG", "b.c": "WARNING"} """
+    levels = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, level = item.partition("=")
+        levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logging(level="INFO", log_file: str = None, levels: dict = None, max_bytes: int = 10 << 20,
+                  backups: int = 3, console: bool = True):
+    """
+    Route all logging through the queue and start the writer thread. Calling it again reconfigures.
+
+    :param level: root level
+    :param log_file: optional path of the rotating JSON-lines log
+    :param levels: per-logger levels, e.g. {"task_engine": "DEBUG"}; PYQT_DEMO_LOG_LEVELS overrides them
+    :param max_bytes: size at which the log file is rotated
+    :param backups: number of rotated files kept
+    :return: the QueueListener
+    """
+    global _listener
+    stop_logging()
+
+    handlers = []
+    if console:
+        stream = logging.StreamHandler(sys.stdout)
+        stream.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+        handlers.append(stream)
+    if log_file:
+        rotating = logging.handlers.RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backups,
+                                                        encoding="utf-8", delay=True)
+        rotating.setFormatter(JsonFormatter())
+        handlers.append(rotating)
+
+    records = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(DeferredQueueHandler(records))
+    root.setLevel(level)
+    levels = dict(levels or {})
+    levels.update(parse_levels(os.environ.get(LEVELS_ENV, "")))
+    for name, module_level in levels.items():
+        logging.getLogger(name).setLevel(module_level)
+
+    _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def add_handler(handler: logging.Handler):
+    """
+    Add a handler behind the queue (it runs in the writer thread), e.g. a `log_console.LogConsole.handler()`.
+    Without `setup_logging()` it is added to the root logger directly.
+    """
+    if _listener is not None:
+        _listener.handlers = _listener.handlers + (handler,)
+    else:
+        logging.getLogger().addHandler(handler)
+
+
+def remove_handler(handler: logging.Handler):
+    if _listener is not None:
+        _listener.handlers = tuple(h for h in _listener.handlers if h is not handler)
+    logging.getLogger().removeHandler(handler)
+
+
+def stop_logging():
+    """ Flush everything still queued and stop the writer thread (registered with atexit). """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_logging)
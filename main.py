@@ -1,7 +1,33 @@
+import time
+T_START = time.perf_counter()  # as early as possible: everything below counts as startup
+
 import sys
 import traceback
+from PyQt5.QtCore import QObject, QEvent
 from PyQt5.QtWidgets import QApplication
 from PyQt_ex import MainWindow
+from stall_watchdog import install_watchdog
+from log_pipeline import setup_logging
+
+T_IMPORTED = time.perf_counter()
+
+
+class StartupReport(QObject):
+    """
+    Prints import / construction / first-paint times once the first Paint event reaches any widget.
+    Install with `app.installEventFilter(report)`; it removes itself after the first paint.
+    """
+    def __init__(self, t_created: float, parent=None):
+        super().__init__(parent)
+        self.t_created = t_created
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            t_paint = time.perf_counter()
+            QApplication.instance().removeEventFilter(self)
+            print("Startup: imports {:.0f} ms, window construction {:.0f} ms, first paint after {:.0f} ms".format(
+                (T_IMPORTED - T_START) * 1000, (self.t_created - T_IMPORTED) * 1000, (t_paint - T_START) * 1000))
+        return False
 
 
 def excepthook(exc_type, exc_value, exc_tb):
@@ -12,6 +38,7 @@ def excepthook(exc_type, exc_value, exc_tb):
 
 if __name__ == "__main__":
     sys.excepthook = excepthook
+    setup_logging("INFO", log_file="main.log")
 
     # You need one (and only one) QApplication instance per application.
     # Pass in sys.argv to allow command line arguments for your app.
@@ -19,8 +46,14 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
 
     # Create a Qt widget, which will be our window.
-    window = MainWindow()
+    # By default hidden tabs, the scroll-area content and the menus are built on first use; --eager builds
+    # everything up front (to compare startup times)
+    window = MainWindow(lazy="--eager" not in sys.argv)
+    report = StartupReport(time.perf_counter())
+    app.installEventFilter(report)
     window.show()  # IMPORTANT!!!!! Windows are hidden by default.
+    if "--watchdog" in sys.argv:  # report event-loop stalls (with the blocking stack) to stalls.jsonl
+        watchdog = install_watchdog(window, dump_path="stalls.jsonl")
 
     # Start the event loop.
     app.exec()
@@ -0,0 +1,172 @@
+"""
+Process-pool backend for CPU-bound Worker tasks.
+
+Threads on the QThreadPool share the GIL with the GUI thread, so numeric Python code there neither scales nor
+leaves the window responsive. `ProcessBackend` runs `Worker` tasks in a `concurrent.futures.ProcessPoolExecutor`
+and feeds the usual `WorkerSignals` (started / progress / result / error / finished) from a relay thread:
+
+    child process  --(task_id, kind, value) over a multiprocessing.Queue-->  relay thread  --signals-->  GUI
+
+`fn`, args and kwargs must be picklable (module-level functions, plain data). Processes are started with the
+"spawn" method, because forking a process that already runs Qt threads is not safe.
+"""
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, CancelledError
+from concurrent.futures.process import BrokenProcessPool
+from task_engine import TaskStatus, emit_finished
+
+log = logging.getLogger(__name__)
+
+_STARTED, _PROGRESS, _END, _STOP = 0, 1, 2, 3
+
+_child_queue = None  # set in every worker process by _init_child()
+
+
+def _init_child(queue):
+    global _child_queue
+    _child_queue = queue
+
+
+class _ProgressRelay:
+    """ Stand-in for `signals.progress` inside the worker process; same `emit()` call as the real signal. """
+    def __init__(self, task_id: int):
+        self.task_id = task_id
+
+    def emit(self, value):
+        _child_queue.put((self.task_id, _PROGRESS, value))
+
+
+def _run_in_child(task_id, fn, args, kwargs, wants_progress):
+    _child_queue.put((task_id, _STARTED, None))
+    if wants_progress:
+        kwargs = dict(kwargs, progress_callback=_ProgressRelay(task_id))
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        _child_queue.put((task_id, _END, None))
+
+
+def _warm_up(delay: float):
+    # Keep each process busy for a moment so the warm-up calls spread over all workers
+    time.sleep(delay)
+    return os.getpid()
+
+
+class ProcessBackend:
+    """
+    :param max_workers: number of worker processes; None means os.cpu_count()
+    :param warm_up: start all worker processes right away instead of on the first submitted tasks; the processes
+                    boot in the background, the constructor does not wait for them
+    :param mp_context: multiprocessing context; defaults to "spawn"
+    """
+    def __init__(self, max_workers: int = None, warm_up: bool = True, mp_context=None):
+        ctx = mp_context if mp_context is not None else multiprocessing.get_context("spawn")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._queue = ctx.Queue()
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=ctx,
+                                             initializer=_init_child, initargs=(self._queue,))
+        self._lock = threading.Lock()
+        self._tasks = {}  # task_id -> [worker, future, end_marker_seen]
+        self._relay = threading.Thread(target=self._relay_loop, name="ProcessBackend-relay", daemon=True)
+        self._relay.start()
+        if warm_up:
+            self.warm_up()
+
+    def warm_up(self, delay: float = 0.05) -> list:
+        """
+        Spawn every worker process now, so the interpreter + import cost is paid before the first real task.
+        Does not block (safe on the GUI thread); returns the warm-up futures, whose results are the worker pids.
+        """
+        return [self._executor.submit(_warm_up, delay) for _ in range(self.max_workers)]
+
+    def submit(self, worker):
+        task_id = worker.handle.task_id
+        with self._lock:
+            entry = self._tasks[task_id] = [worker, None, False]
+        future = self._executor.submit(_run_in_child, task_id, worker.fn, worker.args, worker.kwargs,
+                                       worker.wants_progress)
+        entry[1] = future
+        future.add_done_callback(lambda f, tid=task_id: self._future_done(tid, f))
+
+    def cancel(self, worker) -> bool:
+        with self._lock:
+            entry = self._tasks.get(worker.handle.task_id)
+        return entry is not None and entry[1] is not None and entry[1].cancel()
+
+    def shutdown(self, wait: bool = True):
+        """ Cancel queued tasks and stop the worker processes and the relay thread. """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        self._queue.put((None, _STOP, None))
+        if wait:
+            self._relay.join()
+
+    # -- relay thread / executor callback thread --
+
+    def _relay_loop(self):
+        while True:
+            task_id, kind, value = self._queue.get()
+            if kind == _STOP:
+                return
+            with self._lock:
+                entry = self._tasks.get(task_id)
+            if entry is None:
+                continue
+            worker = entry[0]
+            handle = worker.handle
+            if kind == _STARTED:
+                if handle._set_running() and handle.signals is not None:
+                    worker.signals.started.emit()
+            elif kind == _PROGRESS:
+                # a cancelled or dropped task may have released its WorkerSignals to the next task already
+                if not handle.done() and handle.signals is not None:
+                    worker.progress_callback.emit(value)
+            elif kind == _END:
+                with self._lock:
+                    entry[2] = True
+                    complete = entry[1] is not None and entry[1].done()
+                if complete:
+                    self._complete(task_id)
+
+    def _future_done(self, task_id, future):
+        with self._lock:
+            entry = self._tasks.get(task_id)
+            if entry is None:
+                return
+            # progress and the end marker travel through the queue, the return value through the executor;
+            # only finish once both arrived so `finished` really is the last signal
+            complete = entry[2] or future.cancelled() or isinstance(future.exception(), BrokenProcessPool)
+        if complete:
+            self._complete(task_id)
+
+    def _complete(self, task_id):
+        with self._lock:
+            entry = self._tasks.pop(task_id, None)
+        if entry is None:
+            return
+        worker, future = entry[0], entry[1]
+        handle = worker.handle
+        try:
+            result = future.result()
+        except CancelledError:
+            if not handle.done():  # handle.cancel() may have settled it already
+                handle._set_cancelled()
+            return
+        except Exception as e:
+            if handle.status is TaskStatus.CANCELLED:
+                return
+            tb = "".join(traceback.format_exception(type(e), e, e.__traceback__))
+            log.error("process task %s failed:\n%s", handle.task_id, tb)
+            error = (type(e), e, tb)
+            handle._set_error(error)
+            worker.signals.error.emit(error)
+        else:
+            if handle.status is TaskStatus.CANCELLED:  # cancelled after it had already been handed to a process
+                return
+            handle._set_result(result)
+            worker.signals.result.emit(result)
+        emit_finished(worker.signals, handle)
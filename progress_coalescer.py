@@ -0,0 +1,86 @@
+"""
+Progress coalescing: workers may report progress as often as they like, the GUI sees at most `hz` batches/s.
+
+Every `progress_callback.emit()` of a plain Worker is a queued cross-thread signal, i.e. one event in the GUI
+event queue and one slot call (usually a `setText`) per report. With many busy workers that floods the queue.
+`ProgressCoalescer.post()` instead stores the value in a dict (latest value per key wins) and a timer in the GUI
+thread delivers everything that changed since the last tick as ONE `updated(dict)` signal.
+
+    coalescer = ProgressCoalescer(hz=30)
+    coalescer.updated.connect(lambda batch: ...)          # {key: latest value}
+    worker = Worker(fn, progress_callback=coalescer.sink(key))
+"""
+import itertools
+from PyQt5.QtCore import QObject, pyqtSignal
+from signal_adapters import Coalescer
+
+
+class ProgressSink:
+    """ Drop-in replacement for `WorkerSignals.progress` that posts to a ProgressCoalescer under a fixed key. """
+    __slots__ = ("_coalescer", "key")
+
+    def __init__(self, coalescer, key):
+        self._coalescer = coalescer
+        self.key = key
+
+    def emit(self, value):
+        self._coalescer.post(self.key, value)
+
+
+class ProgressCoalescer(QObject):
+    """
+    Supported signals are:
+
+    updated
+        dict {key: latest value} of every key posted since the previous batch
+
+    Counters (read them from the GUI thread, e.g. in a slot connected to `updated`):
+
+    posted
+        number of `post()` calls
+    delivered
+        number of values handed out through `updated`
+    merged
+        values overwritten by a newer one before delivery (posted - delivered - pending)
+
+    :param hz: maximum number of `updated` batches per second
+    """
+    updated = pyqtSignal(dict)
+
+    def __init__(self, hz: float = 30, parent=None):
+        super().__init__(parent)
+        self._keys = itertools.count()
+        self.delivered = 0
+        self.batches = 0
+        self._coalescer = Coalescer(self._deliver, dict, max(1, int(1000 / hz)), self)
+
+    @property
+    def posted(self) -> int:
+        return self._coalescer.posted
+
+    @property
+    def merged(self) -> int:
+        coalescer = self._coalescer
+        with coalescer.lock:
+            return coalescer.posted - self.delivered - len(coalescer.pending)
+
+    def sink(self, key=None) -> ProgressSink:
+        """ :return: object with `emit(value)`, pass it as `progress_callback`; key=None picks a unique int """
+        return ProgressSink(self, next(self._keys) if key is None else key)
+
+    def post(self, key, value):
+        """ Thread-safe; only the latest value per key survives until the next tick. """
+        self._coalescer.post(dict.__setitem__, key, value)
+
+    def flush(self):
+        """ Deliver pending values now (GUI thread). Stops the timer when there is nothing left to deliver. """
+        self._coalescer.flush()
+
+    def _deliver(self, batch: dict):
+        self.delivered += len(batch)
+        self.batches += 1
+        self.updated.emit(batch)
+
+    def stats(self) -> str:
+        return "progress: posted {}, delivered {} in {} batches, merged {}".format(
+            self.posted, self.delivered, self.batches, self.merged)
@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x03\x49\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
+\x79\x71\xc9\x65\x3c\x00\x00\x02\xeb\x49\x44\x41\x54\x78\xda\x94\
+\x92\xcb\x4f\x13\x51\x14\xc6\xbf\xce\x4c\x5b\xa6\xb4\x85\x22\x83\
+\xa0\x28\xd0\xb4\x94\x40\x45\x04\x22\x46\x40\x12\x02\x0b\x45\x43\
+\xc2\xa2\x84\x44\xa3\x7f\x02\x6e\x5c\xf8\xd8\x18\x75\xe5\x1a\xd9\
+\xb0\x11\x08\x09\x31\x84\xd0\x90\x18\x83\x10\x82\x0b\x01\x43\x28\
+\xaf\x14\x2c\x50\xa0\x52\x40\x1e\x01\xa6\x8f\x69\x69\xc7\x7b\x07\
+\x21\x68\xdc\xf8\x25\xdf\x3c\xee\x39\xbf\x73\xee\x9c\x3b\xaa\xde\
+\x27\x0c\x78\x8d\x2a\x83\x63\x51\x07\x20\x1b\xc7\xf2\x1e\xc5\xd0\
+\x6f\x7f\x1d\xaf\xa4\x2f\x33\xcf\x98\x91\x7f\xc5\x43\x11\xd9\xcf\
+\x49\x51\x64\xaa\xd4\x89\xcf\xaf\x96\x3b\x2a\xd2\x2f\x17\x9a\x25\
+\x29\x8c\x81\xfe\x9e\x03\xb5\xe4\x6d\x88\x63\x73\x9f\x66\x4b\xac\
+\xf0\x48\xd4\x66\x17\xd7\xd4\x35\x18\xb5\xda\x04\x6c\xac\x4e\x2d\
+\xb9\x86\xbb\x4b\xa5\xa8\xf8\x8a\x3b\x08\xca\x0f\xf3\x6f\xd5\xd7\
+\x26\x09\x36\xf3\xaa\x77\x05\xa3\xa3\x63\x38\x57\xd8\xc8\x5b\xec\
+\x95\xb7\x35\x8f\x2d\x4a\xbb\xbc\x9f\x1e\x78\x66\x46\xd0\xd7\xdb\
+\x83\xb2\xb2\xeb\x10\xce\xdb\x0a\xcc\xa5\xf5\xfc\xd7\x8f\x1d\x6b\
+\x5c\x30\x82\x12\x99\x61\x32\xa7\x5d\x63\x98\x9f\xf7\x22\xa9\xfa\
+\x0d\xac\x76\x3b\x92\x75\x3a\x4c\x4f\x4e\xe2\x4a\x51\x11\x4c\x69\
+\x56\x58\x6f\x5c\x84\xa8\xb7\x63\x78\xf0\x29\x6c\xb6\x6c\x24\x9b\
+\x74\x99\x94\x65\xc8\x77\xf0\xb1\xf0\xae\xca\xe5\x72\x2b\x70\xae\
+\xd5\x0a\x23\xcf\x2b\x9d\x27\xc6\xc7\x71\x22\xba\x46\x63\x34\x87\
+\xe6\x52\x86\xb2\x4c\x24\x8a\xb9\xc1\xa1\x29\x49\x28\x72\xc0\x6c\
+\x36\x43\xa7\xd1\x80\x51\xa9\x14\x28\x1c\x0e\x9f\x16\xa0\x6b\x34\
+\x66\xb1\x58\x20\x5c\x73\x80\x32\x94\xe5\x64\x19\x2d\x87\x3b\x2b\
+\x55\x59\xf9\x37\x4b\x68\xe2\x41\x28\xa4\x98\xca\xed\x76\x63\x65\
+\x7b\x1b\x7f\x2b\xb7\xb0\x0a\x6e\xe7\x8b\x79\xd2\xa6\x85\xb3\xce\
+\xa9\x16\x73\xe7\xb0\xc5\xbe\xbc\x10\x8b\x01\x2c\x4d\xc8\x4a\x4d\
+\x55\x12\x0f\x0f\x0f\x4f\x9f\xa9\x8e\xe2\x71\xfc\xd8\xdd\x45\xa2\
+\x31\x33\x76\xf7\x83\x6a\x6b\x21\x1f\x8b\x9c\x79\x8e\x04\x80\x88\
+\x9a\x61\x10\x3b\x03\xdf\xa9\xa9\x41\x75\x75\x35\x1e\x34\x36\xc2\
+\x60\x30\x28\xd6\xeb\xf5\x28\x2e\x2f\x47\x79\x59\x99\xc2\x50\x96\
+\x8b\x1e\x17\xf7\x27\xae\xad\x05\x90\x93\x63\x3c\xe9\xd6\xd5\xdd\
+\x8d\xfb\x4d\x4d\xe8\xe8\xea\x3a\xdd\x81\x4c\xbc\x1f\x89\x80\xf5\
+\xf9\x02\x84\xf3\x2b\xb3\xa1\x05\x88\xbf\x45\x9d\xce\x4d\x8e\x65\
+\x95\x6d\x52\x25\xa5\xa4\x28\x30\xbd\x9f\x58\x9f\x9c\x0c\x2d\x39\
+\x8d\x70\x5f\xdf\xa6\xc2\xd0\x02\x11\x3a\x6d\xa0\x7f\xab\xbd\x7d\
+\x21\xc1\xe7\x13\x63\xbf\x0b\x9c\x14\x39\xab\x38\x89\x25\x6d\x6c\
+\x88\xbe\xb6\xb6\x05\xca\x50\x96\x8d\x1d\x6f\x4d\x34\x84\x42\x7b\
+\xfb\x43\x43\x79\xe9\xb5\xb5\x29\x5a\x41\xd0\xc8\xb2\xfc\x07\xcc\
+\x92\x19\xc9\xcb\xcb\x81\x49\x87\x63\x3a\xb0\xbe\xfe\x76\x16\x98\
+\xfc\x44\xd7\x67\xc8\xe5\x33\xf1\x90\x20\x5c\xde\x16\x45\xab\xb1\
+\xb3\x73\x07\xa2\xc8\x1a\x32\x32\xd4\xbc\xc9\xc4\x91\x73\x96\x23\
+\x1e\x4f\x70\xa5\xb5\xd5\x3f\xd1\xdc\xec\x7a\x1f\x08\x6c\xbe\x33\
+\x1a\x47\x9d\xc1\xe0\x32\x65\xe9\x1f\xa3\x25\x36\xf3\x3c\x7f\x8f\
+\x6c\x71\xcb\x22\x49\x6b\x35\x40\x85\x15\x28\x50\x03\x19\x38\x9e\
+\x91\xff\x3b\x30\x3b\x00\x7c\xf1\x68\xb5\x97\x18\x86\x49\x0b\x85\
+\x42\x4e\x12\x5a\xa2\x05\x38\x62\x13\xb1\x1a\xff\x27\x3a\xc3\xbd\
+\x5f\x02\x0c\x00\x86\x47\x3c\xf2\x75\x83\xfc\x12\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x06\xea\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
+\x79\x71\xc9\x65\x3c\x00\x00\x03\x69\x69\x54\x58\x74\x58\x4d\x4c\
+\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
+\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\x65\x67\
+\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\x57\x35\x4d\
+\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\
+\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\x6d\x70\x6d\
+\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\
+\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\
+\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\x4d\x50\x20\
+\x43\x6f\x72\x65\x20\x35\x2e\x30\x2d\x63\x30\x36\x30\x20\x36\x31\
+\x2e\x31\x33\x34\x37\x37\x37\x2c\x20\x32\x30\x31\x30\x2f\x30\x32\
+\x2f\x31\x32\x2d\x31\x37\x3a\x33\x32\x3a\x30\x30\x20\x20\x20\x20\
+\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\
+\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\
+\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\
+\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\x3a\x44\x65\
+\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\
+\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\
+\x52\x69\x67\x68\x74\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\
+\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\
+\x31\x2e\x30\x2f\x72\x69\x67\x68\x74\x73\x2f\x22\x20\x78\x6d\x6c\
+\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\x22\x68\x74\x74\x70\x3a\x2f\
+\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\
+\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\x22\x20\x78\x6d\x6c\x6e\x73\
+\x3a\x73\x74\x52\x65\x66\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\
+\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\
+\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\x2f\x52\x65\x73\x6f\x75\x72\
+\x63\x65\x52\x65\x66\x23\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\
+\x70\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\
+\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x22\
+\x20\x78\x6d\x70\x52\x69\x67\x68\x74\x73\x3a\x4d\x61\x72\x6b\x65\
+\x64\x3d\x22\x46\x61\x6c\x73\x65\x22\x20\x78\x6d\x70\x4d\x4d\x3a\
+\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\
+\x64\x69\x64\x3a\x44\x35\x34\x42\x31\x30\x35\x38\x38\x34\x33\x32\
+\x31\x31\x45\x30\x38\x43\x36\x42\x42\x43\x42\x41\x39\x34\x30\x39\
+\x42\x31\x31\x30\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x49\x6e\x73\x74\
+\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\
+\x44\x35\x34\x42\x31\x30\x35\x37\x38\x34\x33\x32\x31\x31\x45\x30\
+\x38\x43\x36\x42\x42\x43\x42\x41\x39\x34\x30\x39\x42\x31\x31\x30\
+\x22\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\
+\x6c\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\
+\x6f\x70\x20\x43\x53\x33\x20\x57\x69\x6e\x64\x6f\x77\x73\x22\x3e\
+\x20\x3c\x78\x6d\x70\x4d\x4d\x3a\x44\x65\x72\x69\x76\x65\x64\x46\
+\x72\x6f\x6d\x20\x73\x74\x52\x65\x66\x3a\x69\x6e\x73\x74\x61\x6e\
+\x63\x65\x49\x44\x3d\x22\x75\x75\x69\x64\x3a\x41\x43\x31\x46\x32\
+\x45\x38\x33\x33\x32\x34\x41\x44\x46\x31\x31\x41\x41\x42\x38\x43\
+\x35\x33\x39\x30\x44\x38\x35\x42\x35\x42\x33\x22\x20\x73\x74\x52\
+\x65\x66\x3a\x64\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x75\
+\x75\x69\x64\x3a\x43\x39\x44\x33\x34\x39\x36\x36\x34\x41\x33\x43\
+\x44\x44\x31\x31\x42\x30\x38\x41\x42\x42\x42\x43\x46\x46\x31\x37\
+\x32\x31\x35\x36\x22\x2f\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\
+\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\
+\x3a\x52\x44\x46\x3e\x20\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\
+\x61\x3e\x20\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\
+\x3d\x22\x72\x22\x3f\x3e\x75\x91\xf2\xca\x00\x00\x03\x17\x49\x44\
+\x41\x54\x78\xda\x6c\x93\x4b\x6c\x13\x47\x18\xc7\xff\xfb\x88\x1d\
+\x7b\xbd\x24\x36\xf6\x3a\x8e\x9d\xc4\xb1\xd5\x44\x0d\x0a\x79\x00\
+\x32\x82\x4a\x20\xf5\xd0\xaa\x2d\xf4\xda\x13\xca\x0d\x4e\x54\x3d\
+\x15\xa9\xd7\x4a\x95\x7a\xe5\x08\x87\x9c\xb8\x21\x84\x10\x8f\x20\
+\xb5\x07\x50\x91\xd2\x24\x0a\x21\x0f\x4c\xed\x98\x38\x75\x70\xe2\
+\xac\x77\xfd\x88\xd7\xeb\xb5\xbd\xdb\x6f\x9d\x22\x45\x11\x2b\xfd\
+\x76\x56\xb3\xf3\xfb\xbe\x99\xf9\x66\x98\x9b\x09\x16\xc7\x9e\x00\
+\x71\x89\x88\x10\x5d\x44\x99\xd8\x23\xde\x58\xc0\x76\xdb\x44\x9b\
+\xda\xce\xcb\x22\xf8\xe3\xb2\xa7\xc7\x37\xf3\xf5\x0f\x37\xbe\x1f\
+\x1c\x9d\x98\xe0\x38\xde\xa9\x6b\x55\x35\x9f\x4d\x67\x97\x5f\x3e\
+\x5b\x4c\xad\x2d\xbe\xa3\x31\x2b\xc4\x97\xc4\x36\x71\x87\x4b\x44\
+\x98\xa3\x01\xbe\xb9\x3a\xf3\xd3\xcc\xc0\xe8\xe4\x45\xd3\xb4\x1c\
+\xfb\xb2\xcc\xb9\x3d\xa2\x20\x7a\x03\xe1\xf8\x78\x62\x5a\x8a\x0c\
+\x4b\xff\x66\x92\xce\x1f\x7f\x9b\xbd\xf5\xe4\xe1\xfd\xb2\xde\x66\
+\x1e\x1c\x9f\x41\x64\x88\x32\xb7\x4c\x13\xf9\x7c\x1e\x63\x63\x63\
+\x28\x16\x8b\x90\x65\x19\xd1\x68\x94\x1b\x9b\xbe\x70\xb6\xb7\x2f\
+\x7a\xf6\xf7\x5b\xd7\x67\x4d\x0b\x8f\x09\x70\xd7\x3e\xb3\xe0\xef\
+\xea\x70\x86\xf8\xa5\x50\x2d\x47\x77\xde\xbf\x83\xd4\x17\x82\x49\
+\x2b\xb4\x03\xc5\xe3\x71\xa4\xd3\x69\x64\x32\x19\xf8\xfd\x7e\xb0\
+\x1c\xcf\xe5\x33\xab\x25\x9e\xc5\x0b\xee\xdb\x68\x27\x73\x88\xb8\
+\x17\x1a\x8c\x7b\xa3\x43\xc3\x5e\xc6\xa8\x21\xfb\xcf\x6b\x64\xd3\
+\x1b\xf0\x05\x07\xa0\x96\xab\xd8\xdd\xdd\x45\x2c\x16\x43\x2a\x95\
+\x42\x6c\xe4\xf3\x40\xee\x7d\x4a\x51\xd5\xd2\x9a\x1d\x40\x24\xf9\
+\xf6\xe8\xd4\xf9\x89\xc8\xc8\xf8\x80\x45\xd3\xe7\xa8\xc3\xc9\x30\
+\xd0\x4a\x0a\x92\xcb\x8b\xa8\xd6\x9b\x18\x3f\x73\xae\x23\x87\xc3\
+\x61\xa8\xaa\xca\xf0\x8e\xee\xae\xb7\x1b\x6b\x65\x7b\x0f\xae\xf4\
+\x0d\xc6\x13\x81\x48\x2c\xd8\x6c\x36\xd1\x68\x34\xa0\x69\x1a\x6a\
+\x07\x07\xb0\x1a\x3a\x50\x2b\x21\xf9\xc7\x53\x38\x5c\x1e\x8c\x9c\
+\x9e\x80\xa2\x28\x70\x38\x1c\x08\xf4\x0f\xf4\x19\x6d\x9c\x62\x5b\
+\x6d\x7c\xd5\x3f\x3c\x2a\x1d\x95\x0f\x48\xae\x54\x2a\x28\x95\x4a\
+\xb0\x4c\x03\x82\xd3\x42\xfa\xe5\x73\x14\xe5\xfd\x8e\x6c\x8f\x71\
+\x0b\xa2\x9b\xce\x41\x88\x35\x9a\x88\x75\x7b\x4e\xb8\x3f\x25\xeb\
+\xba\x0e\xa7\x4b\x40\x7f\xd8\x0f\xce\x90\x51\xdb\xdf\xe9\xfc\x93\
+\x24\x09\x4d\x83\xf2\x03\x3a\xdb\x68\x02\x76\xf6\x4f\xc9\x1e\x9f\
+\x84\x13\xde\x93\xe8\xf1\xfa\x10\x0c\x06\xb0\xf5\xfa\x2f\xf4\xf6\
+\xf6\x76\xc6\xa6\x92\xeb\xf6\xe9\x5c\xe3\x75\x03\x19\x45\x2e\x4e\
+\xd6\x1b\xba\xe7\xa8\xec\x8b\xc4\x21\x08\x02\x15\x92\x12\x19\x1a\
+\x44\x51\x44\xf1\x43\x01\x7a\xbd\x6e\x90\x5c\x78\xf1\xe7\xdc\x12\
+\x05\xb8\x6b\x07\x98\x7b\xbb\x9a\xfe\xa2\x3f\x2a\x79\x3e\xca\xa1\
+\x91\x49\x08\x62\x0f\xd8\xb6\x8e\x66\xb9\xd0\xa9\xf3\xdf\x0b\xf9\
+\xcc\x66\x46\x51\x5f\x65\x7f\xcd\xd9\x99\x6d\x99\xd8\xe2\x37\x2b\
+\x78\xa4\x6e\xe4\xbe\x6b\x98\x8c\xe0\x72\x23\xc8\xb2\x2c\x5c\x2e\
+\x17\x9c\x0e\x1e\xda\xee\xa1\xbc\xba\x5e\xd8\x5b\x4f\x2a\x6a\x09\
+\xb8\x5e\x55\xac\xa5\x8f\xc7\x36\x5d\xb4\x4b\x6e\x60\x4a\x68\xe1\
+\xda\xe6\x76\x65\xa5\xa1\x33\xdd\x3e\x9f\xd8\xe5\x84\xce\xb7\xb4\
+\x8a\x25\x17\xeb\xb5\x57\xf3\xb9\xdc\xe2\xca\xde\x3c\xdd\xa0\x9f\
+\xb7\x80\x0f\x4a\xdd\x72\x12\x1c\x61\xc7\x30\x19\x1f\x8b\xcb\xb0\
+\x20\x51\xc5\x77\x86\x2c\x24\xfc\xc0\x39\xee\xf0\x2a\xdb\xab\xcf\
+\xc9\xc0\x42\x16\x98\xd7\x68\xc7\xa9\xab\x45\xd0\x27\xaa\xff\x53\
+\xff\x4f\x80\x01\x00\x37\xdf\x9d\x82\x66\xda\x09\x59\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x05\xa3\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
+\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
+\x79\x71\xc9\x65\x3c\x00\x00\x03\x69\x69\x54\x58\x74\x58\x4d\x4c\
+\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
+\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\x65\x67\
+\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\x57\x35\x4d\
+\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\
+\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\x6d\x70\x6d\
+\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\
+\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\
+\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\x4d\x50\x20\
+\x43\x6f\x72\x65\x20\x35\x2e\x30\x2d\x63\x30\x36\x30\x20\x36\x31\
+\x2e\x31\x33\x34\x37\x37\x37\x2c\x20\x32\x30\x31\x30\x2f\x30\x32\
+\x2f\x31\x32\x2d\x31\x37\x3a\x33\x32\x3a\x30\x30\x20\x20\x20\x20\
+\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\
+\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\
+\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\
+\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\x3a\x44\x65\
+\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\
+\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\
+\x52\x69\x67\x68\x74\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\
+\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\
+\x31\x2e\x30\x2f\x72\x69\x67\x68\x74\x73\x2f\x22\x20\x78\x6d\x6c\
+\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\x22\x68\x74\x74\x70\x3a\x2f\
+\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\
+\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\x22\x20\x78\x6d\x6c\x6e\x73\
+\x3a\x73\x74\x52\x65\x66\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\
+\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\
+\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\x2f\x52\x65\x73\x6f\x75\x72\
+\x63\x65\x52\x65\x66\x23\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\
+\x70\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\
+\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x22\
+\x20\x78\x6d\x70\x52\x69\x67\x68\x74\x73\x3a\x4d\x61\x72\x6b\x65\
+\x64\x3d\x22\x46\x61\x6c\x73\x65\x22\x20\x78\x6d\x70\x4d\x4d\x3a\
+\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\
+\x64\x69\x64\x3a\x30\x37\x35\x37\x30\x42\x31\x32\x39\x33\x35\x45\
+\x31\x31\x45\x30\x39\x41\x31\x33\x38\x38\x44\x36\x35\x45\x44\x45\
+\x32\x32\x45\x41\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x49\x6e\x73\x74\
+\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\
+\x30\x37\x35\x37\x30\x42\x31\x31\x39\x33\x35\x45\x31\x31\x45\x30\
+\x39\x41\x31\x33\x38\x38\x44\x36\x35\x45\x44\x45\x32\x32\x45\x41\
+\x22\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\
+\x6c\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\
+\x6f\x70\x20\x43\x53\x33\x20\x57\x69\x6e\x64\x6f\x77\x73\x22\x3e\
+\x20\x3c\x78\x6d\x70\x4d\x4d\x3a\x44\x65\x72\x69\x76\x65\x64\x46\
+\x72\x6f\x6d\x20\x73\x74\x52\x65\x66\x3a\x69\x6e\x73\x74\x61\x6e\
+\x63\x65\x49\x44\x3d\x22\x75\x75\x69\x64\x3a\x41\x43\x31\x46\x32\
+\x45\x38\x33\x33\x32\x34\x41\x44\x46\x31\x31\x41\x41\x42\x38\x43\
+\x35\x33\x39\x30\x44\x38\x35\x42\x35\x42\x33\x22\x20\x73\x74\x52\
+\x65\x66\x3a\x64\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x75\
+\x75\x69\x64\x3a\x43\x39\x44\x33\x34\x39\x36\x36\x34\x41\x33\x43\
+\x44\x44\x31\x31\x42\x30\x38\x41\x42\x42\x42\x43\x46\x46\x31\x37\
+\x32\x31\x35\x36\x22\x2f\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\
+\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\
+\x3a\x52\x44\x46\x3e\x20\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\
+\x61\x3e\x20\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\
+\x3d\x22\x72\x22\x3f\x3e\x7e\xbb\xdb\x2e\x00\x00\x01\xd0\x49\x44\
+\x41\x54\x78\xda\x9c\x53\x3b\x4e\xc3\x40\x10\x7d\x76\x36\x31\x24\
+\x21\x10\x22\xa5\xe0\x00\x14\x34\x14\x8e\xa0\x45\x42\xa2\xa0\x87\
+\x06\x2a\x0a\xe7\x0a\x5c\x00\x89\x0b\x80\x94\x95\xa0\xa2\x22\x37\
+\xe0\x0c\x49\xc1\x15\xd2\x93\x3f\x02\x3b\xfe\x30\x6f\x9d\x8f\x95\
+\x8e\xac\x34\xda\xcf\xcc\x7b\x3b\xf3\x76\xd6\x7a\x3a\x43\x0b\x80\
+\x8b\xcd\x46\x57\xc5\x09\xdc\x8b\xeb\x3b\x43\x90\xcf\xe7\x51\x28\
+\x14\xcc\xac\x94\x82\x65\x59\x26\x2a\x0c\x43\x63\xb3\xd9\xcc\x18\
+\xd7\xf4\x7d\xbc\xbf\x42\x45\x31\x10\x04\x01\x5a\x8f\x6f\xdd\xff\
+\x5c\xdd\xbc\xbf\x75\x89\x55\x51\x04\xc4\x71\x8c\xed\x6d\x08\x3b\
+\x1a\xdc\xd7\x6a\x00\x2f\x97\x63\xd8\x36\xf0\xfd\x9d\x82\x4a\x25\
+\xc0\xf7\x4d\x5c\x87\x18\xc6\x9a\x0c\x22\x59\x15\x8b\x02\x3c\xb0\
+\xe1\x08\x91\x3f\x8c\x3d\x21\xf0\xe4\x58\xe7\x72\xf0\x04\xd8\x24\
+\x81\xe3\xa0\x95\x24\xd0\x5f\x5f\x29\x86\x58\x9b\x2c\xdc\x48\xc9\
+\x04\xb7\x25\xae\x3d\x1e\xc3\xbb\xbc\xf1\xdc\xe9\x34\x9d\x7f\x7f\
+\xd1\xa2\x71\x4d\x1f\x63\x0d\x81\x60\xed\x70\x9e\x81\xdc\x84\xd0\
+\xc7\x95\x10\x5c\x8d\x46\xd0\xcf\x0f\xba\x3b\x99\xa4\xb3\x80\x9b\
+\x34\xae\xe9\x63\x2c\x31\xc4\xaa\x30\x5a\x11\x04\x53\x2a\x0a\xec\
+\xec\x40\x0b\x91\x66\xcd\xbd\x1e\xf4\x6e\xcd\xc2\x96\x4a\x30\x18\
+\xa0\xc1\xdb\x59\x96\x21\x30\x19\x84\x2b\x02\x3a\x44\x9b\x4e\xa5\
+\x02\xaf\x5a\x45\x47\x5e\xd3\x3b\x72\x6d\x54\x84\x40\x6a\x37\x67\
+\xe5\x32\xbc\x65\x06\x21\x09\xe6\x19\x50\xed\xf5\xda\xb9\xa7\x26\
+\x59\x5d\x38\x33\x76\x99\xc1\x2c\x53\xc2\x7a\xed\xdc\x53\x93\xac\
+\x2e\x59\x0d\x88\x55\xd9\x0c\xea\x75\xe8\x9f\x1f\xe8\xfd\x7d\xa0\
+\xdf\x87\x36\xbd\x31\x8e\x4d\x0f\x2c\x7c\x3c\x93\xd8\xa5\x06\xca\
+\x0f\xd2\x46\x62\xe3\x88\xb3\xc3\x00\x0e\x92\x64\x07\xcf\x17\x3e\
+\x0e\x62\x88\x55\xfd\x09\xc5\xcb\xe1\xf0\xf4\xdc\x75\xa4\x53\x16\
+\xff\xc0\x66\x4a\xf3\x91\x88\x82\xa9\x68\xe9\x7f\x60\xeb\xf3\x2f\
+\x10\x6b\x9d\xe4\xf1\x52\xb5\x70\xbc\xc9\x57\x1c\x24\xf8\xe4\x77\
+\x2b\x88\xed\x89\xa9\x7f\xe2\xe5\x11\x31\xfc\x13\x60\x00\x80\xb9\
+\x27\x59\x25\xdf\x24\x39\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x6f\xa6\x53\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x0f\
+\x04\xbf\x83\x87\
+\x00\x61\
+\x00\x6c\x00\x61\x00\x72\x00\x6d\x00\x2d\x00\x63\x00\x6c\x00\x6f\x00\x63\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x06\x91\x98\x07\
+\x00\x61\
+\x00\x63\x00\x6f\x00\x72\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x0a\xca\xa7\xa7\
+\x00\x61\
+\x00\x62\x00\x61\x00\x63\x00\x75\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x02\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x34\x00\x00\x00\x00\x00\x01\x00\x00\x03\x4d\
+\x00\x00\x00\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x3b\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x92\x90\x5d\x3e\xb8\
+\x00\x00\x00\x34\x00\x00\x00\x00\x00\x01\x00\x00\x03\x4d\
+\x00\x00\x01\x92\x90\x5d\x3e\xb8\
+\x00\x00\x00\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x3b\
+\x00\x00\x01\x92\x90\x5d\x3e\xb8\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
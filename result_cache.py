@@ -0,0 +1,209 @@
+"""
+Opt-in memoization of task results, for `Worker(fn, *args, cache=ResultCache(...))`.
+
+Key: the function's qualified name + a hash of the pickled args / kwargs (the injected `progress_callback` and
+`cancel_token` are not part of it; for a bound method the pickled instance is). Tasks whose arguments (or instance)
+can't be pickled simply run uncached. Only use it for functions whose result depends on nothing but their arguments
+(and, for a method, the state of its instance).
+
+Lookups, in order:
+  1. memory - an LRU of `max_entries` results, each valid for `ttl` seconds; checked in `TaskEngine.start()`,
+     a hit runs a trivial task returning the stored value (same signals, no work)
+  2. in flight - an identical task is queued or running: the new one doesn't run at all, it is finished with
+     the leader's outcome (single-flight); if the leader is cancelled, the waiting tasks run themselves
+  3. disk - with `disk_path`, a SQLite table that survives restarts; checked on the pool thread (or in the worker
+     process) right before `fn` would run
+
+Results of FINISHED tasks are stored in memory and, if picklable, on disk.
+"""
+import collections
+import hashlib
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+import types
+
+log = logging.getLogger(__name__)
+
+_NOT_INJECTED = ("progress_callback", "cancel_token")
+
+
+def cached_value(value):
+    """ Task body for a memory hit. """
+    return value
+
+
+def _fn_name(fn) -> str:
+    fn = getattr(fn, "__func__", fn)  # bound method -> function
+    return "{}.{}".format(getattr(fn, "__module__", "?"), getattr(fn, "__qualname__", repr(fn)))
+
+
+class _DiskStore:
+    """ SQLite tier; one connection shared under a lock (every process opens its own). """
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS results "
+                         "(key TEXT PRIMARY KEY, fn TEXT, value BLOB, stored REAL, expires REAL)")
+        self._writes = 0
+
+    def get(self, key: str):
+        """ :return: (hit, value) """
+        with self._lock:
+            row = self._db.execute("SELECT value, expires FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None or (row[1] is not None and row[1] < time.time()):
+            return False, None
+        return True, pickle.loads(row[0])
+
+    def put(self, key: str, fn_name: str, value, ttl: float = None):
+        try:
+            blob = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return  # not picklable: memory only
+        now = time.time()
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                             (key, fn_name, blob, now, now + ttl if ttl is not None else None))
+            self._writes += 1
+            if self._writes % 100 == 0:  # prune now and then, not on every write
+                self._db.execute("DELETE FROM results WHERE expires < ?", (now,))
+                self._db.execute("DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY stored DESC "
+                                 "LIMIT -1 OFFSET ?)", (self.max_entries,))
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM results")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class DiskCachedCall:
+    """ Picklable wrapper around `fn`: return the disk-tier value if there is one, else call `fn`. """
+    def __init__(self, fn, key: str, disk_path: str):
+        self.fn = fn
+        self.key = key
+        self.disk_path = disk_path
+
+    def __call__(self, *args, **kwargs):
+        try:
+            hit, value = _disk_store(self.disk_path).get(self.key)
+        except Exception as e:
+            log.warning("result cache %s unreadable: %s", self.disk_path, e)
+            hit = False
+        if hit:
+            log.debug("disk cache hit for %s", self.key)
+            return value
+        return self.fn(*args, **kwargs)
+
+
+_disk_stores = {}
+_disk_stores_lock = threading.Lock()
+
+
+def _disk_store(path: str, max_entries: int = 10000) -> _DiskStore:
+    """ One store per path per process (worker processes open their own). """
+    with _disk_stores_lock:
+        store = _disk_stores.get(path)
+        if store is None:
+            store = _disk_stores[path] = _DiskStore(path, max_entries)
+        return store
+
+
+class ResultCache:
+    """
+    :param max_entries: results kept in memory (least recently used ones are evicted)
+    :param ttl: seconds a result stays valid (memory and disk); None = forever
+    :param disk_path: optional SQLite file for the persistent tier
+    :param disk_max_entries: rows kept in the SQLite file
+    """
+    def __init__(self, max_entries: int = 256, ttl: float = None, disk_path: str = None,
+                 disk_max_entries: int = 10000):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.disk_path = disk_path
+        self._disk = _disk_store(disk_path, disk_max_entries) if disk_path else None
+        self._lock = threading.Lock()
+        self._memory = collections.OrderedDict()  # key -> (value, expires or None)
+        self._inflight = {}  # key -> [leader worker, follower workers...]
+        self.hits = 0
+        self.misses = 0
+        self.joined = 0
+
+    def key(self, fn, args: tuple, kwargs: dict):
+        """ :return: cache key, or None if the arguments (or a bound method's instance) can't be pickled """
+        # a.compute(x) and b.compute(x) must not share a result: the instance is part of the key
+        instance = getattr(fn, "__self__", None)
+        if isinstance(instance, types.ModuleType):  # builtin function such as len: not bound to an object
+            instance = None
+        try:
+            blob = pickle.dumps((instance, args, sorted((k, v) for k, v in kwargs.items() if k not in _NOT_INJECTED)),
+                                pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return None
+        return "{}:{}".format(_fn_name(fn), hashlib.sha256(blob).hexdigest())
+
+    def lookup(self, key: str):
+        """ Memory tier only. :return: (hit, value) """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[1] is None or entry[1] > time.monotonic():
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return True, entry[0]
+                del self._memory[key]
+            return False, None
+
+    def join(self, key: str, worker) -> bool:
+        """ Register `worker` for `key`; True if it is the leader (must run), False if it waits for one. """
+        with self._lock:
+            waiting = self._inflight.get(key)
+            if waiting is None:
+                self._inflight[key] = [worker]
+                self.misses += 1
+                return True
+            waiting.append(worker)
+            self.joined += 1
+            return False
+
+    def leave(self, key: str, worker) -> list:
+        """ The leader `worker` is done: :return: the workers that waited for it ([] if `worker` isn't leader) """
+        with self._lock:
+            waiting = self._inflight.get(key)
+            if not waiting or waiting[0] is not worker:
+                return []
+            del self._inflight[key]
+            return waiting[1:]
+
+    def store(self, key: str, value):
+        with self._lock:
+            self._memory[key] = (value, time.monotonic() + self.ttl if self.ttl is not None else None)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+        if self._disk is not None:
+            try:
+                self._disk.put(key, key.partition(":")[0], value, self.ttl)
+            except sqlite3.Error as e:
+                log.warning("result cache %s not writable: %s", self.disk_path, e)
+
+    def wrap(self, fn, key: str):
+        """ `fn` with the disk tier in front of it (unchanged without one). """
+        return DiskCachedCall(fn, key, self.disk_path) if self._disk is not None else fn
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def stats(self) -> str:
+        return "cache: {} hits, {} misses, {} joined in flight, {} in memory".format(
+            self.hits, self.misses, self.joined, len(self._memory))
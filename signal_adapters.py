@@ -0,0 +1,192 @@
+"""
+Rate-limiting adapters that sit between a signal and an expensive slot.
+
+    throttle(slider.valueChanged, self.recompute, 100, parent=self)   # at most one call per 100 ms
+    debounce(edit.textChanged, self.search, 250, parent=self)         # one call 250 ms after the last change
+    latest(worker.signals.progress, self.show, parent=self)           # one call per event-loop turn
+
+Every adapter remembers only the LATEST arguments it was called with, so the slot always sees the current value
+and never a backlog. Adapters are QObjects: give them a parent (usually the window) so they live as long as the
+connection and their timers stop with it. They are callables too, so they can be used where a slot is expected
+or called directly from other code.
+
+`Coalescer` is the thread-safe batching core of LatestValue, also used by FrameScheduler, ProgressCoalescer and
+LogConsole: many posts from any thread, one wake-up signal per burst, one delivery per tick.
+"""
+import threading
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+class Throttle(QObject):
+    """
+    Call `fn` at most once per `interval_ms`.
+
+    :param leading: call immediately when idle (a single click / key press reacts without delay)
+    :param trailing: after the interval, call once more with the latest arguments if calls were dropped, so the
+                     final value of a drag is never lost
+    """
+    def __init__(self, fn, interval_ms: int = 100, leading: bool = True, trailing: bool = True, parent=None):
+        super().__init__(parent)
+        self.fn = fn
+        self.leading = leading
+        self.trailing = trailing
+        self.calls = 0
+        self.forwarded = 0
+        self._pending = None  # latest args waiting for the trailing call
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._expired)
+
+    def __call__(self, *args):
+        self.calls += 1
+        if self._timer.isActive():
+            self._pending = args
+            return
+        self._timer.start()
+        if self.leading:
+            self._forward(args)
+        else:
+            self._pending = args
+
+    def _expired(self):
+        args, self._pending = self._pending, None
+        if args is not None and self.trailing:
+            self._timer.start()  # keep throttling while calls keep coming
+            self._forward(args)
+
+    def _forward(self, args):
+        self.forwarded += 1
+        self.fn(*args)
+
+    def cancel(self):
+        """ Drop a pending trailing call. """
+        self._timer.stop()
+        self._pending = None
+
+
+class Debounce(QObject):
+    """ Call `fn` once, with the latest arguments, after `delay_ms` without any further call. """
+    def __init__(self, fn, delay_ms: int = 250, parent=None):
+        super().__init__(parent)
+        self.fn = fn
+        self.calls = 0
+        self.forwarded = 0
+        self._pending = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def __call__(self, *args):
+        self.calls += 1
+        self._pending = args
+        self._timer.start()  # restarts a running timer
+
+    def flush(self):
+        """ Make the pending call now, if there is one. """
+        self._timer.stop()
+        args, self._pending = self._pending, None
+        if args is not None:
+            self.forwarded += 1
+            self.fn(*args)
+
+    def cancel(self):
+        self._timer.stop()
+        self._pending = None
+
+
+class Coalescer(QObject):
+    """
+    Collect updates from any thread and deliver them in batches, in the thread of this object.
+
+    `post(merge, *args)` calls `merge(pending, *args)` under the lock. Only the first post after an idle period
+    emits the (queued) wake-up signal, which starts a timer here; every tick swaps the pending batch for an empty
+    one and calls `deliver(batch)` outside the lock. A tick that finds nothing stops the timer until the next post.
+
+    :param deliver: called with each non-empty batch
+    :param empty: factory of an empty batch (a container: an empty one is falsy)
+    :param interval_ms: tick interval; 0 delivers once per event-loop turn
+    """
+    _wake = pyqtSignal()
+
+    def __init__(self, deliver, empty=dict, interval_ms: int = 0, parent=None):
+        super().__init__(parent)
+        self.deliver = deliver
+        self.empty = empty
+        self.lock = threading.Lock()  # guards `pending` and `posted`
+        self.pending = empty()
+        self.posted = 0
+        self._armed = False
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+        self._wake.connect(self._timer.start)  # queued when posted from another thread
+
+    def post(self, merge, *args):
+        """ Thread-safe; `merge(pending, *args)` runs under the lock, so keep it short. """
+        with self.lock:
+            merge(self.pending, *args)
+            self.posted += 1
+            if self._armed:
+                return
+            self._armed = True
+        self._wake.emit()
+
+    def flush(self):
+        """ Deliver the pending batch now (this object's thread). Stops the timer when there is nothing. """
+        with self.lock:
+            batch, self.pending = self.pending, self.empty()
+            if not batch:
+                self._armed = False
+                self._timer.stop()
+                return
+        self.deliver(batch)
+
+
+def _replace(pending: list, args: tuple):
+    pending[:] = [args]
+
+
+class LatestValue(QObject):
+    """
+    Call `fn` once per event-loop turn with the latest arguments. Thread-safe: calls from worker threads are
+    collapsed and `fn` runs in the thread of this object (the GUI thread when created there).
+    """
+    def __init__(self, fn, parent=None):
+        super().__init__(parent)
+        self.fn = fn
+        self.forwarded = 0
+        self._coalescer = Coalescer(self._run, list, 0, self)  # 0: let the rest of a burst arrive first
+
+    @property
+    def calls(self) -> int:
+        return self._coalescer.posted
+
+    def __call__(self, *args):
+        self._coalescer.post(_replace, args)
+
+    def _run(self, batch: list):
+        self.forwarded += 1
+        self.fn(*batch[0])
+
+
+def throttle(signal, slot, interval_ms: int = 100, parent=None, **kwargs) -> Throttle:
+    """ Connect `signal` to `slot` through a Throttle; returns the adapter. """
+    adapter = Throttle(slot, interval_ms, parent=parent, **kwargs)
+    signal.connect(adapter)
+    return adapter
+
+
+def debounce(signal, slot, delay_ms: int = 250, parent=None) -> Debounce:
+    """ Connect `signal` to `slot` through a Debounce; returns the adapter. """
+    adapter = Debounce(slot, delay_ms, parent=parent)
+    signal.connect(adapter)
+    return adapter
+
+
+def latest(signal, slot, parent=None) -> LatestValue:
+    """ Connect `signal` to `slot` through a LatestValue; returns the adapter. """
+    adapter = LatestValue(slot, parent=parent)
+    signal.connect(adapter)
+    return adapter
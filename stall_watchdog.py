@@ -0,0 +1,168 @@
+"""
+Opt-in GUI event-loop stall detector.
+
+A heartbeat QTimer in the GUI thread fires every `heartbeat_ms`; how late each beat arrives is the event-loop
+latency (what a click or a repaint would have waited). A monitor thread watches the time of the last beat: when
+it is more than `threshold_ms` old, the GUI thread is blocked, and the monitor grabs the GUI thread's Python stack
+(`sys._current_frames()`) WHILE it is blocked, so the stall is attributed to the handler that caused it. When the
+beats resume, the stall is recorded with its duration, appended to `dump_path` (one JSON object per line) and
+counted in the p50/p95/p99 latency summary emitted through `updated`. When the watchdog stops (at the latest when
+the application quits), that summary is appended to `dump_path` as a last line.
+
+    watchdog = install_watchdog(window, dump_path="stalls.jsonl")  # adds a label to window's status bar
+
+The overhead is one timer event per `heartbeat_ms` and one short sleep loop in the monitor thread.
+"""
+import collections
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QApplication, QLabel
+
+log = logging.getLogger(__name__)
+
+
+def _percentile(values: list, p: float) -> float:
+    k = min(len(values) - 1, max(0, int(round(p / 100 * (len(values) - 1)))))
+    return values[k]
+
+
+class StallWatchdog(QObject):
+    """
+    Supported signals are:
+
+    updated
+        str, latency summary, every `report_ms`
+
+    stalled
+        dict, a finished stall: {"time", "duration_ms", "stack"}; stack is None if the monitor thread could not
+        sample it (e.g. the GUI thread held the GIL in a C extension for the whole stall)
+
+    :param heartbeat_ms: heartbeat interval
+    :param threshold_ms: beats later than this count as a stall
+    :param dump_path: optional file; every stall is appended to it as a line of JSON, and the latency percentiles
+                      when the watchdog stops
+    :param samples: latency samples kept for the percentiles
+    """
+    updated = pyqtSignal(str)
+    stalled = pyqtSignal(dict)
+
+    def __init__(self, heartbeat_ms: int = 50, threshold_ms: int = 200, dump_path: str = None,
+                 report_ms: int = 1000, samples: int = 2000, parent=None):
+        super().__init__(parent)
+        self.heartbeat_ms = heartbeat_ms
+        self.threshold_ms = threshold_ms
+        self.dump_path = dump_path
+        self.latencies = collections.deque(maxlen=samples)  # ms, how late each beat was
+        self.stalls = collections.deque(maxlen=100)
+        self._lock = threading.Lock()
+        self._last_beat = time.perf_counter()
+        self._captured = None  # (beat time, stack) sampled by the monitor during the current stall
+        self._gui_ident = None
+        self._stop = threading.Event()
+        self._monitor = None
+
+        self._beat = QTimer(self)
+        self._beat.setTimerType(Qt.PreciseTimer)
+        self._beat.setInterval(heartbeat_ms)
+        self._beat.timeout.connect(self._heartbeat)
+        self._report = QTimer(self)
+        self._report.setInterval(report_ms)
+        self._report.timeout.connect(lambda: self.updated.emit(self.summary()))
+
+    def start(self):
+        """ Call from the GUI thread. """
+        self._gui_ident = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stop.clear()
+        self._monitor = threading.Thread(target=self._watch, name="StallWatchdog", daemon=True)
+        self._monitor.start()
+        self._beat.start()
+        self._report.start()
+
+    def stop(self):
+        self._beat.stop()
+        self._report.stop()
+        self._stop.set()
+        if self._monitor is not None:
+            self._monitor.join(1)
+            self._monitor = None
+            self._dump({"time": time.time(), "percentiles_ms": self.percentiles(), "stalls": len(self.stalls)})
+
+    def _heartbeat(self):
+        now = time.perf_counter()
+        with self._lock:
+            gap_ms = (now - self._last_beat) * 1000
+            self._last_beat = now
+            captured, self._captured = self._captured, None
+        self.latencies.append(max(0.0, gap_ms - self.heartbeat_ms))
+        if gap_ms - self.heartbeat_ms > self.threshold_ms:
+            stall = {"time": time.time() - gap_ms / 1000, "duration_ms": round(gap_ms - self.heartbeat_ms, 1),
+                     "stack": captured}
+            self.stalls.append(stall)
+            self._dump(stall)
+            self.stalled.emit(stall)
+
+    def _watch(self):
+        """ Monitor thread: sample the GUI thread's stack once per stall, while it is stalled. """
+        poll = self.heartbeat_ms / 2000
+        while not self._stop.wait(poll):
+            with self._lock:
+                last = self._last_beat
+                late_ms = (time.perf_counter() - last) * 1000 - self.heartbeat_ms
+                if late_ms < self.threshold_ms or self._captured is not None:
+                    continue
+            frame = sys._current_frames().get(self._gui_ident)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else None
+            with self._lock:
+                if self._last_beat == last:  # still the same stall
+                    self._captured = stack
+
+    def _dump(self, stall: dict):
+        if not self.dump_path:
+            return
+        try:
+            with open(self.dump_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(stall) + "\n")
+        except OSError as e:
+            log.warning("StallWatchdog: can't write %s: %s", self.dump_path, e)
+
+    def percentiles(self) -> dict:
+        values = sorted(self.latencies)
+        if not values:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        return {"p50": _percentile(values, 50), "p95": _percentile(values, 95), "p99": _percentile(values, 99),
+                "max": values[-1]}
+
+    def summary(self) -> str:
+        p = self.percentiles()
+        return "loop latency p50 {p50:.0f} / p95 {p95:.0f} / p99 {p99:.0f} ms, stalls {n}".format(
+            n=len(self.stalls), **p)
+
+    def dump(self, path: str):
+        """
+        Write the percentiles and all recorded stalls as one JSON document to `path`, which must not be
+        `dump_path`: that one is a JSON-lines log the watchdog keeps appending to.
+        """
+        if self.dump_path and os.path.abspath(path) == os.path.abspath(self.dump_path):
+            raise ValueError("StallWatchdog.dump(): {} is the JSON-lines stall log".format(path))
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"percentiles_ms": self.percentiles(), "stalls": list(self.stalls)}, f, indent=2)
+
+
+def install_watchdog(window, **kwargs) -> StallWatchdog:
+    """ Start a StallWatchdog showing its summary in `window`'s status bar; stopped when the app quits. """
+    watchdog = StallWatchdog(parent=window, **kwargs)
+    label = QLabel()
+    window.statusBar().addPermanentWidget(label)
+    watchdog.updated.connect(label.setText)
+    watchdog.stalled.connect(lambda s: log.warning("event loop stalled for %s ms:\n%s", s["duration_ms"],
+                                                   s["stack"] or "(no stack sampled)"))
+    QApplication.instance().aboutToQuit.connect(watchdog.stop)
+    watchdog.start()
+    return watchdog
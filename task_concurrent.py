@@ -0,0 +1,218 @@
+"""
+QtConcurrent-style bulk operations (map / filter / map-reduce) on top of the shared TaskEngine.
+
+PyQt5 does not expose QtConcurrent, so this module provides the equivalent:
+    mapped(fn, items)                         -> BulkJob, final result: [fn(x) for x in items]
+    filtered(predicate, items)                -> BulkJob, final result: [x for x in items if predicate(x)]
+    mapped_reduced(fn, reduce_fn, items, ...) -> BulkJob, final result: reduce_fn(...reduce_fn(fn(x0), fn(x1))...)
+                                                 (or reduce_fn(...reduce_fn(initial, fn(x0))...) with `initial`)
+
+Items are split into chunks and each chunk is ONE pool task, so tens of thousands of small items cost a few
+hundred task dispatches and signal emissions instead of one per item. Results are streamed back to the GUI in
+batches through `BulkJob.resultsReady`, either in input order (`ordered=True`) or as soon as a chunk completes.
+
+Like `Worker` + `TaskEngine.start()`, jobs are created idle: connect to the signals first, then call `start()`.
+"""
+import logging
+import sys
+import threading
+import traceback
+from PyQt5.QtCore import QObject, pyqtSignal
+from task_engine import shared_engine
+
+log = logging.getLogger(__name__)
+
+_MAP, _FILTER = 0, 1
+_NO_INITIAL = object()  # mapped_reduced() without `initial`: the first value seeds the accumulator
+
+
+class BulkJob(QObject):
+    """
+    Handle of one bulk operation. Create it through `mapped()`, `filtered()` or `mapped_reduced()`, connect, `start()`.
+
+    Supported signals are:
+
+    resultsReady
+        list of (index, value) tuples for one or more completed chunks;
+        for `filtered()` the value is the input item that passed the predicate
+
+    progress
+        int items done, int items total
+
+    finished
+        object final result (list, or the reduced value for `mapped_reduced()`); not emitted when cancelled
+
+    error
+        tuple (exctype, value, traceback.format_exc() ) of the first failing chunk or `reduce_fn` call; the job
+        is cancelled
+    """
+    resultsReady = pyqtSignal(list)
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(object)
+    error = pyqtSignal(tuple)
+
+    def __init__(self, kind, fn, items, reduce_fn=None, initial=_NO_INITIAL, ordered=True, chunk_size=None,
+                 engine=None, stream=True):
+        super().__init__()
+        self._kind = kind
+        self._fn = fn
+        self._items = items if isinstance(items, (list, tuple, range)) else list(items)
+        self._reduce_fn = reduce_fn
+        self._reduced = initial
+        self._ordered = ordered
+        self._stream = stream
+        self._engine = engine if engine is not None else shared_engine()
+        self._chunk_size = chunk_size if chunk_size else self._auto_chunk_size(len(self._items))
+
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._cancelled = False
+        self._failed = False
+        self._handles = []
+        self._chunks = {}  # chunk index -> list of (index, value), only while waiting for ordered release
+        self._next_chunk = 0
+        self._n_chunks = (len(self._items) + self._chunk_size - 1) // self._chunk_size
+        self._chunks_left = self._n_chunks
+        self._items_done = 0
+        self._result = None
+        self._collected = []  # (index, value) of every released chunk, used for the final list
+
+    def _auto_chunk_size(self, n: int) -> int:
+        # ~4 chunks per thread keeps every thread busy without turning into per-item overhead
+        return max(1, min(4096, n // (self._engine.max_threads * 4) or 1))
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    def start(self):
+        """ Dispatch all chunks to the engine. Returns self. """
+        if not self._items:
+            self._finish()
+            return self
+        for c in range(self._n_chunks):
+            self._handles.append(self._engine.submit(self._run_chunk, c))
+        return self
+
+    def cancel(self):
+        """ Stop dispatching chunks; chunks already running finish but their results are discarded. """
+        with self._lock:
+            self._cancelled = True
+        for handle in self._handles:
+            handle.cancel()
+        self._done.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def wait(self, timeout: float = None) -> bool:
+        """ Block until finished or cancelled. Never call this from the GUI thread. """
+        return self._done.wait(timeout)
+
+    def result(self):
+        return self._result
+
+    # -- pool threads --
+
+    def _run_chunk(self, c: int):
+        if self._cancelled:
+            return
+        start = c * self._chunk_size
+        chunk = self._items[start:start + self._chunk_size]
+        fn = self._fn
+        try:
+            if self._kind == _FILTER:
+                out = [(i, x) for i, x in enumerate(chunk, start) if fn(x)]
+            else:
+                out = [(i, fn(x)) for i, x in enumerate(chunk, start)]
+        except Exception:
+            self._fail("chunk {}".format(c))
+            return
+        try:
+            self._chunk_done(c, out, len(chunk))
+        except Exception:  # reduce_fn raised; _chunk_done's lock is released by now
+            self._fail("reduce_fn")
+
+    def _fail(self, what: str):
+        """ Report the exception being handled (the first one only) and cancel the job. """
+        log.exception("BulkJob: %s failed", what)
+        exctype, value = sys.exc_info()[:2]
+        with self._lock:
+            first = not self._failed
+            self._failed = True
+        if first:
+            self.error.emit((exctype, value, traceback.format_exc()))
+            self.cancel()
+
+    def _chunk_done(self, c: int, out: list, n_items: int):
+        with self._lock:
+            if self._cancelled:
+                return
+            if self._ordered:
+                self._chunks[c] = out
+                released = []
+                while self._next_chunk in self._chunks:
+                    released.extend(self._chunks.pop(self._next_chunk))
+                    self._next_chunk += 1
+            else:
+                released = out
+            if self._reduce_fn is not None:
+                for _, value in released:
+                    if self._reduced is _NO_INITIAL:
+                        self._reduced = value
+                    else:
+                        self._reduced = self._reduce_fn(self._reduced, value)
+            else:
+                self._collected.extend(released)
+            self._items_done += n_items
+            self._chunks_left -= 1
+            # emit while holding the lock so the queued signals reach the GUI in the same order as the updates
+            if released and self._stream:
+                self.resultsReady.emit(released)
+            self.progress.emit(self._items_done, len(self._items))
+            if self._chunks_left == 0:
+                self._finish()
+
+    def _finish(self):
+        if self._reduce_fn is not None:
+            self._result = None if self._reduced is _NO_INITIAL else self._reduced
+        else:
+            if not self._ordered:
+                self._collected.sort(key=lambda t: t[0])
+            self._result = [value for _, value in self._collected]
+        self._collected = []
+        self._done.set()
+        self.finished.emit(self._result)
+
+
+def mapped(fn, items, ordered: bool = True, chunk_size: int = None, engine=None, stream: bool = True) -> BulkJob:
+    """
+    Apply `fn` to every item on the pool.
+
+    :param ordered: stream `resultsReady` batches in input order; False delivers each chunk as soon as it is done
+    :param chunk_size: items per pool task; None picks one from the item count and the pool size
+    :param engine: TaskEngine to use; defaults to `shared_engine()`
+    :param stream: emit `resultsReady`; turn off if only the final result is needed
+    """
+    return BulkJob(_MAP, fn, items, ordered=ordered, chunk_size=chunk_size, engine=engine, stream=stream)
+
+
+def filtered(predicate, items, ordered: bool = True, chunk_size: int = None, engine=None,
+             stream: bool = True) -> BulkJob:
+    """ Keep the items for which `predicate(item)` is true. Same options as `mapped()`. """
+    return BulkJob(_FILTER, predicate, items, ordered=ordered, chunk_size=chunk_size, engine=engine,
+                   stream=stream)
+
+
+def mapped_reduced(fn, reduce_fn, items, initial=_NO_INITIAL, ordered: bool = True, chunk_size: int = None,
+                   engine=None, stream: bool = False) -> BulkJob:
+    """
+    Map every item with `fn` on the pool and fold the results with `reduce_fn(accumulator, value)`.
+    Like `functools.reduce()`, the accumulator starts as `initial` if given, else as the first value; the result
+    of an empty `items` is `initial`, or None without one.
+
+    `reduce_fn` is called under the job's lock, one value at a time (like QtConcurrent); with `ordered=True`
+    values are reduced in input order, otherwise in completion order.
+    """
+    return BulkJob(_MAP, fn, items, reduce_fn=reduce_fn, initial=initial, ordered=ordered, chunk_size=chunk_size,
+                   engine=engine, stream=stream)
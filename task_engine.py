@@ -0,0 +1,729 @@
+"""
+Shared task engine used by the PyQt / QRunnable / QtConcurrent demos.
+
+One `Worker(QRunnable)` + `WorkerSignals` pair replaces the three copy-pasted versions that used to live in
+each demo. Tasks are submitted through a `TaskEngine`, which owns the QThreadPool and hands back a `TaskHandle`
+(status, result, error, cancel) for every task.
+
+Signal contract (`WorkerSignals`):
+    started   - no data, emitted from the pool thread right before `fn` runs
+    progress  - object, whatever the task passes to `progress_callback.emit()` (int %, str, tuple, ...)
+    result    - object, the return value of `fn`
+    error     - tuple (exctype, value, traceback.format_exc())
+    cancelled - no data, `fn` stopped early because its CancelToken was cancelled or its deadline passed
+    finished  - no data, always emitted last (also for failed tasks, but not for cancelled-before-start ones)
+
+Cancellation is cooperative: if `fn` accepts a `cancel_token` keyword it gets a `CancelToken` and should call
+`cancel_token.check()` (or `cancel_token.sleep()`) regularly; both raise `TaskCancelled` once the task is
+cancelled or past its deadline, and block while the task is paused.
+
+Every engine records per-task queue wait, run time and outcome in `engine.metrics` (see task_metrics.py).
+With `TaskEngine(scheduler=TaskScheduler(...))` tasks also get named resource limits and fair sharing of the
+threads between task classes (see task_scheduler.py).
+
+Memory stays flat however many tasks are submitted:
+    - `TaskEngine(max_queued=N, backpressure=...)` bounds the number of tasks waiting for a thread; when the queue
+      is full, `start()` blocks, raises `QueueFull`, drops the oldest queued task, or replaces a queued task with
+      the same `coalesce_key`, depending on the `Backpressure` policy
+    - the engine only references queued and running tasks; QThreadPool deletes the runnable once it has run
+    - `WorkerSignals` objects are pooled: once the GUI thread has delivered a task's `finished`, its connections
+      are dropped and the object is reused for a later Worker (`handle.signals` becomes None at that point)
+"""
+import collections
+import enum
+import inspect
+import itertools
+import logging
+import sys
+import threading
+import time
+import traceback
+import weakref
+from PyQt5.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, QMutex, pyqtSignal, pyqtSlot
+from task_metrics import TaskMetrics
+from result_cache import cached_value
+from task_scheduler import DEFAULT_CLASS
+
+log = logging.getLogger(__name__)
+
+
+class TaskStatus(enum.Enum):
+    PENDING = 0
+    RUNNING = 1
+    FINISHED = 2
+    FAILED = 3
+    CANCELLED = 4
+
+
+class TaskCancelled(Exception):
+    """ Raised by `CancelToken.check()` / `CancelToken.sleep()`; the Worker turns it into CANCELLED. """
+
+
+class QueueFull(Exception):
+    """ Raised by `TaskEngine.start()` when the bounded queue is full and the policy doesn't make room. """
+
+
+class Backpressure(enum.Enum):
+    """ What `TaskEngine.start()` does when `max_queued` tasks are already waiting for a thread. """
+    BLOCK = 0  # wait until a queued task starts (QueueFull after `block_timeout`); never on the GUI thread!
+    REJECT = 1  # raise QueueFull
+    DROP_OLDEST = 2  # cancel the task that has been queued longest
+    COALESCE = 3  # cancel the queued task with the same `coalesce_key` (latest wins); QueueFull if there is none
+
+
+class CancelToken:
+    """
+    Cooperative cancel / deadline / pause flag shared between the GUI thread and one task.
+
+    `check()` is cheap enough to call in every loop iteration: two attribute reads when nothing is going on.
+
+    :param timeout: seconds from now after which the token counts as cancelled; None means no deadline
+    """
+    def __init__(self, timeout: float = None):
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+        self._cancelled = False
+        self._cancel_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+
+    def cancel(self):
+        self._cancelled = True
+        self._cancel_event.set()
+        self._resume_event.set()  # wake up a paused task so it can notice
+
+    def is_cancelled(self) -> bool:
+        if self._cancelled:
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.cancel()
+            return True
+        return False
+
+    def pause(self):
+        if not self._cancelled:
+            self._resume_event.clear()
+
+    def resume(self):
+        self._resume_event.set()
+
+    def is_paused(self) -> bool:
+        return not self._resume_event.is_set()
+
+    def _remaining(self):
+        return None if self.deadline is None else max(0.0, self.deadline - time.monotonic())
+
+    def check(self):
+        """ Raise TaskCancelled if cancelled or past the deadline; block while paused. """
+        if self.is_cancelled():
+            raise TaskCancelled()
+        if not self._resume_event.is_set():
+            self._resume_event.wait(self._remaining())
+            if self.is_cancelled():
+                raise TaskCancelled()
+
+    def sleep(self, seconds: float):
+        """ Like time.sleep(), but returns early (raising TaskCancelled) as soon as the token is cancelled. """
+        remaining = self._remaining()
+        if remaining is not None and remaining < seconds:
+            self._cancel_event.wait(remaining)
+        else:
+            self._cancel_event.wait(seconds)
+        self.check()
+
+
+class WorkerSignals(QObject):
+    """
+    Defines the signals available from a running worker thread.
+
+    Supported signals are:
+
+    started
+        No data
+
+    progress
+        object, anything the task reports (int indicating % progress, str message, ...)
+
+    result
+        object data returned from processing, anything
+
+    error
+        tuple (exctype, value, traceback.format_exc() )
+
+    cancelled
+        No data
+
+    finished
+        No data
+
+    """
+    started = pyqtSignal()
+    progress = pyqtSignal(object)
+    result = pyqtSignal(object)
+    error = pyqtSignal(tuple)
+    cancelled = pyqtSignal()
+    finished = pyqtSignal()
+
+    _owner = None  # weakref to the TaskHandle currently using this object (no cycle: see release_signals)
+
+    def disconnect_all(self):
+        for signal in (self.started, self.progress, self.result, self.error, self.cancelled, self.finished):
+            try:
+                signal.disconnect()
+            except TypeError:  # nothing connected
+                pass
+
+
+SIGNALS_POOL_SIZE = 256  # idle WorkerSignals kept for reuse
+_signals_pool = []
+_signals_pool_lock = threading.Lock()
+
+
+def acquire_signals() -> WorkerSignals:
+    """ A WorkerSignals without connections, reused from the pool if possible; always lives in the GUI thread. """
+    with _signals_pool_lock:
+        if _signals_pool:
+            return _signals_pool.pop()
+    signals = WorkerSignals()
+    if _releaser is not None:
+        # created on a pool thread (e.g. a TaskGraph starting a dependent), which has no event loop, and recycled
+        # into the shared pool later: give it the releaser's (GUI) thread like every other pooled object
+        signals.moveToThread(_releaser.thread())
+    return signals
+
+
+def release_signals(signals: WorkerSignals):
+    """ Disconnect everything and return `signals` to the pool; its owner's `handle.signals` becomes None. """
+    owner = signals._owner() if signals._owner is not None else None
+    signals._owner = None
+    if owner is not None:
+        owner.signals = None
+    _releasing.discard(signals)
+    signals.disconnect_all()
+    with _signals_pool_lock:
+        if len(_signals_pool) < SIGNALS_POOL_SIZE:
+            _signals_pool.append(signals)
+
+
+class _SignalsReleaser(QObject):
+    """ Lives in the GUI thread (created with the first engine) and recycles the WorkerSignals it hears from. """
+    @pyqtSlot()
+    def release(self):
+        signals = self.sender()
+        if isinstance(signals, WorkerSignals):
+            release_signals(signals)
+
+
+def emit_finished(signals: WorkerSignals, handle):
+    """
+    Emit the task's last signal. `release` is connected right before, i.e. after every slot of the caller, so by
+    the time its (queued) call arrives all earlier signals of the task have been delivered. Until then the object
+    is kept in `_releasing`: if it were garbage collected first, its undelivered queued signals would be lost.
+    """
+    if _releaser is not None:
+        _releasing.add(signals)
+        signals.finished.connect(_releaser.release)
+    signals.finished.emit()
+
+
+_releaser = None
+_releasing = set()  # WorkerSignals whose `finished` is on its way to the releaser
+
+
+def accepts_kwarg(fn, name: str) -> bool:
+    """
+    :return: True if `fn` can be called with keyword argument `name` (explicitly or through **kwargs)
+    """
+    try:
+        params = inspect.signature(fn).parameters
+    except (TypeError, ValueError):  # builtins / C functions without a signature
+        return False
+    if name in params and params[name].kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                                                 inspect.Parameter.KEYWORD_ONLY):
+        return True
+    return any(p.kind == inspect.Parameter.VAR_KEYWORD for p in params.values())
+
+
+class TaskHandle:
+    """
+    Handle returned by `TaskEngine.submit()`; thread-safe view of one task.
+
+    :ivar task_id: unique, increasing int
+    :ivar signals: the task's `WorkerSignals`, connect to them before `TaskEngine.start()`; None once the task's
+                   signals have all been delivered and the object went back to the pool
+    :ivar coalesce_key: see `Backpressure.COALESCE`
+    :ivar enqueued_at, started_at, finished_at: time.monotonic() timestamps, None until reached
+    """
+    _ids = itertools.count(1)
+
+    def __init__(self, worker):
+        self.task_id = next(TaskHandle._ids)
+        self.signals = worker.signals
+        self.token = worker.token
+        self.coalesce_key = worker.coalesce_key
+        self._worker = worker
+        self._engine = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._status = TaskStatus.PENDING
+        self._result = None
+        self._error = None
+        self._cache_leader = None  # the Worker, while it runs on behalf of identical cached calls
+        self._callbacks = []
+        self.enqueued_at = None
+        self.started_at = None
+        self.finished_at = None
+
+    def __repr__(self):
+        return "<TaskHandle #{} {}>".format(self.task_id, self._status.name)
+
+    @property
+    def status(self) -> TaskStatus:
+        return self._status
+
+    @property
+    def result(self):
+        """ Return value of the task, None until the task has FINISHED. """
+        return self._result
+
+    @property
+    def error(self):
+        """ (exctype, value, traceback_str) if the task FAILED, else None. """
+        return self._error
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """ Block until the task is done (finished, failed or cancelled). Never call this from the GUI thread. """
+        return self._done.wait(timeout)
+
+    def cancel(self) -> bool:
+        """
+        Cancel the task: a queued task is removed from the queue, a running one has its CancelToken cancelled
+        (it stops at its next `check()`).
+
+        :return: True if the task will not run or has been asked to stop
+        """
+        self.token.cancel()
+        if self.drop():
+            return True
+        return self._status in (TaskStatus.RUNNING, TaskStatus.CANCELLED)
+
+    def drop(self) -> bool:
+        """ Cancel the task only if it hasn't started yet. :return: True if it was dropped """
+        with self._lock:
+            if self._status is not TaskStatus.PENDING:
+                return False
+            self._status = TaskStatus.CANCELLED
+            self.token.cancel()
+            worker, self._worker = self._worker, None
+            if self._engine is not None and worker is not None:
+                self._engine._dequeue(worker)  # frees the queue slot; run() re-checks the status anyway
+        self._set_done()
+        return True
+
+    def add_done_callback(self, fn):
+        """
+        Call `fn(handle)` once the task is done (finished, failed or cancelled), in the thread that finished it:
+        a pool thread, the thread that cancelled it, ... Called right away if the task is already done.
+        """
+        with self._lock:
+            if not self._done.is_set():
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def pause(self):
+        """ Block the task at its next `cancel_token.check()` until `resume()`. """
+        self.token.pause()
+
+    def resume(self):
+        self.token.resume()
+
+    # -- called by Worker on the pool thread --
+
+    def _set_running(self) -> bool:
+        with self._lock:
+            if self._status is not TaskStatus.PENDING:
+                return False
+            if self.token.is_cancelled():  # cancelled or deadline passed while queued
+                self._status = TaskStatus.CANCELLED
+                self._worker = None
+            else:
+                self._status = TaskStatus.RUNNING
+                self.started_at = time.monotonic()
+                self._worker = None  # QThreadPool owns (and deletes) the runnable from here on
+        if self._status is TaskStatus.RUNNING:
+            if self._engine is not None:
+                self._engine._task_started(self)
+            return True
+        self._set_done()
+        return False
+
+    def _set_result(self, result):
+        self._result = result
+        self._status = TaskStatus.FINISHED
+        self._set_done()
+
+    def _set_error(self, error: tuple):
+        self._error = error
+        self._status = TaskStatus.FAILED
+        self._set_done()
+
+    def _set_cancelled(self):
+        self._status = TaskStatus.CANCELLED
+        self._set_done()
+
+    def _set_done(self):
+        self.finished_at = time.monotonic()
+        with self._lock:
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        if self._engine is not None:
+            self._engine._forget(self)
+        for fn in callbacks:
+            try:
+                fn(self)
+            except Exception:
+                log.exception("done callback of task %s failed", self.task_id)
+
+
+class Worker(QRunnable):
+    """
+    Worker thread
+
+    Inherits from QRunnable to handler worker thread setup, signals and wrap-up.
+
+    If `fn` accepts a `progress_callback` keyword (explicitly or via **kwargs), it is passed `signals.progress`,
+    unless the caller supplies its own `progress_callback` (anything with an `emit(value)` method, e.g. a
+    `ProgressCoalescer.sink()`).
+
+    With `backend` (a `process_backend.ProcessBackend`) the task runs in a worker process instead of on the
+    QThreadPool; `fn`, args and kwargs must then be picklable and `progress_callback` is relayed across the
+    process boundary. The signals are the same either way.
+
+    :param fn: The function callback to run on this worker thread. Supplied args and
+               kwargs will be passed through to the runner.
+    :type fn: function
+    :param args: Arguments to pass to the callback function
+    :param mutex: optional QMutex; if it is already locked when the task starts, the task is skipped (CANCELLED)
+    :param backend: optional ProcessBackend, run `fn` in a separate process (for CPU-bound work)
+    :param timeout: optional deadline in seconds, counted from submission (queue wait included); a task still
+                    queued at its deadline is dropped, a running one is cancelled at its next `check()`
+    :param cache: optional `result_cache.ResultCache`; identical calls are answered from it, or share the
+                  execution of an identical task already in flight
+    :param coalesce_key: optional hashable; on a `Backpressure.COALESCE` engine a queued task with the same key
+                         is replaced by this one
+    :param resources: names of the scheduler resources the task holds while it runs, e.g. ("instrument-A",)
+    :param task_class: scheduler class the task is queued and accounted in, e.g. "interactive" or "long"
+    :param kwargs: Keywords to pass to the callback function
+    """
+    def __init__(self, fn, *args, mutex: QMutex = None, backend=None, timeout: float = None, cache=None,
+                 coalesce_key=None, resources: tuple = (), task_class: str = DEFAULT_CLASS, **kwargs):
+        super(Worker, self).__init__()
+
+        # Store constructor arguments (re-used for processing)
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.lock = mutex
+        self.backend = backend
+        if mutex is not None and backend is not None:
+            raise ValueError("Worker: 'mutex' is not supported together with a process 'backend'")
+        self.signals = acquire_signals()
+        self.token = CancelToken(timeout)
+        self.coalesce_key = coalesce_key
+        self.resources = tuple(resources)
+        self.task_class = task_class
+        self.handle = TaskHandle(self)
+        self.signals._owner = weakref.ref(self.handle)
+        self.cache = cache
+        self.cache_key = cache.key(fn, args, kwargs) if cache is not None else None
+
+        # Add the callback to our kwargs
+        self.progress_callback = self.kwargs.pop('progress_callback', None) or self.signals.progress
+        self.wants_progress = accepts_kwarg(fn, 'progress_callback')
+        if self.wants_progress and backend is None:  # the process backend injects its own relay in the child
+            self.kwargs['progress_callback'] = self.progress_callback
+        if backend is None and accepts_kwarg(fn, 'cancel_token'):  # tokens can't cross a process boundary
+            self.kwargs['cancel_token'] = self.token
+
+    @pyqtSlot()
+    def run(self):
+        """
+        Initialise the runner function with passed args, kwargs.
+        """
+        handle = self.handle
+        if not handle._set_running():
+            return  # cancelled while queued
+        if self.lock is not None:
+            if not self.lock.tryLock():
+                log.info("%s.lock.tryLock() = False; skip...", self)
+                handle._set_cancelled()
+                self.signals.cancelled.emit()
+                emit_finished(self.signals, handle)
+                return
+        try:
+            self._running()
+        finally:
+            if self.lock is not None:
+                self.lock.unlock()
+
+    def _running(self):
+        handle = self.handle
+        self.signals.started.emit()
+        # Retrieve args/kwargs here; and fire processing using them
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except TaskCancelled:
+            handle._set_cancelled()
+            self.signals.cancelled.emit()
+        except Exception:
+            log.exception("task %s failed", handle.task_id)
+            exctype, value = sys.exc_info()[:2]
+            error = (exctype, value, traceback.format_exc())
+            handle._set_error(error)
+            self.signals.error.emit(error)
+        else:
+            handle._set_result(result)
+            self.signals.result.emit(result)  # Return the result of the processing
+        finally:
+            emit_finished(self.signals, handle)  # Done
+
+
+class TaskEngine:
+    """
+    Owns a QThreadPool and is the single entry point for background work.
+
+    :param max_threads: concurrency limit; None keeps QThreadPool's default (QThread.idealThreadCount())
+    :param threadpool: use an existing pool (e.g. QThreadPool.globalInstance()) instead of creating one
+    :param name: label of this engine's metrics
+    :param max_queued: bound on the tasks waiting for a thread (running ones don't count); None = unbounded
+    :param backpressure: what `start()` does when the queue is full
+    :param block_timeout: seconds `Backpressure.BLOCK` waits before raising QueueFull; None = forever
+    :param scheduler: optional `task_scheduler.TaskScheduler`; resource limits, priorities and fair shares
+    """
+    def __init__(self, max_threads: int = None, threadpool: QThreadPool = None, name: str = "default",
+                 max_queued: int = None, backpressure: Backpressure = Backpressure.BLOCK,
+                 block_timeout: float = None, scheduler=None):
+        self.threadpool = threadpool if threadpool is not None else QThreadPool()
+        self._process_backend = None
+        self._lock = threading.Lock()
+        self._space = threading.Condition(self._lock)  # notified whenever a queued task leaves the queue
+        self._live = {}  # task_id -> TaskHandle of every queued or running task
+        self._queued = collections.OrderedDict()  # task_id -> TaskHandle not started yet, oldest first
+        self._coalesce = {}  # coalesce_key -> TaskHandle of the queued task with that key
+        self.max_queued = max_queued if max_queued is None else max(1, int(max_queued))
+        self.backpressure = backpressure
+        self.block_timeout = block_timeout
+        self.scheduler = scheduler
+        if scheduler is not None:
+            scheduler.attach(self)
+        global _releaser
+        if _releaser is None:
+            _releaser = _SignalsReleaser()
+        self.metrics = TaskMetrics(self, name)
+        if max_threads is not None:
+            self.max_threads = max_threads
+
+    @property
+    def max_threads(self) -> int:
+        return self.threadpool.maxThreadCount()
+
+    @max_threads.setter
+    def max_threads(self, value: int):
+        self.threadpool.setMaxThreadCount(max(1, int(value)))
+        if self.scheduler is not None:
+            self.scheduler.pump()
+
+    def process_pool(self, max_workers: int = None, warm_up: bool = True):
+        """
+        Process pool owned by this engine, created on first call (later arguments are ignored).
+        Use it as `Worker(fn, ..., backend=engine.process_pool())` for CPU-bound tasks.
+        """
+        if self._process_backend is None:
+            from process_backend import ProcessBackend  # multiprocessing is only imported when actually used
+            self._process_backend = ProcessBackend(max_workers=max_workers, warm_up=warm_up)
+        return self._process_backend
+
+    def submit(self, fn, *args, **kwargs) -> TaskHandle:
+        """
+        Run `fn(*args, **kwargs)` on the pool. Keyword-only `Worker` options (e.g. `mutex`) are accepted too.
+
+        !!! Attention !!! the task may already be running when this returns, and signals emitted before you
+        connect to `handle.signals` are lost. Build a `Worker`, connect, then `start()` it if you need all of them.
+
+        :return: TaskHandle
+        """
+        return self.start(Worker(fn, *args, **kwargs))
+
+    def start(self, worker: Worker, priority: int = 0, block: bool = True) -> TaskHandle:
+        """
+        Queue an already constructed Worker. Higher `priority` runs first (QThreadPool semantics).
+
+        :param block: False turns `Backpressure.BLOCK` into REJECT for this call (e.g. when called from a pool thread)
+        :raise QueueFull: the bounded queue is full and the backpressure policy doesn't make room
+        """
+        handle = worker.handle
+        if handle.done():
+            return handle  # cancelled before it was started (e.g. by TaskGraph.cancel())
+        handle._engine = self
+        with self._lock:
+            victims = self._make_room(handle, block) if self.max_queued is not None else ()
+            handle.enqueued_at = time.monotonic()
+            self._live[handle.task_id] = handle
+            self._queued[handle.task_id] = handle
+            if handle.coalesce_key is not None:
+                self._coalesce[handle.coalesce_key] = handle
+        for victim in victims:
+            if victim.drop():
+                log.debug("task %s dropped for task %s (%s)", victim.task_id, handle.task_id, self.backpressure.name)
+        self.metrics.task_submitted(handle)
+        self._dispatch(worker, priority)
+        return handle
+
+    def _make_room(self, handle: TaskHandle, block: bool) -> list:
+        """ Apply the backpressure policy (lock held). :return: queued tasks to drop once the lock is released """
+        victims = []
+        policy = self.backpressure
+        if policy is Backpressure.COALESCE and handle.coalesce_key is not None:
+            twin = self._coalesce.pop(handle.coalesce_key, None)
+            if twin is not None:
+                self._queued.pop(twin.task_id, None)
+                victims.append(twin)
+        deadline = None if self.block_timeout is None else time.monotonic() + self.block_timeout
+        while len(self._queued) >= self.max_queued:
+            if policy is Backpressure.DROP_OLDEST:
+                _, oldest = self._queued.popitem(last=False)
+                if self._coalesce.get(oldest.coalesce_key) is oldest:
+                    del self._coalesce[oldest.coalesce_key]
+                victims.append(oldest)
+            elif policy is Backpressure.BLOCK and block:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if (remaining is not None and remaining <= 0) or not self._space.wait(remaining):
+                    self.metrics.task_rejected()
+                    raise QueueFull("{} tasks queued (waited {}s)".format(len(self._queued), self.block_timeout))
+            else:
+                self.metrics.task_rejected()
+                raise QueueFull("{} tasks queued".format(len(self._queued)))
+        return victims
+
+    def _unqueue(self, handle: TaskHandle):
+        """ `handle` left the queue (started or done); lock held. """
+        if self._queued.pop(handle.task_id, None) is not None:
+            if handle.coalesce_key is not None and self._coalesce.get(handle.coalesce_key) is handle:
+                del self._coalesce[handle.coalesce_key]
+            self._space.notify()
+
+    def _task_started(self, handle: TaskHandle):
+        with self._lock:
+            self._unqueue(handle)
+
+    def _dispatch(self, worker: Worker, priority: int = 0):
+        if worker.handle.status is not TaskStatus.PENDING:
+            return  # cancelled while it waited for an in-flight twin
+        if worker.cache_key is not None:
+            hit, value = worker.cache.lookup(worker.cache_key)
+            if hit:  # run a trivial task instead, so the signals and the handle behave as usual
+                worker.fn, worker.args, worker.kwargs, worker.backend = cached_value, (value,), {}, None
+                worker.cache_key = None
+            elif worker.cache.join(worker.cache_key, worker):
+                worker.handle._cache_leader = worker
+                worker.fn = worker.cache.wrap(worker.fn, worker.cache_key)
+            else:
+                return  # an identical task is in flight; _cache_done() finishes this one with its outcome
+        if worker.backend is not None:
+            worker.backend.submit(worker)
+        elif self.scheduler is not None:
+            self.scheduler.submit(worker, priority)  # it starts the worker on the pool when it fits
+        else:
+            self.threadpool.start(worker, priority)
+
+    def _cache_done(self, leader: Worker):
+        """ The leader of a cached call is done: store its result and hand the outcome to the waiting twins. """
+        handle = leader.handle
+        waiting = leader.cache.leave(leader.cache_key, leader)
+        status = handle.status
+        if status is TaskStatus.FINISHED:
+            leader.cache.store(leader.cache_key, handle.result)
+        for worker in waiting:
+            if status is TaskStatus.CANCELLED:
+                self._dispatch(worker)  # the leader was cancelled, not the twins: they run (one leads)
+                continue
+            if not worker.handle._set_running():
+                continue
+            worker.signals.started.emit()
+            if status is TaskStatus.FINISHED:
+                worker.handle._set_result(handle.result)
+                worker.signals.result.emit(handle.result)
+            else:
+                worker.handle._set_error(handle.error)
+                worker.signals.error.emit(handle.error)
+            emit_finished(worker.signals, worker.handle)
+
+    def _dequeue(self, worker: Worker) -> bool:
+        """ Remove a not yet started task from its queue; True if it was still queued. """
+        if worker.backend is not None:
+            return worker.backend.cancel(worker)
+        return self.threadpool.tryTake(worker)
+
+    def _forget(self, handle: TaskHandle):
+        with self._lock:
+            forgotten = self._live.pop(handle.task_id, None)
+            self._unqueue(handle)
+        if forgotten is not None:
+            self.metrics.task_done(handle)
+        if self.scheduler is not None:
+            self.scheduler.task_done(handle)
+        if handle.started_at is None and handle.signals is not None:
+            release_signals(handle.signals)  # never started: nothing was emitted, nothing is pending
+        leader, handle._cache_leader = handle._cache_leader, None
+        if leader is not None:
+            self._cache_done(leader)
+
+    def live_tasks(self) -> list:
+        """ Handles of all queued and running tasks. """
+        with self._lock:
+            return list(self._live.values())
+
+    def cancel_all_pending(self) -> int:
+        """ Drop every task that has not started yet. Returns how many were dropped. """
+        return sum(1 for h in self.live_tasks() if h.status is TaskStatus.PENDING and h.cancel())
+
+    def cancel_all(self) -> int:
+        """ Drop queued tasks and ask running ones to stop. Returns the number of tasks affected. """
+        return sum(1 for h in self.live_tasks() if h.cancel())
+
+    def shutdown(self, wait_msecs: int = 3000) -> bool:
+        """
+        Graceful shutdown (e.g. from `closeEvent`): cancel everything, then give running tasks `wait_msecs`
+        to reach their next `check()`. Returns True if the pool drained in time.
+        """
+        self.cancel_all()
+        drained = self.threadpool.waitForDone(wait_msecs)
+        if self._process_backend is not None:
+            self._process_backend.shutdown(wait=drained)
+            self._process_backend = None
+        return drained
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        return self.threadpool.waitForDone(msecs)
+
+
+_shared_engine = None
+_shared_engine_lock = threading.Lock()
+
+
+def shared_engine() -> TaskEngine:
+    """
+    Application-wide TaskEngine backed by QThreadPool.globalInstance(); created on first use and kept for the
+    lifetime of the process, so bulk operations never pay for pool spin-up.
+    """
+    global _shared_engine
+    with _shared_engine_lock:
+        if _shared_engine is None:
+            _shared_engine = TaskEngine(threadpool=QThreadPool.globalInstance(), name="shared")
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(_shared_engine.shutdown)
+        return _shared_engine
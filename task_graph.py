@@ -0,0 +1,288 @@
+"""
+Task dependency graph (DAG) scheduler on top of TaskEngine.
+
+Chaining workers through their `result` signals bounces every stage through the GUI event loop: the pool thread
+emits, the GUI thread runs a lambda that builds and starts the next Worker, and the pool sits idle in between.
+A TaskGraph declares the stages and their dependencies up front instead:
+
+    graph = TaskGraph(engine)
+    graph.add("load_a", load, "a.csv")
+    graph.add("load_b", load, "b.csv")
+    graph.add("merge", merge, deps=["load_a", "load_b"])     # merge(result of load_a, result of load_b)
+    graph.add("report", report, "out.txt", deps=["merge"])   # report(result of merge, "out.txt")
+    graph.finished.connect(on_done)
+    graph.start()
+
+A node runs as soon as all of its dependencies have finished; their results are passed as the first positional
+arguments (in `deps` order), followed by the node's own args. Readiness is settled in a `TaskHandle` done callback,
+i.e. on the pool thread that just finished the dependency, which starts the dependents right away: the GUI thread
+is not involved between stages, and independent branches run in parallel. Ready nodes are queued with their
+height in the graph as priority by default, so the longest remaining chain (the critical path) starts first.
+
+A node that fails or is cancelled fails (or cancels) all of its transitive dependents without running them;
+independent branches carry on, unless `fail_fast=True`, which cancels the whole graph on the first failure.
+On an engine with a bounded queue, nodes are started without blocking (neither `start()` nor the pool threads
+wait for room); a node the queue refuses fails with QueueFull.
+"""
+import logging
+import sys
+import threading
+from PyQt5.QtCore import QObject, pyqtSignal
+from task_engine import Worker, TaskStatus, QueueFull, shared_engine
+
+log = logging.getLogger(__name__)
+
+
+class UpstreamFailed(Exception):
+    """ Error of a node that did not run because a dependency failed; `args[0]` is the failed node's name. """
+
+
+class _Node:
+    __slots__ = ("name", "fn", "args", "kwargs", "deps", "dependents", "priority", "waiting", "handle", "status",
+                 "result", "error")
+
+    def __init__(self, name, fn, args, kwargs, deps, priority):
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.deps = deps
+        self.dependents = []
+        self.priority = priority
+        self.waiting = len(deps)  # dependencies not finished yet
+        self.handle = None
+        self.status = None  # TaskStatus once settled
+        self.result = None
+        self.error = None
+
+
+class TaskGraph(QObject):
+    """
+    A set of named tasks with dependencies, run on a TaskEngine. Create it idle, `add()` nodes, connect, `start()`.
+
+    Supported signals are (all emitted from whatever thread settled the node, so GUI slots get queued calls):
+
+    nodeFinished
+        str node name, object its result
+
+    nodeFailed
+        str node name, tuple (exctype, value, traceback.format_exc() ); exctype is UpstreamFailed for nodes
+        skipped because a dependency failed
+
+    progress
+        int nodes settled, int nodes total
+
+    error
+        dict node name -> error tuple of every failed node; emitted right before `finished` if any failed
+
+    finished
+        dict node name -> result of every node that finished; always emitted last (also when cancelled)
+
+    :param engine: TaskEngine to run on; default `shared_engine()`
+    :param fail_fast: cancel the whole graph as soon as one node fails
+    """
+    nodeFinished = pyqtSignal(str, object)
+    nodeFailed = pyqtSignal(str, tuple)
+    progress = pyqtSignal(int, int)
+    error = pyqtSignal(dict)
+    finished = pyqtSignal(dict)
+
+    def __init__(self, engine=None, fail_fast: bool = False, parent=None):
+        super().__init__(parent)
+        self.engine = engine if engine is not None else shared_engine()
+        self.fail_fast = fail_fast
+        self._nodes = {}  # name -> _Node, in insertion order
+        self._lock = threading.Lock()
+        self._settled = 0
+        self._started = False
+        self._cancelled = False
+        self._done = threading.Event()
+        self._outbox = []  # (callable, args) to run outside the lock, see _publish()
+        self._publishing = False
+
+    def add(self, name: str, fn, *args, deps=(), priority: int = None, **kwargs) -> str:
+        """
+        Add node `name` running `fn(*dep_results, *args, **kwargs)`.
+
+        Keyword-only `Worker` options (`cache`, `timeout`, `backend`, ...) are accepted too; `cancel_token` and
+        `progress_callback` are injected like for any Worker.
+
+        :param deps: names of the nodes whose results this one takes, in argument order; they may be added later
+        :param priority: QThreadPool priority; default is the node's height (longest path to a leaf)
+        :return: name
+        """
+        if self._started:
+            raise RuntimeError("TaskGraph: can't add nodes after start()")
+        if name in self._nodes:
+            raise ValueError("TaskGraph: duplicate node {!r}".format(name))
+        self._nodes[name] = _Node(name, fn, args, kwargs, tuple(deps), priority)
+        return name
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def _prepare(self) -> list:
+        """ Link the nodes, reject unknown dependencies and cycles. :return: nodes in topological order """
+        for node in self._nodes.values():
+            node.dependents = []
+        for node in self._nodes.values():
+            for dep in node.deps:
+                if dep not in self._nodes:
+                    raise ValueError("TaskGraph: {!r} depends on unknown node {!r}".format(node.name, dep))
+                self._nodes[dep].dependents.append(node)
+        waiting = {name: len(node.deps) for name, node in self._nodes.items()}
+        order = [node for node in self._nodes.values() if not node.deps]
+        for node in order:  # Kahn's algorithm; `order` grows while it is walked
+            for dependent in node.dependents:
+                waiting[dependent.name] -= 1
+                if not waiting[dependent.name]:
+                    order.append(dependent)
+        if len(order) != len(self._nodes):
+            raise ValueError("TaskGraph: dependency cycle among {}".format(
+                sorted(name for name, n in waiting.items() if n)))
+        height = {}
+        for node in reversed(order):
+            height[node.name] = 1 + max((height[d.name] for d in node.dependents), default=0)
+            if node.priority is None:
+                node.priority = height[node.name]
+        return order
+
+    def start(self):
+        """ Queue every node without dependencies; the rest follow as their dependencies finish. """
+        if self._started:
+            raise RuntimeError("TaskGraph: already started")
+        order = self._prepare()
+        self._started = True
+        log.debug("TaskGraph: starting %d nodes", len(order))
+        if not order:
+            self._done.set()
+            self.finished.emit({})
+            return
+        with self._lock:
+            for node in order:
+                if not node.deps and node.status is None:
+                    self._dispatch(node)
+            self._check_done()
+        self._publish()
+
+    # Everything that must not run under `_lock` (engine.start(), handle.cancel(), signal emission) is appended to
+    # `_outbox` while the lock is held, in the order the graph state changed, and run by ONE thread at a time:
+    # the first one to call `_publish()` drains it, later callers just leave their actions for it. So signals
+    # are emitted in state order (`finished` really last), and a done callback that fires synchronously inside
+    # engine.start() (a dropped task) or handle.cancel() never waits for a lock its own thread holds.
+
+    def _dispatch(self, node: _Node):
+        """ Prepare `node`'s Worker and queue its start (lock held, so cancel() can't miss its handle). """
+        dep_results = tuple(self._nodes[dep].result for dep in node.deps)
+        worker = Worker(node.fn, *dep_results, *node.args, **node.kwargs)
+        worker.handle.add_done_callback(lambda handle, n=node: self._task_done(n, handle))
+        node.handle = worker.handle
+        self._outbox.append((self._start_node, (node, worker)))
+
+    def _start_node(self, node: _Node, worker):
+        """ Outbox action; never blocks, so a pool thread can't wait on a full queue. """
+        try:
+            self.engine.start(worker, node.priority, block=False)
+        except QueueFull:
+            exctype, value = sys.exc_info()[:2]
+            with self._lock:
+                if node.status is None:
+                    self._settle(node, TaskStatus.FAILED, None, (exctype, value, "QueueFull: {}\n".format(value)))
+                    self._check_done()
+
+    def _task_done(self, node: _Node, handle):
+        """ Done callback, in the thread that finished the task (usually a pool thread). """
+        with self._lock:
+            if node.status is None:
+                self._settle(node, handle.status, handle.result, handle.error)
+                self._check_done()
+        self._publish()
+
+    def _check_done(self):
+        if self._settled == len(self._nodes) and not self._done.is_set():
+            errors = self.errors
+            if errors:
+                self._outbox.append((self.error.emit, (errors,)))
+            self._outbox.append((self.finished.emit, (self.results,)))
+            self._done.set()
+
+    def _publish(self):
+        """ Run the queued actions, unless another thread is already doing so. """
+        with self._lock:
+            if self._publishing:
+                return
+            self._publishing = True
+        while True:
+            with self._lock:
+                actions, self._outbox = self._outbox, []
+                if not actions:
+                    self._publishing = False
+                    return
+            for fn, args in actions:
+                try:
+                    fn(*args)
+                except Exception:
+                    log.exception("TaskGraph: %s failed", getattr(fn, "__name__", fn))
+
+    def _settle(self, node: _Node, status: TaskStatus, result, error):
+        """ Record the outcome of `node` and move its dependents on (lock held). """
+        node.status, node.result, node.error = status, result, error
+        self._settled += 1
+        if status is TaskStatus.FINISHED:
+            self._outbox.append((self.nodeFinished.emit, (node.name, result)))
+        elif status is TaskStatus.FAILED:
+            self._outbox.append((self.nodeFailed.emit, (node.name, error)))
+            if self.fail_fast and not self._cancelled:
+                self._cancelled = True
+                self._outbox.extend((n.handle.cancel, ()) for n in self._nodes.values()
+                                    if n.status is None and n.handle is not None)
+        self._outbox.append((self.progress.emit, (self._settled, len(self._nodes))))
+
+        for dependent in node.dependents:
+            if dependent.status is not None:
+                continue  # already failed through another dependency
+            if status is TaskStatus.FINISHED:
+                dependent.waiting -= 1
+                if dependent.waiting:
+                    continue
+                if self._cancelled:
+                    self._settle(dependent, TaskStatus.CANCELLED, None, None)
+                else:
+                    self._dispatch(dependent)
+            elif status is TaskStatus.FAILED:
+                root = error[1].args[0] if error[0] is UpstreamFailed else node.name
+                self._settle(dependent, TaskStatus.FAILED, None, (UpstreamFailed, UpstreamFailed(root), error[2]))
+            else:
+                self._settle(dependent, TaskStatus.CANCELLED, None, None)
+
+    def cancel(self):
+        """ Cancel every node that hasn't finished; queued ones are dropped, running ones stop at `check()`. """
+        with self._lock:
+            self._cancelled = True
+            handles = [n.handle for n in self._nodes.values() if n.status is None and n.handle is not None]
+        for handle in handles:
+            handle.cancel()  # the done callbacks settle them, and cancel their dependents
+
+    @property
+    def results(self) -> dict:
+        """ node name -> result, for the nodes that finished so far """
+        return {name: n.result for name, n in self._nodes.items() if n.status is TaskStatus.FINISHED}
+
+    @property
+    def errors(self) -> dict:
+        """ node name -> error tuple, for the nodes that failed so far """
+        return {name: n.error for name, n in self._nodes.items() if n.status is TaskStatus.FAILED}
+
+    def status(self, name: str):
+        """ TaskStatus of node `name`; None while it waits for its dependencies, PENDING while queued. """
+        node = self._nodes[name]
+        if node.status is not None:
+            return node.status
+        return node.handle.status if node.handle is not None else None
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """ Block until every node is settled. Never call this from the GUI thread. """
+        return self._done.wait(timeout)
@@ -0,0 +1,228 @@
+"""
+Per-task telemetry for `TaskEngine`: queue wait, run time, outcome, throughput.
+
+Every TaskHandle carries `enqueued_at` / `started_at` / `finished_at` (time.monotonic()); when a task is done its
+engine feeds it to `engine.metrics` (a `TaskMetrics`), which keeps cumulative counters and histograms, so the
+cost per task is a few additions under a lock and memory does not grow with the number of tasks.
+
+    print(engine.metrics.prometheus_text())        # Prometheus text exposition format
+    panel = TaskMetricsPanel([engine], export_path="taskengine.prom")  # live view + metrics file
+
+The export file is written atomically, so it can be scraped by node_exporter's textfile collector.
+"""
+import bisect
+import collections
+import logging
+import os
+import tempfile
+import threading
+import time
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QFormLayout, QLabel, QTableWidget, QTableWidgetItem
+
+log = logging.getLogger(__name__)
+
+# seconds; Prometheus-style upper bounds ("le"), +Inf is implicit
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+THROUGHPUT_WINDOW = 60.0  # seconds of finished tasks averaged for tasks/sec
+
+
+class Histogram:
+    """ Cumulative-bucket histogram (not thread-safe on its own, TaskMetrics locks around it). """
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list:
+        """ :return: [(le, cumulative count), ...] ending with ("+Inf", count) """
+        out, total = [], 0
+        for le, n in zip(self.buckets + ("+Inf",), self.counts):
+            total += n
+            out.append((le, total))
+        return out
+
+    def quantile(self, q: float) -> float:
+        """ Upper bound of the bucket holding quantile `q`; 0 without samples, inf past the last bucket. """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        for le, total in self.cumulative():
+            if total >= rank:
+                return float("inf") if le == "+Inf" else le
+        return float("inf")
+
+
+class TaskMetrics:
+    """
+    Aggregated metrics of one TaskEngine; thread-safe.
+
+    :param engine: the engine, for the live active / queued gauges
+    :param name: value of the `engine` label in the export
+    """
+    def __init__(self, engine, name: str = "default", buckets: tuple = DEFAULT_BUCKETS):
+        self.engine = engine
+        self.name = name
+        self.submitted = 0
+        self.rejected = 0  # refused by a full bounded queue (never submitted)
+        self.outcomes = collections.Counter()  # TaskStatus name -> count
+        self.wait = Histogram(buckets)  # enqueue -> start
+        self.run = Histogram(buckets)  # start -> finish
+        self._recent = collections.deque()  # finish times within THROUGHPUT_WINDOW
+        self._lock = threading.Lock()
+
+    def task_submitted(self, handle):
+        with self._lock:
+            self.submitted += 1
+
+    def task_rejected(self):
+        with self._lock:
+            self.rejected += 1
+
+    def task_done(self, handle):
+        """ Called by the engine once per task, from whatever thread finished it. """
+        with self._lock:
+            self.outcomes[handle.status.name] += 1
+            if handle.started_at is not None:
+                self.wait.observe(handle.started_at - handle.enqueued_at)
+                self.run.observe(handle.finished_at - handle.started_at)
+            self._recent.append(handle.finished_at)
+            self._trim(handle.finished_at)
+
+    def _trim(self, now: float):
+        while self._recent and self._recent[0] < now - THROUGHPUT_WINDOW:
+            self._recent.popleft()
+
+    def snapshot(self) -> dict:
+        """ Point-in-time copy of everything, for display. """
+        live = self.engine.live_tasks()
+        active = sum(1 for h in live if h.started_at is not None)
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            done = sum(self.outcomes.values())
+            failed = self.outcomes.get("FAILED", 0)
+            return {
+                "submitted": self.submitted, "rejected": self.rejected, "active": active, "queued": len(live) - active,
+                "max_threads": self.engine.max_threads, "outcomes": dict(self.outcomes),
+                "tasks_per_sec": len(self._recent) / THROUGHPUT_WINDOW,
+                "error_rate": failed / done if done else 0.0,
+                "wait_p50": self.wait.quantile(0.5), "wait_p95": self.wait.quantile(0.95),
+                "run_p50": self.run.quantile(0.5), "run_p95": self.run.quantile(0.95),
+                "wait": self.wait.cumulative(), "run": self.run.cumulative(),
+                "wait_sum": self.wait.sum, "run_sum": self.run.sum,
+                "wait_count": self.wait.count, "run_count": self.run.count,
+            }
+
+    def prometheus_text(self) -> str:
+        s = self.snapshot()
+        label = 'engine="{}"'.format(self.name)
+        lines = [
+            "# HELP taskengine_tasks_submitted_total Tasks submitted to the engine.",
+            "# TYPE taskengine_tasks_submitted_total counter",
+            "taskengine_tasks_submitted_total{{{}}} {}".format(label, s["submitted"]),
+            "# HELP taskengine_tasks_rejected_total Tasks refused because the bounded queue was full.",
+            "# TYPE taskengine_tasks_rejected_total counter",
+            "taskengine_tasks_rejected_total{{{}}} {}".format(label, s["rejected"]),
+            "# HELP taskengine_tasks_total Finished tasks by outcome.",
+            "# TYPE taskengine_tasks_total counter",
+        ]
+        for outcome in ("FINISHED", "FAILED", "CANCELLED"):
+            lines.append('taskengine_tasks_total{{{},outcome="{}"}} {}'.format(
+                label, outcome.lower(), s["outcomes"].get(outcome, 0)))
+        for gauge, help_text in (("active", "Tasks running now."), ("queued", "Tasks waiting for a thread."),
+                                 ("max_threads", "Pool size."),
+                                 ("tasks_per_sec", "Finished tasks per second, last minute.")):
+            lines += ["# HELP taskengine_{} {}".format(gauge, help_text), "# TYPE taskengine_{} gauge".format(gauge),
+                      "taskengine_{}{{{}}} {}".format(gauge, label, s[gauge])]
+        for hist, help_text in (("wait", "Time from submission to start."), ("run", "Time from start to finish.")):
+            metric = "taskengine_{}_seconds".format(hist)
+            lines += ["# HELP {} {}".format(metric, help_text), "# TYPE {} histogram".format(metric)]
+            for le, total in s[hist]:
+                lines.append('{}_bucket{{{},le="{}"}} {}'.format(metric, label, le, total))
+            lines.append("{}_sum{{{}}} {}".format(metric, label, s[hist + "_sum"]))
+            lines.append("{}_count{{{}}} {}".format(metric, label, s[hist + "_count"]))
+        return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path, engines):
+    """ Write the metrics of `engines` to `path` atomically (temp file + rename). """
+    text = "".join(engine.metrics.prometheus_text() for engine in engines)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".metrics.", suffix=".tmp")
+    try:
+        with open(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _fmt_seconds(value: float) -> str:
+    if not value:
+        return "-"  # no samples yet
+    if value == float("inf"):
+        return "> {}s".format(DEFAULT_BUCKETS[-1])
+    return "≤ {:g} ms".format(value * 1000)
+
+
+class TaskMetricsPanel(QWidget):
+    """
+    Live view of the metrics of one or more engines, refreshed every `refresh_ms` (only while visible).
+    With `export_path`, the Prometheus text file is rewritten on the same timer, visible or not.
+    """
+    def __init__(self, engines: list, export_path: str = None, refresh_ms: int = 1000, parent=None):
+        super().__init__(parent)
+        self.engines = list(engines)
+        self.export_path = export_path
+        layout = QVBoxLayout()
+        self.form = QFormLayout()
+        self.labels = {}
+        for engine in self.engines:
+            self.labels[engine.metrics.name] = QLabel()
+            self.form.addRow(engine.metrics.name, self.labels[engine.metrics.name])
+        layout.addLayout(self.form)
+        self.table = QTableWidget(len(DEFAULT_BUCKETS) + 1, 2 * len(self.engines))
+        self.table.setVerticalHeaderLabels([_fmt_seconds(b) for b in DEFAULT_BUCKETS] + ["+Inf"])
+        self.table.setHorizontalHeaderLabels(["{} {}".format(e.metrics.name, h) for e in self.engines
+                                              for h in ("wait", "run")])
+        layout.addWidget(self.table)
+        self.setLayout(layout)
+        self._timer = QTimer(self)
+        self._timer.setInterval(refresh_ms)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start()
+
+    def refresh(self):
+        if self.export_path:
+            try:
+                write_prometheus(self.export_path, self.engines)
+            except OSError as e:
+                log.warning("TaskMetricsPanel: can't write %s: %s", self.export_path, e)
+                self.export_path = None
+        if not self.isVisible():
+            return
+        for col, engine in enumerate(self.engines):
+            s = engine.metrics.snapshot()
+            self.labels[engine.metrics.name].setText(
+                "active {}/{}, queued {}, done {}, rejected {}, {:.1f} tasks/s, errors {:.1%}\n"
+                "wait p50 {}, p95 {}; run p50 {}, p95 {}".format(
+                    s["active"], s["max_threads"], s["queued"], sum(s["outcomes"].values()), s["rejected"],
+                    s["tasks_per_sec"],
+                    s["error_rate"], _fmt_seconds(s["wait_p50"]), _fmt_seconds(s["wait_p95"]),
+                    _fmt_seconds(s["run_p50"]), _fmt_seconds(s["run_p95"])))
+            for offset, hist in enumerate(("wait", "run")):
+                previous = 0
+                for row, (_, total) in enumerate(s[hist]):
+                    self.table.setItem(row, 2 * col + offset, QTableWidgetItem(str(total - previous)))
+                    previous = total
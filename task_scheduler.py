@@ -0,0 +1,160 @@
+"""
+Resource-aware, fair scheduling in front of a TaskEngine's QThreadPool.
+
+Without a scheduler every task goes straight into the QThreadPool queue: one FIFO (per priority) for everything,
+so a burst of long tests delays a quick interactive job, and "only one task may use the instrument" can only be
+approximated with locks that block (or skip) a pool thread. With one, the engine keeps the tasks itself and hands
+one to the pool only when a thread is free AND all of the task's resources have a free slot:
+
+    engine = TaskEngine(scheduler=TaskScheduler(resources={"instrument-A": 1, "disk": 4},
+                                                weights={"interactive": 4, "long": 1},
+                                                class_limits={"long": 2}))
+    engine.start(Worker(measure, resources=("instrument-A",), task_class="long"))
+    engine.start(Worker(preview, task_class="interactive"), priority=10)
+
+- resources: named counting semaphores; a task holds every resource it lists from start to end. A task whose
+  resource is busy waits in the scheduler (parked on that resource), not on a pool thread
+- task classes: every class has its own queue, ordered by `priority` (higher first, then submission order).
+  Free threads go to the class with the least weighted service so far (stride scheduling), so a class with weight
+  4 gets four starts for every one of a weight-1 class while both have work, and an idle class doesn't bank credit
+- class_limits: at most that many threads for a class, which keeps threads free for the other classes
+
+Tasks on a process backend bypass the scheduler.
+"""
+import collections
+import heapq
+import itertools
+import logging
+import threading
+
+log = logging.getLogger(__name__)
+
+DEFAULT_CLASS = "default"
+
+
+class TaskScheduler:
+    """
+    :param resources: resource name -> number of tasks that may hold it at once; unknown names count as 1
+    :param weights: task class -> share of the threads while several classes have work, > 0; default 1
+    :param class_limits: task class -> maximum threads used by that class
+    """
+    def __init__(self, resources: dict = None, weights: dict = None, class_limits: dict = None):
+        self.limits = dict(resources or {})
+        self.weights = dict(weights or {})
+        for cls, weight in self.weights.items():
+            if not weight > 0:  # a stride of 1 / weight must be positive and finite
+                raise ValueError("TaskScheduler: weight of task class {!r} must be > 0, not {!r}".format(cls, weight))
+        self.class_limits = dict(class_limits or {})
+        self.engine = None
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        self._queues = collections.defaultdict(list)  # task class -> heap of (-priority, seq, worker)
+        self._pass = collections.defaultdict(float)  # task class -> weighted starts so far
+        self._parked = collections.defaultdict(collections.deque)  # resource -> workers waiting for it
+        self._held = collections.Counter()  # resource -> tasks holding it
+        self._class_running = collections.Counter()  # task class -> running tasks
+        self._running = {}  # task_id -> worker, dispatched to the pool and not done yet
+        self._waiting = 0  # queued + parked (cancelled ones included until they are skipped)
+
+    def attach(self, engine):
+        self.engine = engine
+
+    # -- called by TaskEngine --
+
+    def submit(self, worker, priority: int = 0):
+        with self._lock:
+            cls = worker.task_class
+            queue = self._queues[cls]
+            if not queue and not self._class_running[cls]:  # (re)activated class: no credit for the idle time
+                self._pass[cls] = max(self._pass[cls], self._min_pass())
+            heapq.heappush(queue, (-priority, next(self._seq), worker))
+            worker.sched_priority = priority
+            self._waiting += 1
+            ready = self._pick()
+        self._start(ready)
+
+    def task_done(self, handle):
+        """ A task of the engine is done (or was dropped); free its thread and resources. """
+        with self._lock:
+            worker = self._running.pop(handle.task_id, None)
+            if worker is None:
+                return
+            self._class_running[worker.task_class] -= 1
+            for resource in worker.resources:
+                self._held[resource] -= 1
+                parked = self._parked.get(resource)
+                while parked:  # give the waiting tasks another chance, in their original order
+                    waiting = parked.popleft()
+                    heapq.heappush(self._queues[waiting.task_class], (-waiting.sched_priority, next(self._seq),
+                                                                      waiting))
+            ready = self._pick()
+        self._start(ready)
+
+    def pump(self):
+        """ Start whatever fits now (e.g. after the engine's thread count was raised). """
+        with self._lock:
+            ready = self._pick()
+        self._start(ready)
+
+    # -- internals, lock held --
+
+    def _min_pass(self) -> float:
+        active = [self._pass[c] for c, q in self._queues.items() if q or self._class_running[c]]
+        return min(active) if active else 0.0
+
+    def _free(self, resource: str) -> bool:
+        return self._held[resource] < self.limits.get(resource, 1)
+
+    def _pick(self) -> list:
+        """ Dispatch decisions: workers to hand to the pool, resources already taken. """
+        ready = []
+        capacity = self.engine.max_threads - len(self._running)
+        while capacity > 0:
+            best = None
+            for cls, queue in self._queues.items():
+                limit = self.class_limits.get(cls)
+                if not queue or (limit is not None and self._class_running[cls] >= limit):
+                    continue
+                if best is None or self._pass[cls] < self._pass[best]:
+                    best = cls
+            if best is None:
+                break
+            worker = self._pop_runnable(best)
+            if worker is None:
+                continue  # everything in that class is cancelled or parked now; look again
+            self._running[worker.handle.task_id] = worker
+            self._class_running[best] += 1
+            self._pass[best] += 1.0 / self.weights.get(best, 1)
+            for resource in worker.resources:
+                self._held[resource] += 1
+            ready.append(worker)
+            capacity -= 1
+        return ready
+
+    def _pop_runnable(self, cls: str):
+        queue = self._queues[cls]
+        while queue:
+            worker = heapq.heappop(queue)[2]
+            if worker.handle.done():  # cancelled while it waited
+                self._waiting -= 1
+                continue
+            busy = next((r for r in worker.resources if not self._free(r)), None)
+            if busy is not None:
+                self._parked[busy].append(worker)  # back in the queue when `busy` is released
+                continue
+            self._waiting -= 1
+            return worker
+        return None
+
+    def _start(self, ready: list):
+        for worker in ready:
+            self.engine.threadpool.start(worker, worker.sched_priority)
+
+    # -- inspection --
+
+    def stats(self) -> str:
+        with self._lock:
+            classes = ", ".join("{} {}".format(cls, n) for cls, n in sorted(self._class_running.items()) if n)
+            held = ", ".join("{} {}/{}".format(r, n, self.limits.get(r, 1)) for r, n in sorted(self._held.items())
+                             if n)
+            return "running: {}; resources: {}; waiting {}".format(classes or "-", held or "-", self._waiting)
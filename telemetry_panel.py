@@ -0,0 +1,190 @@
+"""
+Live telemetry plots: fixed-size NumPy ring buffers + min/max downsampling + a bounded redraw rate.
+
+Each series keeps its last `capacity` samples in two preallocated float64 arrays (time, value), so memory never
+grows however long the window stays open. Producers only `append()`; a QTimer redraws the DIRTY series at most
+`max_fps` times per second, and before handing data to pyqtgraph every series is reduced to ~2 points per pixel
+column (the min and the max of each bin), which keeps spikes visible while plotting millions of samples.
+
+pyqtgraph is slow to import (a few hundred ms), so it is only imported, and the plot only built, the first time
+a panel is shown; samples appended before that are kept and drawn then.
+"""
+import threading
+import time
+import numpy as np
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QWidget, QVBoxLayout
+
+
+class RingBuffer:
+    """
+    Fixed-capacity (x, y) sample buffer. Thread-safe appends; `segments()` returns the data in time order as
+    at most two contiguous views (no copy of the whole buffer), `downsampled()` a consistent reduced copy.
+    """
+    def __init__(self, capacity: int = 1_000_000):
+        self.capacity = capacity
+        self.x = np.empty(capacity, dtype=np.float64)
+        self.y = np.empty(capacity, dtype=np.float64)
+        self._head = 0  # next write position
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._size
+
+    def append(self, x: float, y: float):
+        with self._lock:
+            self.x[self._head] = x
+            self.y[self._head] = y
+            self._head = (self._head + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+    def extend(self, xs, ys):
+        xs = np.asarray(xs, dtype=np.float64)[-self.capacity:]
+        ys = np.asarray(ys, dtype=np.float64)[-self.capacity:]
+        with self._lock:
+            n = len(xs)
+            first = min(n, self.capacity - self._head)
+            self.x[self._head:self._head + first] = xs[:first]
+            self.y[self._head:self._head + first] = ys[:first]
+            self.x[:n - first] = xs[first:]
+            self.y[:n - first] = ys[first:]
+            self._head = (self._head + n) % self.capacity
+            self._size = min(self._size + n, self.capacity)
+
+    def segments(self) -> list:
+        """
+        :return: [(x_view, y_view), ...] oldest first; views into the buffer, so concurrent appends overwrite them:
+                 copy them if you keep them, and use `downsampled()` while other threads append
+        """
+        with self._lock:
+            return self._segments()
+
+    def _segments(self) -> list:
+        if self._size < self.capacity:
+            return [(self.x[:self._size], self.y[:self._size])]
+        h = self._head
+        return [(self.x[h:], self.y[h:]), (self.x[:h], self.y[:h])]
+
+    def downsampled(self, n_bins: int) -> tuple:
+        """
+        :return: (x, y) copies in time order, reduced with `downsample_minmax()` to about 2 * n_bins points. Taken
+                 under the lock, so a concurrent append can't tear it (the lock is held for the reduction only,
+                 not for a copy of the whole buffer)
+        """
+        with self._lock:
+            segments = self._segments()
+            total = sum(len(sx) for sx, _ in segments) or 1
+            xs, ys = [], []
+            for sx, sy in segments:
+                dx, dy = downsample_minmax(sx, sy, max(1, n_bins * len(sx) // total))
+                xs.append(dx)
+                ys.append(dy)
+        return np.concatenate(xs), np.concatenate(ys)
+
+
+def downsample_minmax(x: np.ndarray, y: np.ndarray, n_bins: int) -> tuple:
+    """
+    Reduce (x, y) to at most 2 * n_bins points: for every bin the min and the max sample, in time order.
+    Returns copies; input shorter than 2 * n_bins is returned unchanged (copied).
+    """
+    n = len(x)
+    if n <= 2 * n_bins or n_bins < 1:
+        return x.copy(), y.copy()
+    k = n // n_bins
+    m = k * n_bins
+    yb = y[:m].reshape(n_bins, k)
+    i_min = yb.argmin(axis=1)
+    i_max = yb.argmax(axis=1)
+    first = np.minimum(i_min, i_max)
+    second = np.maximum(i_min, i_max)
+    base = np.arange(n_bins) * k
+    idx = np.empty(2 * n_bins, dtype=np.int64)
+    idx[0::2] = base + first
+    idx[1::2] = base + second
+    if m < n:  # the tail that doesn't fill a whole bin
+        idx = np.concatenate((idx, np.arange(m, n)))
+    return x[idx], y[idx]
+
+
+class TelemetryPanel(QWidget):
+    """
+    :param capacity: samples kept per series
+    :param max_fps: redraw rate limit
+    """
+    def __init__(self, capacity: int = 1_000_000, max_fps: int = 20, parent=None):
+        super().__init__(parent)
+        self.capacity = capacity
+        self.t0 = time.monotonic()
+        self.plot = None  # pyqtgraph PlotWidget, see ensure_plot()
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+
+        self.series = {}  # name -> RingBuffer
+        self._colors = {}  # name -> color, or None for the default palette
+        self._items = {}  # name -> PlotDataItem, once the plot exists
+        self._dirty = set()
+        self._dirty_lock = threading.Lock()
+        self._timer = QTimer(self)
+        self._timer.setInterval(max(1, int(1000 / max_fps)))
+        self._timer.timeout.connect(self.redraw)
+        self._timer.start()
+
+    def add_series(self, name: str, color=None):
+        if name not in self.series:
+            self.series[name] = RingBuffer(self.capacity)
+            self._colors[name] = color
+            if self.plot is not None:
+                self._add_item(name)
+        return self.series[name]
+
+    def ensure_plot(self):
+        """ Import pyqtgraph and build the plot, if not done yet. Called on the first show. """
+        if self.plot is not None:
+            return
+        import pyqtgraph as pg
+        self.plot = pg.PlotWidget()
+        self.plot.addLegend()
+        self.plot.showGrid(x=True, y=True, alpha=0.3)
+        self.plot.setLabel("bottom", "time", units="s")
+        self.layout().addWidget(self.plot)
+        for name in self.series:
+            self._add_item(name)
+
+    def _add_item(self, name: str):
+        import pyqtgraph as pg  # already imported by ensure_plot(), this is a dict lookup
+        color = self._colors[name]
+        color = color if color is not None else pg.intColor(len(self._items), hues=9)
+        self._items[name] = self.plot.plot([], [], name=name, pen=pg.mkPen(color, width=1))
+
+    def append(self, name: str, value: float, t: float = None):
+        """ Record one sample; safe from any thread once the series exists. `t` defaults to now. """
+        buf = self.series[name] if name in self.series else self.add_series(name)
+        buf.append(time.monotonic() - self.t0 if t is None else t, value)
+        with self._dirty_lock:
+            self._dirty.add(name)
+
+    def extend(self, name: str, ts, values):
+        buf = self.series[name] if name in self.series else self.add_series(name)
+        buf.extend(ts, values)
+        with self._dirty_lock:
+            self._dirty.add(name)
+
+    def redraw(self):
+        """ Timer slot: push the dirty series, downsampled to the plot width, to pyqtgraph. """
+        if self.plot is None or not self.isVisible():
+            return  # samples keep accumulating; they are drawn when the panel is shown again
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, set()
+        if not dirty:
+            return
+        width = max(100, int(self.plot.getViewBox().width()))
+        for name in dirty:
+            self._items[name].setData(*self.series[name].downsampled(width))
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.ensure_plot()
+        with self._dirty_lock:
+            self._dirty.update(self.series)
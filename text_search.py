@@ -0,0 +1,165 @@
+"""
+Background find / find-all / replace for the QFileDialog_ex editor.
+
+The task functions run on a Worker, scan line-aligned chunks (so a match never straddles two chunks; like most
+editors, matches don't span lines) and stream the match positions back in batches through `progress_callback`
+as `(matches, done, total)`. They stop at the next chunk when their `cancel_token` is cancelled, which is what
+happens when the query changes.
+
+    search_text(text, pattern)  -> positions in QTextDocument units (UTF-16 code units, like QTextCursor)
+    search_file(path, pattern)  -> byte offsets in the file, for the mmap-backed LargeFileView
+"""
+import mmap
+import re
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtWidgets import QToolBar, QLineEdit, QCheckBox, QLabel
+
+SEARCH_CHUNK = 1 << 20  # characters / bytes per cancellation check
+MATCH_BATCH = 2000  # matches per emitted batch
+_ASTRAL = re.compile("[\U00010000-\U0010FFFF]")  # one Python character, two UTF-16 units in Qt
+
+
+def compile_query(query: str, regex: bool = True, case_sensitive: bool = False, as_bytes: bool = False,
+                  encoding: str = "utf-8"):
+    """ :raise re.error: for an invalid regular expression """
+    pattern = query if regex else re.escape(query)
+    flags = re.MULTILINE | (0 if case_sensitive else re.IGNORECASE)
+    if as_bytes:
+        return re.compile(pattern.encode(encoding), flags)
+    return re.compile(pattern, flags)
+
+
+def _scan(buffer, pattern, find_newline, length, progress_callback, cancel_token, chunk, convert=None):
+    batch, found, pos = [], 0, 0
+    while pos < length:
+        cancel_token.check()
+        end = min(length, pos + chunk)
+        if end < length:
+            nl = find_newline(end)
+            end = length if nl < 0 else nl + 1
+        for m in pattern.finditer(buffer, pos, end):
+            start, stop = m.span()
+            if start == stop:  # an empty match (e.g. "^") is not something to highlight
+                continue
+            batch.append(convert(start, stop) if convert else (start, stop))
+            if len(batch) >= MATCH_BATCH:
+                found += len(batch)
+                progress_callback.emit((batch, end, length))
+                batch = []
+        pos = end
+        if batch:
+            found += len(batch)
+            progress_callback.emit((batch, pos, length))
+            batch = []
+    progress_callback.emit(([], length, length))
+    return found
+
+
+def search_text(text: str, pattern, progress_callback, cancel_token, chunk: int = SEARCH_CHUNK):
+    """
+    Worker task: find all matches of `pattern` in `text` (a `toPlainText()` snapshot).
+
+    :return: number of matches
+    """
+    convert = None
+    if _ASTRAL.search(text):
+        # Positions must be in UTF-16 units to be usable with QTextCursor; matches come in order, so the
+        # running count of astral characters is only extended, never recomputed
+        state = [0, 0]  # [python position counted up to, astral characters before it]
+
+        def convert(start, stop):
+            state[1] += len(_ASTRAL.findall(text, state[0], start))
+            state[0] = start
+            return start + state[1], stop + state[1] + len(_ASTRAL.findall(text, start, stop))
+    return _scan(text, pattern, lambda p: text.find("\n", p), len(text), progress_callback, cancel_token, chunk,
+                 convert)
+
+
+def search_file(path, pattern, progress_callback, cancel_token, chunk: int = SEARCH_CHUNK):
+    """
+    Worker task: find all matches of a bytes `pattern` in the file at `path`, through its own read-only mmap.
+
+    :return: number of matches
+    """
+    with open(path, "rb") as f:
+        if not f.seek(0, 2):
+            progress_callback.emit(([], 0, 0))
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _scan(mm, pattern, lambda p: mm.find(b"\n", p), len(mm), progress_callback, cancel_token, chunk)
+
+
+def match_at(text: str, pattern, start: int, end: int):
+    """
+    :return: the match of `pattern` in `text` (a `toPlainText()` snapshot) that spans exactly the UTF-16 positions
+             `start`..`end` of a QTextCursor selection, or None. The search runs in the whole text, so anchors and
+             lookarounds see the same context as they did in `search_text()`.
+    """
+    pos = start
+    if _ASTRAL.search(text):
+        pos = len(text.encode("utf-16-le")[:2 * start].decode("utf-16-le"))
+    m = pattern.search(text, pos)
+    if m is None or m.start() != pos:
+        return None
+    if start + (m.end() - pos) + len(_ASTRAL.findall(text, pos, m.end())) != end:
+        return None
+    return m
+
+
+def replace_all_text(text: str, pattern, replacement: str, regex: bool = True):
+    """ Worker task: :return: (new text, number of replacements) """
+    if regex:
+        return pattern.subn(replacement, text)
+    return pattern.subn(lambda m: replacement, text)  # literal: no backslash / group processing
+
+
+class FindBar(QToolBar):
+    """
+    Find / replace tool bar. Holds no search logic itself, it only reports what the user asked for.
+
+    Supported signals are:
+
+    queryChanged
+        No data; pattern text or an option changed (debounce before searching)
+    findNext / findPrevious / replaceOne / replaceAll
+        No data
+    """
+    queryChanged = pyqtSignal()
+    findNext = pyqtSignal()
+    findPrevious = pyqtSignal()
+    replaceOne = pyqtSignal()
+    replaceAll = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__("Find", parent)
+        self.pattern_edit = QLineEdit()
+        self.pattern_edit.setPlaceholderText("Find (regex)")
+        self.pattern_edit.textChanged.connect(self.queryChanged)
+        self.pattern_edit.returnPressed.connect(self.findNext)
+        self.addWidget(self.pattern_edit)
+        self.regex_box = QCheckBox("Regex")
+        self.regex_box.setChecked(True)
+        self.regex_box.toggled.connect(self.queryChanged)
+        self.addWidget(self.regex_box)
+        self.case_box = QCheckBox("Case")
+        self.case_box.toggled.connect(self.queryChanged)
+        self.addWidget(self.case_box)
+        self.addAction("Prev", self.findPrevious.emit)
+        self.addAction("Next", self.findNext.emit)
+        self.addSeparator()
+        self.replace_edit = QLineEdit()
+        self.replace_edit.setPlaceholderText("Replace with")
+        self.addWidget(self.replace_edit)
+        self.replace_actions = [self.addAction("Replace", self.replaceOne.emit),
+                                self.addAction("Replace all", self.replaceAll.emit)]
+        self.addSeparator()
+        self.count_label = QLabel()
+        self.addWidget(self.count_label)
+
+    def query(self) -> str:
+        return self.pattern_edit.text()
+
+    def set_read_only(self, read_only: bool):
+        self.replace_edit.setEnabled(not read_only)
+        for action in self.replace_actions:
+            action.setEnabled(not read_only)